@@ -0,0 +1,243 @@
+"""
+Admission Control - bounded concurrency and queueing per route, with load shedding.
+
+Sync handlers otherwise wait in the server's thread pool without limit, so a
+traffic spike turns into unbounded latency for everyone. This ASGI middleware
+runs on the event loop, in front of the thread pool:
+
+- up to `max_concurrency` requests per route run at once
+- up to `max_queue` more wait, each for at most `queue_timeout` seconds
+- anything beyond that is rejected immediately
+
+A rejected /decision/compare or /decision/pareto gets 503 with Retry-After.
+A rejected /decision/reflect first degrades: it is answered without a model call
+from the local wisdom tier, marked provisional. Degraded answers are capped too
+(DECISION_REFLECT_DEGRADE_CONCURRENCY in flight); past that hard cap, or with
+degrading turned off, reflect is shed with 503 like the others.
+
+Limits come from DECISION_<ROUTE>_CONCURRENCY / _QUEUE / _QUEUE_TIMEOUT_MS and
+are per worker process.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+
+from app.content_negotiation import MSGPACK_MEDIA_TYPE, MsgPackResponse, _is_msgpack_body, negotiate
+from app.engine.ai_reflector import ABSOLEM_FALLBACK_WISDOM
+from app.engine.local_wisdom import generate_local_wisdom
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+ADMISSION_ENABLED = os.getenv("DECISION_ADMISSION_ENABLED", "true").lower() == "true"
+RETRY_AFTER_SECONDS = int(os.getenv("DECISION_RETRY_AFTER_SECONDS", "1"))
+REFLECT_DEGRADE_ENABLED = os.getenv("DECISION_REFLECT_DEGRADE", "true").lower() == "true"
+REFLECT_DEGRADE_CONCURRENCY = int(os.getenv("DECISION_REFLECT_DEGRADE_CONCURRENCY", "32"))  # hard cap
+
+
+def _limits(route: str, concurrency: int, queue: int, queue_timeout_ms: int):
+    return (
+        int(os.getenv(f"DECISION_{route}_CONCURRENCY", str(concurrency))),
+        int(os.getenv(f"DECISION_{route}_QUEUE", str(queue))),
+        int(os.getenv(f"DECISION_{route}_QUEUE_TIMEOUT_MS", str(queue_timeout_ms))) / 1000,
+    )
+
+
+class AdmissionGate:
+    """
+    Concurrency limit with a bounded FIFO wait queue and a queue-time deadline.
+
+    A finishing request hands its slot directly to the oldest waiter, so
+    waiters are admitted in arrival order and nobody can cut in line.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float,
+                 degrade=None, max_degraded: int = 0):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.degrade = degrade  # async (scope, receive) -> Response served instead of shedding, or None
+        self.max_degraded = max_degraded  # degraded answers in flight before rejects are shed anyway
+        self.degraded_active = 0
+        self.active = 0
+        self._waiters: "deque[asyncio.Future]" = deque()
+        self._lock = threading.Lock()  # counters are shared by every event loop in the process
+        self.stats = {"admitted": 0, "queued": 0, "timed_out": 0, "degraded": 0, "shed": 0}
+
+    async def acquire(self) -> bool:
+        """True once a slot is held (caller must release()); False when the request is rejected."""
+        with self._lock:
+            if self.active < self.max_concurrency and not self._waiters:
+                self.active += 1
+                self.stats["admitted"] += 1
+                return True
+            if len(self._waiters) >= self.max_queue:
+                return False
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self.stats["queued"] += 1
+
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.CancelledError:  # client went away while queued
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            raise
+        except asyncio.TimeoutError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # otherwise a slot is already on its way; _hand_over gives it back
+                self.stats["timed_out"] += 1
+            return False
+        with self._lock:
+            self.stats["admitted"] += 1
+        return True
+
+    def release(self):
+        with self._lock:
+            self.active -= 1
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+                except RuntimeError:  # its event loop has been closed
+                    continue
+                self.active += 1  # the slot now belongs to the waiter
+                break
+
+    def _hand_over(self, waiter: asyncio.Future):
+        if waiter.done():  # timed out or cancelled before it could take the slot
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    async def reject(self, scope, receive, send):
+        """Answer a request that was not admitted: degraded while under the hard cap, else 503."""
+        with self._lock:
+            degrade = self.degrade is not None and self.degraded_active < self.max_degraded
+            if degrade:
+                self.degraded_active += 1
+                self.stats["degraded"] += 1
+            else:
+                self.stats["shed"] += 1
+        if not degrade:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": f"Server is at capacity for {self.name}. Retry shortly."},
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            response = await self.degrade(scope, receive)
+            await response(scope, receive, send)
+        finally:
+            with self._lock:
+                self.degraded_active -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "active": self.active,
+                "waiting": len(self._waiters),
+                "degraded_active": self.degraded_active,
+                "max_degraded": self.max_degraded,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "queue_timeout_ms": round(self.queue_timeout * 1000),
+            }
+
+
+async def _read_body(receive) -> bytes:
+    body, more_body = b"", True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":  # client went away
+            break
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return body
+
+
+def _local_reflection(content_type: Optional[str], body: bytes) -> Dict[str, Any]:
+    """Local wisdom for the posted comparison result (static fallback if the body is unusable)."""
+    try:
+        if _is_msgpack_body(content_type):
+            payload = msgpack.unpackb(body, raw=False)
+        else:
+            payload = json.loads(body)
+        wisdom = generate_local_wisdom(payload.get("comparison_result") or {})
+    except Exception:
+        wisdom = ABSOLEM_FALLBACK_WISDOM
+    return {
+        "action_plan": wisdom["action_plan"],
+        "philosophical_advice": wisdom["philosophical_advice"],
+        "source": wisdom["source"],
+        "provisional": True,
+    }
+
+
+async def _degraded_reflection(scope, receive) -> Response:
+    """Provisional local wisdom in place of a model call, in the representation the client accepts."""
+    headers = dict(scope["headers"])
+    body = await _read_body(receive)
+    content = await run_in_threadpool(
+        _local_reflection, headers.get(b"content-type", b"").decode("latin-1"), body
+    )
+    response_headers = {"X-Admission": "degraded", "Vary": "Accept"}
+    if negotiate(headers.get(b"accept", b"").decode("latin-1")) == MSGPACK_MEDIA_TYPE:
+        return MsgPackResponse(content, headers=response_headers)
+    return JSONResponse(content, headers=response_headers)
+
+
+gates: Dict[str, AdmissionGate] = {
+    "/decision/compare": AdmissionGate("/decision/compare", *_limits("COMPARE", 32, 64, 250)),
+    "/decision/pareto": AdmissionGate("/decision/pareto", *_limits("PARETO", 4, 8, 2000)),
+    "/decision/reflect": AdmissionGate(
+        "/decision/reflect",
+        *_limits("REFLECT", 16, 32, 1000),
+        degrade=_degraded_reflection if REFLECT_DEGRADE_ENABLED else None,
+        max_degraded=REFLECT_DEGRADE_CONCURRENCY,
+    ),
+}
+
+
+class AdmissionControl:
+    """ASGI middleware applying `gates` to POST requests on their paths."""
+
+    def __init__(self, app, enabled: bool = ADMISSION_ENABLED):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        gate: Optional[AdmissionGate] = None
+        if self.enabled and scope["type"] == "http" and scope["method"] == "POST":
+            gate = gates.get(scope["path"])
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await gate.acquire():
+            await gate.reject(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release()
+
+
+def get_admission_stats() -> Dict[str, Any]:
+    return {path: gate.snapshot() for path, gate in gates.items()}
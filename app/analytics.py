@@ -0,0 +1,172 @@
+"""
+Live Analytics - rolling distributions over /decision/compare traffic.
+
+Each window (1 min, 1 h, 24 h) is a ring of time slots; every slot keeps one
+DDSketch per metric plus zone/risk counters. Recording an evaluation touches
+the current slot of each window only (O(1)); a query merges the slots of a
+window. Memory is fixed: scores live in [0, 100], so a sketch at 1% relative
+accuracy never holds more than a few hundred bins, and no raw values are kept.
+"""
+
+import math
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Optional
+
+SKETCH_RELATIVE_ACCURACY = 0.01
+PERCENTILES = (50, 90, 99)
+
+METRICS = (
+    "composite_score",
+    "growth_score",
+    "sustainability_score",
+    "tension_index",
+    "sensitivity_range",
+)
+
+# window name -> (span in seconds, number of slots)
+WINDOWS = {
+    "1m": (60, 60),
+    "1h": (3600, 60),
+    "24h": (86400, 96),
+}
+
+
+class DDSketch:
+    """
+    Log-bucketed quantile sketch: every quantile is within
+    relative_accuracy of the true value. Values below MIN_VALUE count as zero.
+    """
+
+    MIN_VALUE = 1e-2  # scores have two decimals
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value < self.MIN_VALUE:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def merge(self, other: "DDSketch"):
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return round(2 * self.gamma ** key / (self.gamma + 1), 2)
+        return round(2 * self.gamma ** max(self.bins) / (self.gamma + 1), 2)
+
+
+class _Slot:
+    """Aggregates for one time slot of a window."""
+
+    __slots__ = ("slot_id", "decisions", "sketches", "zones", "risk_levels")
+
+    def __init__(self, slot_id: int):
+        self.slot_id = slot_id
+        self.decisions = 0
+        self.sketches = {metric: DDSketch() for metric in METRICS}
+        self.zones: Counter = Counter()
+        self.risk_levels: Counter = Counter()
+
+
+class SlidingWindow:
+    """Ring of slots covering the last span_seconds."""
+
+    def __init__(self, span_seconds: float, slot_count: int):
+        self.slot_seconds = span_seconds / slot_count
+        self.slots: list = [None] * slot_count
+
+    def current(self, now: float) -> _Slot:
+        slot_id = int(now // self.slot_seconds)
+        index = slot_id % len(self.slots)
+        slot = self.slots[index]
+        if slot is None or slot.slot_id != slot_id:
+            slot = self.slots[index] = _Slot(slot_id)
+        return slot
+
+    def live_slots(self, now: float) -> Iterable[_Slot]:
+        oldest = int(now // self.slot_seconds) - len(self.slots)
+        return [slot for slot in self.slots if slot is not None and slot.slot_id > oldest]
+
+
+class LiveAnalytics:
+    """Thread-safe rolling distributions for compare traffic."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.windows = {name: SlidingWindow(*spec) for name, spec in WINDOWS.items()}
+
+    def record(self, response: Any):
+        """Add a CompareResponse's evaluations to every window."""
+        now = self._clock()
+        with self._lock:
+            slots = [window.current(now) for window in self.windows.values()]
+            for slot in slots:
+                slot.decisions += 1
+            for evaluation in response.evaluations:
+                values = [getattr(evaluation, metric) for metric in METRICS]
+                for slot in slots:
+                    for metric, value in zip(METRICS, values):
+                        slot.sketches[metric].add(value)
+                    slot.zones[evaluation.zone] += 1
+                    slot.risk_levels[evaluation.risk_level] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = self._clock()
+        result = {}
+        with self._lock:
+            for name, window in self.windows.items():
+                decisions = 0
+                sketches = {metric: DDSketch() for metric in METRICS}
+                zones: Counter = Counter()
+                risk_levels: Counter = Counter()
+                for slot in window.live_slots(now):
+                    decisions += slot.decisions
+                    for metric in METRICS:
+                        sketches[metric].merge(slot.sketches[metric])
+                    zones.update(slot.zones)
+                    risk_levels.update(slot.risk_levels)
+                result[name] = {
+                    "decisions": decisions,
+                    "evaluations": sketches[METRICS[0]].count,
+                    "percentiles": {
+                        metric: {f"p{p}": sketch.quantile(p / 100) for p in PERCENTILES}
+                        for metric, sketch in sketches.items()
+                    },
+                    "zones": dict(zones),
+                    "risk_levels": dict(risk_levels),
+                }
+        return {"relative_accuracy": SKETCH_RELATIVE_ACCURACY, "windows": result}
+
+
+_live_analytics: Optional[LiveAnalytics] = None
+
+
+def get_live_analytics() -> LiveAnalytics:
+    """Get or create the process-wide analytics aggregator."""
+    global _live_analytics
+    if _live_analytics is None:
+        _live_analytics = LiveAnalytics()
+    return _live_analytics
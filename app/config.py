@@ -0,0 +1,296 @@
+"""
+Decision Rules - thresholds for zones, tension, risk, triggers and close competition.
+
+The rules live in one JSON file (DECISION_RULES_PATH, default app/rules.json) and
+are compiled at load time into flat decision tables: every numeric feature is cut
+into elementary intervals at the thresholds the rules mention (below, at, and
+between thresholds), every categorical input into its labels, and each table
+stores the precomputed outcome for every combination. A lookup is one bisect per
+feature and one tuple index - no rule is interpreted per request.
+
+The file is re-checked every DECISION_RULES_RELOAD_SECONDS; a changed file is
+compiled off to the side and swapped in with a single assignment, so workers
+pick up new rules without a restart. A file that fails to compile is logged and
+the previous rules stay active.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+RULES_PATH = Path(os.getenv("DECISION_RULES_PATH", str(Path(__file__).parent / "rules.json")))
+RULES_RELOAD_SECONDS = float(os.getenv("DECISION_RULES_RELOAD_SECONDS", "2"))  # 0 disables reloading
+
+# Numeric features rules may test, derived from (growth, sustainability, tension)
+NUMERIC_FEATURES = {
+    "growth": lambda g, s, t: g,
+    "sustainability": lambda g, s, t: s,
+    "tension": lambda g, s, t: t,
+    "lead": lambda g, s, t: g - s,  # > 0 growth-dominant, < 0 sustainability-dominant
+    "growth_ratio": lambda g, s, t: g / max(s, 1),
+    "sustainability_ratio": lambda g, s, t: s / max(g, 1),
+}
+
+COMPARISONS = {
+    ">=": lambda a, b: a >= b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    "<": lambda a, b: a < b,
+    "==": lambda a, b: a == b,
+}
+
+
+class RulesError(ValueError):
+    """The rules file is malformed."""
+
+
+# ----------------------------
+# Conditions
+# ----------------------------
+def _numeric_tests(spec) -> List[Tuple[str, float]]:
+    """[">=", 70] or [[">=", 40], ["<", 50]] -> [(op, value), ...]"""
+    tests = [spec] if isinstance(spec[0], str) else spec
+    for op, value in tests:
+        if op not in COMPARISONS:
+            raise RulesError(f"Unknown comparison '{op}'")
+    return [(op, float(value)) for op, value in tests]
+
+
+def _categorical_test(spec):
+    """"AVOID", ["HIGH", "CRITICAL"] or {"not": "STEADY_EXECUTION"} -> predicate on a label."""
+    if isinstance(spec, dict):
+        excluded = spec["not"]
+        excluded = {excluded} if isinstance(excluded, str) else set(excluded)
+        return lambda label: label not in excluded
+    allowed = {spec} if isinstance(spec, str) else set(spec)
+    return lambda label: label in allowed
+
+
+def _matches(when: Dict[str, Any], point: Dict[str, Any]) -> bool:
+    for feature, spec in when.items():
+        if feature in NUMERIC_FEATURES:
+            if not all(COMPARISONS[op](point[feature], value) for op, value in _numeric_tests(spec)):
+                return False
+        elif not _categorical_test(spec)(point[feature]):
+            return False
+    return True
+
+
+# ----------------------------
+# Compiled tables
+# ----------------------------
+class _NumericAxis:
+    """Elementary intervals of one feature: (-inf, t1), {t1}, (t1, t2), ..., {tk}, (tk, inf)."""
+
+    def __init__(self, name: str, thresholds: Sequence[float]):
+        self.name = name
+        self.extract = NUMERIC_FEATURES[name]
+        self.thresholds = sorted(set(thresholds))
+        t = self.thresholds
+        self.representatives = [t[0] - 1] if t else [0.0]
+        for i, value in enumerate(t):
+            self.representatives.append(value)
+            self.representatives.append((value + t[i + 1]) / 2 if i + 1 < len(t) else value + 1)
+
+    def index(self, value: float) -> int:
+        i = bisect_left(self.thresholds, value)
+        return 2 * i + (i < len(self.thresholds) and self.thresholds[i] == value)
+
+
+class _CategoricalAxis:
+    def __init__(self, name: str, labels: Sequence[str]):
+        self.name = name
+        self.representatives = list(labels)
+        self._index = {label: i for i, label in enumerate(labels)}
+
+    def index(self, label: str) -> int:
+        return self._index[label]
+
+
+class DecisionTable:
+    """Outcome for every combination of axis cells, flattened in mixed radix."""
+
+    def __init__(self, axes: list, outcome):
+        self.axes = axes
+        self.strides = []
+        stride = 1
+        for axis in reversed(axes):
+            self.strides.insert(0, stride)
+            stride *= len(axis.representatives)
+        self.cells = tuple(
+            outcome(dict(zip((a.name for a in axes), point)))
+            for point in itertools.product(*(a.representatives for a in axes))
+        )
+
+    def lookup(self, growth=0.0, sustainability=0.0, tension=0.0, **labels):
+        index = 0
+        for axis, stride in zip(self.axes, self.strides):
+            if isinstance(axis, _NumericAxis):
+                index += axis.index(axis.extract(growth, sustainability, tension)) * stride
+            else:
+                index += axis.index(labels[axis.name]) * stride
+        return self.cells[index]
+
+
+def _axes(rules: List[Dict], categorical: Dict[str, Sequence[str]]) -> list:
+    thresholds: Dict[str, List[float]] = {}
+    used_labels = []
+    for rule in rules:
+        for feature, spec in rule.get("when", {}).items():
+            if feature in NUMERIC_FEATURES:
+                thresholds.setdefault(feature, []).extend(v for _, v in _numeric_tests(spec))
+            elif feature in categorical:
+                if feature not in used_labels:
+                    used_labels.append(feature)
+            else:
+                raise RulesError(f"Unknown rule feature '{feature}'")
+    return (
+        [_NumericAxis(name, values) for name, values in thresholds.items()]
+        + [_CategoricalAxis(name, categorical[name]) for name in used_labels]
+    )
+
+
+def _first_match(rules: List[Dict], table_name: str, fields: Sequence[str]):
+    if not rules or rules[-1].get("when"):
+        raise RulesError(f"'{table_name}' must end with a default rule (empty 'when')")
+
+    def outcome(point):
+        rule = next(r for r in rules if _matches(r.get("when", {}), point))
+        return rule[fields[0]] if len(fields) == 1 else tuple(rule[f] for f in fields)
+    return outcome
+
+
+def _all_matches(triggers: List[Dict]):
+    ids = [t["id"] for t in triggers]
+    for trigger in triggers:
+        for earlier in trigger.get("unless", []):
+            if earlier not in ids[:ids.index(trigger["id"])]:
+                raise RulesError(f"Trigger '{trigger['id']}' can only be suppressed by earlier triggers")
+
+    def outcome(point):
+        fired, messages = set(), []
+        for trigger in triggers:
+            if fired.intersection(trigger.get("unless", [])):
+                continue
+            if _matches(trigger.get("when", {}), point):
+                fired.add(trigger["id"])
+                messages.append(trigger["message"])
+        return tuple(messages)
+    return outcome
+
+
+class CompiledRules(NamedTuple):
+    version: str
+    digest: str  # hash of the rules document, changes with any edit even if version does not
+    zones: DecisionTable
+    tension_severity: DecisionTable
+    risks: DecisionTable
+    triggers: DecisionTable
+    close_competition_margin: float
+    viability_threshold: float
+
+    def classify_zone(self, growth, sustainability) -> Tuple[str, str]:
+        return self.zones.lookup(growth, sustainability)
+
+    def classify_tension(self, tension) -> str:
+        return self.tension_severity.lookup(tension=tension)
+
+    def classify_risk(self, zone, tension_severity, growth, sustainability) -> str:
+        return self.risks.lookup(growth, sustainability, zone=zone, tension_severity=tension_severity)
+
+    def generate_triggers(self, growth, sustainability, tension, tension_severity, zone) -> List[str]:
+        return list(self.triggers.lookup(growth, sustainability, tension, zone=zone, tension_severity=tension_severity))
+
+    @property
+    def cell_count(self) -> int:
+        return sum(len(t.cells) for t in (self.zones, self.tension_severity, self.risks, self.triggers))
+
+
+def compile_rules(config: Dict[str, Any]) -> CompiledRules:
+    """Validate a rules document and compile it into decision tables."""
+    try:
+        zone_labels = list(dict.fromkeys(r["label"] for r in config["zones"]))
+        severity_labels = list(dict.fromkeys(r["label"] for r in config["tension_severity"]))
+        labels = {"zone": zone_labels, "tension_severity": severity_labels}
+        return CompiledRules(
+            version=str(config.get("version", "unversioned")),
+            digest=hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16],
+            zones=DecisionTable(
+                _axes(config["zones"], {}), _first_match(config["zones"], "zones", ("label", "reason"))
+            ),
+            tension_severity=DecisionTable(
+                _axes(config["tension_severity"], {}),
+                _first_match(config["tension_severity"], "tension_severity", ("label",)),
+            ),
+            risks=DecisionTable(
+                _axes(config["risks"], labels), _first_match(config["risks"], "risks", ("label",))
+            ),
+            triggers=DecisionTable(_axes(config["triggers"], labels), _all_matches(config["triggers"])),
+            close_competition_margin=float(config["close_competition_margin"]),
+            viability_threshold=float(config["viability_threshold"]),
+        )
+    except RulesError:
+        raise
+    except (KeyError, TypeError, ValueError, IndexError, StopIteration) as e:
+        raise RulesError(f"Invalid rules: {e!r}") from e
+
+
+def load_rules(path: Path = RULES_PATH) -> CompiledRules:
+    with open(path, "r", encoding="utf-8") as f:
+        return compile_rules(json.load(f))
+
+
+# ----------------------------
+# Active rules (hot reload)
+# ----------------------------
+_active_rules: Optional[CompiledRules] = None
+_rules_mtime: Optional[float] = None
+_next_check = 0.0
+_reload_lock = threading.Lock()
+
+
+def _file_mtime() -> Optional[float]:
+    try:
+        return RULES_PATH.stat().st_mtime
+    except OSError:
+        return None
+
+
+def reload_rules() -> CompiledRules:
+    """Compile the rules file and swap it in; keep the current rules if it is invalid."""
+    global _active_rules, _rules_mtime
+    with _reload_lock:
+        mtime = _file_mtime()
+        try:
+            rules = load_rules(RULES_PATH)
+        except (OSError, ValueError) as e:
+            if _active_rules is None:
+                raise
+            logger.error(f"❌ Rules reload failed, keeping '{_active_rules.version}': {e}")
+            _rules_mtime = mtime
+            return _active_rules
+        _active_rules, _rules_mtime = rules, mtime  # atomic swap
+        logger.info(f"📐 Decision rules '{rules.version}' compiled ({rules.cell_count} table cells)")
+        return rules
+
+
+def get_rules() -> CompiledRules:
+    """Active compiled rules; re-checks the file at most every RULES_RELOAD_SECONDS."""
+    global _next_check
+    rules = _active_rules
+    if rules is None:
+        return reload_rules()
+    if RULES_RELOAD_SECONDS > 0 and time.monotonic() >= _next_check:
+        _next_check = time.monotonic() + RULES_RELOAD_SECONDS
+        if _file_mtime() != _rules_mtime:
+            return reload_rules()
+    return rules
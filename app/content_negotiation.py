@@ -0,0 +1,131 @@
+"""
+Content Negotiation - MessagePack alongside JSON for the decision API.
+
+Clients that send `Content-Type: application/msgpack` have the body decoded with
+MessagePack and handed to FastAPI as the equivalent JSON body, so it is validated
+against exactly the same schemas. Clients that send `Accept: application/msgpack`
+get the response model serialized straight to MessagePack (no JSON encoding on
+the way). Everything else is unchanged JSON.
+
+MessagePack is optional (`pip install msgpack`). Without it, msgpack request
+bodies are refused with 415 and msgpack-only Accept headers fall back to JSON.
+Error responses (422 validation details, 4xx/5xx HTTPExceptions) are always JSON.
+"""
+
+import json
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+
+
+def _media_ranges(accept: str):
+    """'a/b;q=0.5, c/d' -> [('a/b', 0.5), ('c/d', 1.0)]"""
+    for part in accept.split(","):
+        media_type, *params = part.strip().split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        yield media_type.strip().lower(), q
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Response media type for an Accept header: msgpack only when asked for it at least as strongly as JSON."""
+    if not MSGPACK_AVAILABLE or not accept:
+        return JSON_MEDIA_TYPE
+    msgpack_q = json_q = 0.0
+    for media_type, q in _media_ranges(accept):
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type == JSON_MEDIA_TYPE:
+            json_q = max(json_q, q)
+    return MSGPACK_MEDIA_TYPE if msgpack_q > 0 and msgpack_q >= json_q else JSON_MEDIA_TYPE
+
+
+def _is_msgpack_body(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def _msgpack_invalid(error: Exception) -> RequestValidationError:
+    return RequestValidationError([{
+        "type": "msgpack_invalid",
+        "loc": ("body",),
+        "msg": "MessagePack decode error",
+        "input": {},
+        "ctx": {"error": str(error)},
+    }])
+
+
+async def _as_json_request(request: Request) -> Request:
+    """The same request with its MessagePack body re-encoded as the JSON body FastAPI parses."""
+    if not MSGPACK_AVAILABLE:
+        raise HTTPException(
+            status_code=415,
+            detail="MessagePack is not available on this server (pip install msgpack). Send JSON instead."
+        )
+    body = await request.body()
+    try:
+        json_body = json.dumps(msgpack.unpackb(body, raw=False), separators=(",", ":")).encode() if body else b""
+    except (ValueError, TypeError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as e:
+        raise _msgpack_invalid(e)  # TypeError: binary or extension values have no JSON form
+
+    headers = [(k, v) for k, v in request.scope["headers"] if k not in (b"content-type", b"content-length")]
+    headers.append((b"content-type", JSON_MEDIA_TYPE.encode("latin-1")))
+    headers.append((b"content-length", str(len(json_body)).encode("latin-1")))
+    replayed = False
+
+    async def receive():
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": json_body, "more_body": False}
+        return await request.receive()  # e.g. http.disconnect
+
+    return Request({**request.scope, "headers": headers}, receive)
+
+
+class NegotiatedRoute(APIRoute):
+    """APIRoute that reads and writes MessagePack when the client asks for it."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        json_handler = super().get_route_handler()
+        response_class, self.response_class = self.response_class, MsgPackResponse
+        try:
+            msgpack_handler = super().get_route_handler()
+        finally:
+            self.response_class = response_class
+
+        async def handler(request: Request) -> Response:
+            if _is_msgpack_body(request.headers.get("content-type")):
+                request = await _as_json_request(request)
+            if negotiate(request.headers.get("accept")) == MSGPACK_MEDIA_TYPE:
+                response = await msgpack_handler(request)
+            else:
+                response = await json_handler(request)
+            response.headers.append("Vary", "Accept")
+            return response
+
+        return handler
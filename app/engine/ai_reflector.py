@@ -7,20 +7,37 @@ from dotenv import load_dotenv
 load_dotenv()  # Load .env file immediately on module import
 
 import os
+import re
 import json
-import hashlib
+import heapq
 import logging
+import threading
 import time
-from typing import Optional, Dict, Any
+import zlib
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, Iterator
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl  # POSIX: lets uvicorn workers share the per-minute bucket
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt  # Windows equivalent
+except ImportError:
+    msvcrt = None
+
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
 
+from app.engine.local_wisdom import _get_field, generate_local_wisdom
+
 logger = logging.getLogger(__name__)
 
 # Default Absolem wisdom - used as fallback
@@ -39,6 +56,68 @@ ABSOLEM_FALLBACK_WISDOM = {
 CACHE_DIR = Path(__file__).parent.parent.parent / ".ai_cache"
 CACHE_EXPIRY_HOURS = 24
 
+# Failed generations are remembered briefly so identical requests fall back at once (0 disables)
+NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv("ABSOLEM_NEGATIVE_CACHE_TTL", "60"))
+
+# Expired entries are still served for this long while one background refresh runs
+STALE_WHILE_REVALIDATE = os.getenv("ABSOLEM_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+STALE_MAX_HOURS = float(os.getenv("ABSOLEM_STALE_MAX_HOURS", "24"))
+
+# Bump whenever the key material or prompt changes so stale entries stop matching
+CACHE_KEY_VERSION = 2
+
+# Approximate cache (opt-in): reuse wisdom for near-identical decisions
+# Requests match when title, zone and risk are equal and both scores lie within the tolerance
+APPROXIMATE_CACHE_ENABLED = os.getenv("ABSOLEM_APPROXIMATE_CACHE", "false").lower() == "true"
+APPROXIMATE_CACHE_TOLERANCE = float(os.getenv("ABSOLEM_APPROXIMATE_TOLERANCE", "1.0"))  # score points
+
+# Background pre-warming (opt-in): compute reflections for clear winners before the user asks
+PREWARM_ENABLED = os.getenv("ABSOLEM_PREWARM", "false").lower() == "true"
+PREWARM_QUEUE_SIZE = 32
+PREWARM_RESERVED_CALLS = 5  # Never spend the last daily calls speculatively
+PREWARM_RESERVED_TOKENS = 1  # Per-minute tokens always left for user requests (needs ABSOLEM_RPM_BURST >= 2)
+
+# Model backend: "gemini" (default) or "stub" for the local fake server used in load tests
+MODEL_BACKEND = os.getenv("ABSOLEM_MODEL_BACKEND", "gemini").lower()
+STUB_MODEL_URL = os.getenv("ABSOLEM_STUB_URL", "http://localhost:8001")
+
+# Per-minute limiter (token bucket shared by threads and worker processes)
+# Gemini Free Tier allows 15 requests/minute; calls wait briefly for a token or fall back.
+# Applies to every backend, including the stub, so load tests see production pacing.
+RPM_LIMIT = float(os.getenv("ABSOLEM_RPM_LIMIT", "15"))
+RPM_BURST = float(os.getenv("ABSOLEM_RPM_BURST", "1"))                 # 1 = strict 1 request per 4s
+RPM_MAX_WAIT_SECONDS = float(os.getenv("ABSOLEM_RPM_MAX_WAIT", "5"))  # longer predicted waits fall back
+RPM_BUCKET_PATH = Path(__file__).parent.parent.parent / ".ai_cache" / "minute_bucket.json"
+
+# Circuit breaker around model calls: after repeated failures (or any 429) all callers
+# get fallback wisdom immediately until a single probe request succeeds
+CIRCUIT_BREAKER_ENABLED = os.getenv("ABSOLEM_CIRCUIT_BREAKER", "true").lower() == "true"
+CIRCUIT_FAILURE_THRESHOLD = 3       # consecutive non-quota failures before opening
+CIRCUIT_COOLDOWN_SECONDS = 4        # first open period (Gemini free tier: 1 request / 4s)
+CIRCUIT_MAX_COOLDOWN_SECONDS = 60   # cap for repeated opens and learned retry-after
+CIRCUIT_PROBE_TIMEOUT_SECONDS = 30  # a stuck half-open probe is abandoned after this
+CIRCUIT_STATE_PATH = Path(__file__).parent.parent.parent / ".ai_cache" / "circuit_breaker.json"
+
+# Micro-batching (opt-in): fold reflection requests arriving within the window into one call
+BATCH_WINDOW_MS = float(os.getenv("ABSOLEM_BATCH_WINDOW_MS", "0"))  # 0 disables batching
+BATCH_MAX_ITEMS = int(os.getenv("ABSOLEM_BATCH_MAX_ITEMS", "4"))
+BATCH_RESULT_TIMEOUT_SECONDS = 120
+
+# Latency budget for /decision/reflect: past it the caller gets provisional fallback wisdom
+# while the model call finishes in the background and fills the cache.
+# Default stays under the frontend's 15s request timeout.
+REFLECT_BUDGET_SECONDS = float(os.getenv("ABSOLEM_REFLECT_BUDGET_SECONDS", "12"))
+REFLECT_WORKERS = int(os.getenv("ABSOLEM_REFLECT_WORKERS", "8"))  # concurrent model calls in flight
+
+# Local template wisdom (opt-in): personalized advice built from the compare result replaces
+# the static fallback; with LOCAL_FIRST it is returned at once (provisional) while the model
+# call fills the cache in the background
+LOCAL_WISDOM_ENABLED = os.getenv("ABSOLEM_LOCAL_WISDOM", "false").lower() == "true"
+LOCAL_FIRST = os.getenv("ABSOLEM_LOCAL_FIRST", "false").lower() == "true"
+
+# Evaluation fields that shape the prompt (and therefore the cache key)
+PROMPT_FIELDS = ("growth_score", "sustainability_score", "zone", "risk_level")
+
 # Daily Rate Limiting Configuration
 # Gemini Free Tier: 15 requests/min, but we recommend lower for smooth operation
 MAX_CALLS_PER_DAY = 100  # Increased to support more API calls while staying well below Gemini's 1500/day limit
@@ -98,29 +177,442 @@ def _check_daily_limit() -> tuple[bool, str]:
         return True, f"API calls available: {remaining}/{MAX_CALLS_PER_DAY}"
 
 
-def _call_gemini_with_retry(model, prompt: str, max_retries: int = 4) -> Optional[str]:
+class ModelBackend(ABC):
+    """
+    Text-generation backend used by the reflector.
+    
+    Implementations raise on failure; quota errors must mention "429" so the
+    retry logic recognises them.
+    """
+    name = "base"
+    metered = True  # Whether calls count against MAX_CALLS_PER_DAY
+    
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """Return the full completion for a prompt."""
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield completion text chunks (defaults to one chunk)."""
+        yield self.generate(prompt)
+
+
+class GeminiBackend(ModelBackend):
+    """Google Gemini via google-generativeai."""
+    name = "gemini"
+    
+    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash"):
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+    
+    def _generation_config(self):
+        return genai.types.GenerationConfig(
+            max_output_tokens=1500,
+            temperature=0.7,
+        )
+    
+    def generate(self, prompt: str) -> str:
+        response = self.model.generate_content(prompt, generation_config=self._generation_config())
+        return response.text.strip()
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        response = self.model.generate_content(
+            prompt, generation_config=self._generation_config(), stream=True
+        )
+        for chunk in response:
+            text = getattr(chunk, "text", "")
+            if text:
+                yield text
+
+
+class StubBackend(ModelBackend):
+    """
+    Local fake model server (loadtest/fake_gemini.py) for load testing without
+    spending Gemini quota. Not metered against the daily cap.
+    """
+    name = "stub"
+    metered = False
+    
+    def __init__(self, url: str, timeout: float = 30):
+        import requests  # Only needed when the stub backend is selected
+        self._requests = requests
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+    
+    def _post(self, path: str, prompt: str, stream: bool = False):
+        response = self._requests.post(
+            f"{self.url}{path}", json={"prompt": prompt}, timeout=self.timeout, stream=stream
+        )
+        if response.status_code == 429:
+            raise RuntimeError("429 quota exceeded (stub model server)")
+        response.raise_for_status()
+        return response
+    
+    def generate(self, prompt: str) -> str:
+        return self._post("/generate", prompt).json()["text"].strip()
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        with self._post("/stream", prompt, stream=True) as response:
+            for text in response.iter_content(chunk_size=None, decode_unicode=True):
+                if text:
+                    yield text
+
+
+class ModelCallRefused(Exception):
+    """The circuit breaker or per-minute limiter declined to make a model call."""
+
+
+def _is_quota_error(error: Exception) -> bool:
+    """Whether an exception is a quota/rate limit (429) error."""
+    error_str = str(error).lower()
+    return "429" in error_str or "quota" in error_str or "rate limit" in error_str
+
+
+def _parse_retry_after(error: Exception) -> Optional[float]:
+    """
+    Extract the server-suggested retry delay (seconds) from a 429 error message.
+    Gemini reports it as 'retry_delay { seconds: 37 }' or 'Please retry in 36.5s'.
+    """
+    match = re.search(r"retry(?:_delay|[ -]after| in)?\W*(?:seconds:\s*)?(\d+(?:\.\d+)?)", str(error), re.IGNORECASE)
+    return float(match.group(1)) if match else None
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive cross-process lock on a sidecar .lock file (no-op where unsupported)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker shared by every reflection request.
+    
+    - CLOSED: calls flow; consecutive failures are counted
+    - OPEN: calls are refused until the deadline (cooldown or learned retry-after)
+    - HALF_OPEN: one probe call is let through; success closes, failure re-opens
+      with a doubled cooldown
+    
+    Any quota (429) failure opens the circuit at once since quota is global.
+    
+    With a `state_path`, opens and closes are published to a small JSON file so
+    every uvicorn worker on the host honours the same open deadline. Failure
+    counts and the half-open probe stay per worker, so a recovering outage costs
+    at most one probe per worker.
+    """
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+    
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN_SECONDS,
+        max_cooldown: float = CIRCUIT_MAX_COOLDOWN_SECONDS,
+        probe_timeout: float = CIRCUIT_PROBE_TIMEOUT_SECONDS,
+        state_path: Optional[Path] = None,
+        clock=time.time
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout
+        self.state_path = state_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self._failures = 0
+        self._consecutive_opens = 0
+        self._open_until = 0.0
+        self._probe_started: Optional[float] = None
+        self._generation = 0  # Last shared state written or adopted
+        self.stats = {"opened": 0, "short_circuited": 0, "probes": 0}
+    
+    def _read_shared(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def _load_shared(self):
+        """Adopt a newer open/closed state published by another worker (caller holds _lock)."""
+        if self.state_path is None:
+            return
+        data = self._read_shared()
+        if not data or data.get("generation", 0) <= self._generation:
+            return
+        self._generation = data["generation"]
+        self.state = data["state"]
+        self._open_until = data["open_until"]
+        self._consecutive_opens = data["consecutive_opens"]
+        self._failures = 0
+        self._probe_started = None
+    
+    def _save_shared(self):
+        """Publish the current open/closed state to the other workers (caller holds _lock)."""
+        if self.state_path is None:
+            return
+        try:
+            with _file_lock(self.state_path):
+                data = self._read_shared() or {}
+                self._generation = data.get("generation", 0) + 1
+                with open(self.state_path, 'w') as f:
+                    json.dump({
+                        "generation": self._generation,
+                        "state": self.state,
+                        "open_until": self._open_until,
+                        "consecutive_opens": self._consecutive_opens
+                    }, f)
+        except Exception as e:
+            logger.warning(f"Circuit breaker state write failed: {e}")
+    
+    def allow_request(self) -> bool:
+        """Whether a model call may proceed now. Refusals are counted as short-circuits."""
+        with self._lock:
+            self._load_shared()
+            now = self._clock()
+            if self.state == self.OPEN and now >= self._open_until:
+                self.state = self.HALF_OPEN
+                self._probe_started = None
+            
+            if self.state == self.CLOSED:
+                return True
+            
+            if self.state == self.HALF_OPEN:
+                probe_stuck = self._probe_started is not None and now - self._probe_started > self.probe_timeout
+                if self._probe_started is None or probe_stuck:
+                    self._probe_started = now
+                    self.stats["probes"] += 1
+                    return True
+            
+            self.stats["short_circuited"] += 1
+            return False
+    
+    def release(self):
+        """Give back a half-open probe slot that was granted but not used."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_started = None
+    
+    def record_success(self):
+        with self._lock:
+            recovered = self.state != self.CLOSED or self._consecutive_opens > 0
+            self.state = self.CLOSED
+            self._failures = 0
+            self._consecutive_opens = 0
+            self._probe_started = None
+            if recovered:
+                self._save_shared()
+    
+    def record_failure(self, quota: bool = False, retry_after: Optional[float] = None):
+        """Record a failed call; quota errors and failed probes open the circuit immediately."""
+        with self._lock:
+            self._failures += 1
+            if quota or self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(retry_after)
+    
+    def _open(self, retry_after: Optional[float]):
+        delay = self.cooldown * (2 ** self._consecutive_opens)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        delay = min(delay, self.max_cooldown)
+        
+        self.state = self.OPEN
+        self._open_until = max(self._open_until, self._clock() + delay)
+        self._consecutive_opens += 1
+        self._probe_started = None
+        self.stats["opened"] += 1
+        self._save_shared()
+        logger.warning(f"🔌 Reflection circuit OPEN for {delay:.0f}s - serving fallback wisdom")
+    
+    def retry_after(self) -> float:
+        """Seconds until the circuit will let a probe through (0 when closed)."""
+        with self._lock:
+            self._load_shared()
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self._open_until - self._clock())
+    
+    def snapshot(self) -> Dict[str, Any]:
+        retry_after = self.retry_after()
+        with self._lock:
+            return {"state": self.state, "retry_after_seconds": round(retry_after, 1), **self.stats}
+
+
+class TokenBucketLimiter:
+    """
+    Proactive per-minute limiter for model calls.
+    
+    Tokens refill at `rate_per_minute`; the bucket holds at most `burst`. A caller
+    that finds the bucket empty reserves the next token (the balance goes negative)
+    and sleeps until it is due, so concurrent callers are scheduled one slot apart.
+    If the predicted wait exceeds `max_wait`, nothing is reserved and the caller
+    should fall back at once.
+    
+    State lives in a small JSON file under a file lock, so every uvicorn worker on
+    the host draws from the same bucket.
+    """
+    
+    def __init__(
+        self,
+        rate_per_minute: float = RPM_LIMIT,
+        burst: float = RPM_BURST,
+        max_wait: float = RPM_MAX_WAIT_SECONDS,
+        state_path: Path = RPM_BUCKET_PATH,
+        clock=time.time,
+        sleep=None
+    ):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.max_wait = max_wait
+        self.state_path = state_path
+        self._clock = clock
+        self._sleep = sleep or (lambda seconds: time.sleep(seconds))
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self.stats = {
+            "acquired": 0, "queued": 0, "rejected": 0, "total_wait_seconds": 0.0, "max_wait_seconds": 0.0,
+            "spare_acquired": 0, "spare_declined": 0
+        }
+    
+    def _read_state(self, now: float) -> tuple[float, float]:
+        try:
+            with open(self.state_path, 'r') as f:
+                data = json.load(f)
+            return float(data["tokens"]), float(data["updated"])
+        except Exception:
+            return self.burst, now
+    
+    def _write_state(self, tokens: float, now: float):
+        with open(self.state_path, 'w') as f:
+            json.dump({"tokens": tokens, "updated": now}, f)
+    
+    def _reserve(self, max_wait: float, keep: float = 0.0) -> Optional[float]:
+        """
+        Take a token, returning how long to wait for it (None if that exceeds max_wait).
+        `keep` tokens must remain in the bucket after this one is taken.
+        """
+        with self._lock, _file_lock(self.state_path):
+            now = self._clock()
+            tokens, updated = self._read_state(now)
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+            needed = 1 + keep
+            wait = 0.0 if tokens >= needed else (needed - tokens) / self.rate
+            if wait > max_wait:
+                self._write_state(tokens, now)
+                return None
+            self._write_state(tokens - 1, now)
+            return wait
+    
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Block until a call slot is available.
+        Returns False immediately (without waiting) if the predicted wait is too long.
+        """
+        try:
+            wait = self._reserve(self.max_wait if max_wait is None else max_wait)
+        except Exception as e:
+            logger.warning(f"Rate limiter state error: {e}. Allowing call.")
+            return True
+        
+        if wait is None:
+            self.stats["rejected"] += 1
+            logger.info("⏱️  Per-minute limit: predicted wait too long, using fallback wisdom")
+            return False
+        
+        self.stats["acquired"] += 1
+        if wait > 0:
+            self.stats["queued"] += 1
+            self.stats["total_wait_seconds"] += wait
+            self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], wait)
+            with self._lock:
+                self._waiting += 1
+            try:
+                self._sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+        return True
+    
+    def acquire_spare(self, keep: float = PREWARM_RESERVED_TOKENS) -> bool:
+        """
+        Take a token only if one is free right now with `keep` tokens to spare.
+        Never waits; used for speculative calls that must not delay user requests.
+        """
+        try:
+            taken = self._reserve(0.0, keep=keep) is not None
+        except Exception as e:
+            logger.warning(f"Rate limiter state error: {e}. Skipping speculative call.")
+            return False
+        self.stats["spare_acquired" if taken else "spare_declined"] += 1
+        return taken
+    
+    def snapshot(self) -> Dict[str, Any]:
+        queued = self.stats["queued"]
+        return {
+            "rate_per_minute": round(self.rate * 60, 2),
+            "queue_depth": self._waiting,
+            "avg_wait_seconds": round(self.stats["total_wait_seconds"] / queued, 3) if queued else 0.0,
+            **{k: round(v, 3) if isinstance(v, float) else v for k, v in self.stats.items()}
+        }
+
+
+def _call_gemini_with_retry(
+    model,
+    prompt: str,
+    max_retries: int = 4,
+    breaker: Optional[CircuitBreaker] = None,
+    limiter: Optional[TokenBucketLimiter] = None
+) -> Optional[str]:
     """
     Call Gemini API with exponential backoff for quota (429) errors.
     Gemini free tier: 15 requests/minute (1 request per 4 seconds minimum).
     
-    Returns the response text or None if failed after retries.
+    With a circuit breaker, quota errors open the shared circuit instead of
+    sleeping through a per-request retry ladder, so the call returns at once.
+    With a limiter, every attempt first takes a per-minute token.
+    
+    Returns the response text or None if the model failed after retries.
+    Raises ModelCallRefused when the breaker or limiter declined the call, so
+    callers can tell a local refusal from a model error.
     """
     for attempt in range(max_retries + 1):
+        if breaker is not None and not breaker.allow_request():
+            logger.info("🔌 Reflection circuit open - skipping model call")
+            raise ModelCallRefused("circuit open")
+        
+        if limiter is not None and not limiter.acquire():
+            if breaker is not None:
+                breaker.release()
+            raise ModelCallRefused("per-minute limit")
+        
         try:
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=1500,
-                    temperature=0.7,
-                )
-            )
-            return response.text.strip()
+            text = model.generate(prompt)
+            if breaker is not None:
+                breaker.record_success()
+            return text
         
         except Exception as e:
-            error_str = str(e).lower()
-            
             # Check for quota/rate limit errors (429)
-            if "429" in error_str or "quota" in error_str or "rate limit" in error_str:
+            if _is_quota_error(e):
+                if breaker is not None:
+                    breaker.record_failure(quota=True, retry_after=_parse_retry_after(e))
+                    logger.warning("🛑 Quota limit hit - circuit opened, using fallback wisdom.")
+                    return None
+                
                 # Exponential backoff: 4s, 4s, 9s, 27s (respects 15 req/min limit)
                 wait_time = max(4, min(3 ** attempt, 60))
                 
@@ -134,28 +626,260 @@ def _call_gemini_with_retry(model, prompt: str, max_retries: int = 4) -> Optiona
             
             # Other errors (auth, server, etc.) - don't retry
             logger.warning(f"❌ Gemini API error (attempt {attempt+1}): {e}")
+            if breaker is not None:
+                breaker.record_failure()
             return None
     
     return None
 
+def _stream_gemini(model, prompt: str) -> Iterator[str]:
+    """
+    Stream Gemini response text chunk by chunk.
+    No retry ladder here: a streaming client is waiting on the first byte, so any
+    error (including 429) propagates and the caller falls back immediately.
+    """
+    yield from model.stream(prompt)
+
+
+class _ReflectionStreamParser:
+    """Incrementally splits a streamed WISDOM/STEPS reply into section events."""
+    
+    def __init__(self):
+        self.buffer = ""
+        self.wisdom_sent = False
+        self.steps_sent = 0
+    
+    def feed(self, text: str) -> list:
+        """Add a chunk and return (event, data) pairs for every section completed by it."""
+        self.buffer += text
+        events = []
+        
+        steps_at = self.buffer.find("STEPS:")
+        if steps_at == -1:
+            return events
+        
+        # WISDOM is complete as soon as the STEPS header arrives
+        if not self.wisdom_sent:
+            wisdom_at = self.buffer.find("WISDOM:")
+            start = wisdom_at + len("WISDOM:") if -1 < wisdom_at < steps_at else 0
+            events.append(("wisdom", {"philosophical_advice": self.buffer[start:steps_at].strip()}))
+            self.wisdom_sent = True
+        
+        # A step is complete once its line is newline-terminated
+        body = self.buffer[steps_at + len("STEPS:"):]
+        complete = body[:body.rfind("\n") + 1]
+        lines = [line.strip() for line in complete.split('\n') if line.strip()]
+        steps = [line for line in lines if line[0].isdigit()]
+        for step in steps[self.steps_sent:]:
+            events.append(("step", {"index": self.steps_sent, "text": step}))
+            self.steps_sent += 1
+        return events
+
+
+class _BatchItem:
+    """One pending reflection request inside a micro-batch."""
+    
+    def __init__(self, options: list, best_option: str, analysis_data: dict, cache_key: str, key_material: str):
+        self.options = options
+        self.best_option = best_option
+        self.analysis_data = analysis_data
+        self.cache_key = cache_key
+        self.key_material = key_material
+        self.result: Optional[Dict[str, Any]] = None
+        self.refused = False  # Batch call declined by the breaker or limiter
+        self.done = threading.Event()
+
+
+class ReflectionBatcher:
+    """
+    Folds reflection requests that arrive within a short window into one model call.
+    
+    The first request of a window becomes the leader: it waits up to `window_ms`
+    (or until `max_items` requests have joined), sends one structured prompt and
+    hands every request its own parsed WISDOM/STEPS block, caching each one.
+    Identical decisions in the same window share one slot. Requests left over
+    when a batch fills elect the next leader among themselves.
+    """
+    
+    def __init__(self, reflector: "AbsolemReflector", window_ms: float = BATCH_WINDOW_MS, max_items: int = BATCH_MAX_ITEMS):
+        self.reflector = reflector
+        self.window = window_ms / 1000
+        self.max_items = max_items
+        self._cond = threading.Condition()
+        self._pending: list = []
+        self._leader_active = False
+        self.stats = {"batches": 0, "batched_requests": 0, "max_batch_size": 0}
+    
+    def submit(self, item: _BatchItem) -> Optional[Dict[str, Any]]:
+        """
+        Queue a request and block until its batch completes.
+        Returns None on model failure; raises ModelCallRefused if the call was declined.
+        """
+        with self._cond:
+            shared = next((p for p in self._pending if p.cache_key == item.cache_key), None)
+            if shared is not None:
+                item = shared
+            else:
+                self._pending.append(item)
+                self._cond.notify_all()
+        
+        while True:
+            with self._cond:
+                if not any(p is item for p in self._pending):
+                    break  # Taken into a batch (possibly our own)
+                if self._leader_active:
+                    self._cond.wait()
+                    continue
+                self._leader_active = True
+                batch = self._collect()
+            self._run(batch)
+        
+        item.done.wait(BATCH_RESULT_TIMEOUT_SECONDS)
+        if item.refused:
+            raise ModelCallRefused("batch call declined")
+        return item.result
+    
+    def _collect(self) -> list:
+        """Wait out the window (caller holds the condition) and take the next batch."""
+        deadline = time.monotonic() + self.window
+        while len(self._pending) < self.max_items:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._cond.wait(remaining)
+        batch = self._pending[:self.max_items]
+        self._pending = self._pending[self.max_items:]
+        self._leader_active = False
+        self._cond.notify_all()
+        return batch
+    
+    def _run(self, batch: list):
+        """Make one model call for the batch and distribute the results."""
+        reflector = self.reflector
+        try:
+            if len(batch) == 1:
+                only = batch[0]
+                prompt = reflector._create_prompt(only.options, only.best_option, only.analysis_data)
+            else:
+                prompt = reflector._create_batch_prompt(batch)
+            
+            full_response = _call_gemini_with_retry(
+                reflector.model, prompt, max_retries=2, breaker=reflector.breaker, limiter=reflector.limiter
+            )
+            if full_response is None:
+                return
+            reflector._record_call()
+            
+            if len(batch) == 1:
+                results = [reflector._parse_response(full_response, batch[0].best_option)]
+            else:
+                results = reflector._parse_batch_response(full_response, batch)
+            
+            for item, result in zip(batch, results):
+                item.result = result
+                if result is not None:
+                    reflector._save_to_cache(item.cache_key, result, item.key_material)
+                    reflector._index_approximate(item.cache_key, item.best_option, item.analysis_data)
+            
+            self.stats["batches"] += 1
+            self.stats["batched_requests"] += len(batch)
+            self.stats["max_batch_size"] = max(self.stats["max_batch_size"], len(batch))
+            logger.info(f"✨ Batched Absolem wisdom for {len(batch)} decision(s) in one call")
+        except ModelCallRefused:
+            for item in batch:
+                item.refused = True
+        except Exception as e:
+            logger.warning(f"❌ Batched Gemini call failed: {e}")
+        finally:
+            for item in batch:
+                item.done.set()
 
 
 class AbsolemReflector:
     """AI Reflective advisory layer with Absolem character theme."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        approximate_cache: Optional[bool] = None,
+        approximate_tolerance: Optional[float] = None,
+        backend: Optional[ModelBackend] = None,
+        local_wisdom: Optional[bool] = None,
+        local_first: Optional[bool] = None
+    ):
         """
         Initialize the reflector with optional API key.
         Falls back gracefully if API key not provided.
+        
+        Args:
+            api_key: Gemini API key (defaults to GOOGLE_GEMINI_API_KEY)
+            approximate_cache: Serve near-duplicate decisions from cache (defaults to APPROXIMATE_CACHE_ENABLED)
+            approximate_tolerance: Max score distance for a near match (defaults to APPROXIMATE_CACHE_TOLERANCE)
+            backend: Model backend to use instead of the one selected by MODEL_BACKEND
+            local_wisdom: Serve local template wisdom instead of the static fallback (defaults to LOCAL_WISDOM_ENABLED)
+            local_first: Answer budgeted requests with local wisdom at once (defaults to LOCAL_FIRST)
         """
         self.api_key = api_key or os.getenv("GOOGLE_GEMINI_API_KEY")
         self.gemini_available = False
-        self.usage_stats = {"total_calls": 0, "failed_calls": 0, "cached_calls": 0}
+        self.usage_stats = {
+            "total_calls": 0, "failed_calls": 0, "cached_calls": 0, "approximate_hits": 0,
+            "prewarm_enqueued": 0, "prewarm_completed": 0, "prewarm_dropped": 0,
+            "streamed_calls": 0, "negative_hits": 0, "stale_served": 0, "revalidations": 0,
+            "provisional_responses": 0, "local_wisdom_served": 0
+        }
+        
+        self.approximate_cache = APPROXIMATE_CACHE_ENABLED if approximate_cache is None else approximate_cache
+        self.approximate_tolerance = (
+            APPROXIMATE_CACHE_TOLERANCE if approximate_tolerance is None else approximate_tolerance
+        )
+        self.local_first = LOCAL_FIRST if local_first is None else local_first
+        self.local_wisdom = self.local_first or (LOCAL_WISDOM_ENABLED if local_wisdom is None else local_wisdom)
         
-        if self.api_key and GEMINI_AVAILABLE:
+        # (title, zone, risk, growth bucket, sustainability bucket) -> [(growth, sustainability, cache_key)]
+        self._approx_index: Optional[Dict[tuple, list]] = None
+        self._approx_lock = threading.Lock()
+        
+        # Background pre-warming: bounded heap of (priority, seq, cache_key, options, comparison_result)
+        self._prewarm_queue: list = []
+        self._prewarm_pending: set = set()
+        self._prewarm_seq = 0
+        self._prewarm_cond = threading.Condition()
+        self._prewarm_thread: Optional[threading.Thread] = None
+        
+        # Negative cache (cache_key -> monotonic expiry) and keys with a refresh in flight
+        self._negative_cache: Dict[str, float] = {}
+        self._revalidating: set = set()
+        self._negative_lock = threading.Lock()
+        
+        # Deadline-bounded reflections: one in-flight future per cache key
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Any] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Shared circuit breaker so an outage costs one probe, not one retry ladder per request
+        self.breaker: Optional[CircuitBreaker] = (
+            CircuitBreaker(state_path=CIRCUIT_STATE_PATH) if CIRCUIT_BREAKER_ENABLED else None
+        )
+        
+        # Proactive per-minute pacing for every backend (ABSOLEM_RPM_LIMIT=0 disables)
+        self.limiter: Optional[TokenBucketLimiter] = None
+        
+        # Micro-batching of concurrent reflection requests into one model call
+        self.batcher: Optional[ReflectionBatcher] = (
+            ReflectionBatcher(self) if BATCH_WINDOW_MS > 0 and BATCH_MAX_ITEMS > 1 else None
+        )
+        
+        if backend is not None:
+            self.model = backend
+            self.gemini_available = True
+            logger.info(f"✨ Using injected '{backend.name}' model backend")
+        elif MODEL_BACKEND == "stub":
+            self.model = StubBackend(STUB_MODEL_URL)
+            self.gemini_available = True
+            logger.info(f"🧪 Using stub model server at {STUB_MODEL_URL} (load testing)")
+        elif self.api_key and GEMINI_AVAILABLE:
             try:
-                genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel("gemini-2.5-flash")
+                self.model = GeminiBackend(self.api_key)
                 self.gemini_available = True
                 logger.info("✨ Gemini API initialized successfully")
             except Exception as e:
@@ -163,30 +887,121 @@ class AbsolemReflector:
                 self.gemini_available = False
         else:
             logger.info("📖 Using Absolem's Default Wisdom (no API configured)")
+
+        if self.gemini_available and RPM_LIMIT > 0:
+            self.limiter = TokenBucketLimiter(rate_per_minute=RPM_LIMIT, state_path=RPM_BUCKET_PATH)
+
+    def _check_limit(self) -> tuple[bool, str]:
+        """Daily limit check that only applies to metered backends."""
+        if not getattr(self.model, "metered", True):
+            return True, "Unmetered model backend - daily limit not applied"
+        return _check_daily_limit()
     
-    def _get_cache_key(self, options_summary: str) -> str:
-        """Generate cache key from options."""
-        return hashlib.md5(options_summary.encode()).hexdigest()
+    def _record_call(self):
+        """Count a successful model call against the daily limit (metered backends only)."""
+        if getattr(self.model, "metered", True):
+            _increment_daily_call_count()
     
-    def _load_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Load response from cache if available and not expired."""
+    def _get_cache_key(self, key_material: str) -> str:
+        """
+        Generate a versioned cache key from canonical key material.
+        
+        Uses two fast non-cryptographic checksums (CRC32 + Adler-32) for a 64-bit
+        digest. The key material itself is stored alongside the entry and verified
+        on load, so a checksum collision can never produce a false hit.
+        """
+        data = key_material.encode()
+        return f"v{CACHE_KEY_VERSION}-{zlib.crc32(data):08x}{zlib.adler32(data):08x}"
+    
+    def _get_key_material(self, best_option: str, analysis_data: dict) -> str:
+        """
+        Canonical JSON of exactly the decision structure that feeds the prompt.
+        Titles of non-recommended options and criteria weights are deliberately
+        excluded because they never reach Gemini.
+        """
+        return json.dumps({
+            "v": CACHE_KEY_VERSION,
+            "recommended_option": best_option,
+            **{field: analysis_data.get(field) for field in PROMPT_FIELDS}
+        }, sort_keys=True, separators=(",", ":"))
+    
+    def _lookup_cache(self, cache_key: str, key_material: Optional[str] = None) -> tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Look up a cache entry built from the same key material.
+        
+        Returns:
+            (response, is_stale). Expired entries are returned as stale while they are
+            within the stale-while-revalidate window, and deleted once past it.
+        """
         try:
             cache_file = CACHE_DIR / f"{cache_key}.json"
             if cache_file.exists():
                 with open(cache_file, 'r') as f:
                     cached = json.load(f)
-                    timestamp = datetime.fromisoformat(cached.get("timestamp", ""))
-                    if datetime.now() - timestamp < timedelta(hours=CACHE_EXPIRY_HOURS):
-                        self.usage_stats["cached_calls"] += 1
-                        logger.info(f"📚 Cache hit - reusing Absolem's previous wisdom")
-                        return cached["response"]
-                    else:
-                        cache_file.unlink()
+                if key_material is not None and cached.get("key_material") != key_material:
+                    logger.info("Cache key collision detected - ignoring entry")
+                    return None, False
+                age = datetime.now() - datetime.fromisoformat(cached.get("timestamp", ""))
+                if age < timedelta(hours=CACHE_EXPIRY_HOURS):
+                    self.usage_stats["cached_calls"] += 1
+                    logger.info(f"📚 Cache hit - reusing Absolem's previous wisdom")
+                    return cached["response"], False
+                if STALE_WHILE_REVALIDATE and age < timedelta(hours=CACHE_EXPIRY_HOURS + STALE_MAX_HOURS):
+                    return cached["response"], True
+                cache_file.unlink()
         except Exception as e:
             logger.warning(f"Cache read error: {e}")
-        return None
+        return None, False
     
-    def _save_to_cache(self, cache_key: str, response: Dict[str, Any]):
+    def _load_from_cache(self, cache_key: str, key_material: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Load response from cache if available, not expired and built from the same key material."""
+        response, stale = self._lookup_cache(cache_key, key_material)
+        return None if stale else response
+    
+    def _is_negative(self, cache_key: str) -> bool:
+        """Whether this decision failed recently enough to skip the model call."""
+        with self._negative_lock:
+            expires = self._negative_cache.get(cache_key)
+            if expires is None:
+                return False
+            if time.monotonic() >= expires:
+                del self._negative_cache[cache_key]
+                return False
+        self.usage_stats["negative_hits"] += 1
+        logger.info("🚫 Recent failure cached for this decision - using fallback wisdom")
+        return True
+    
+    def _remember_failure(self, cache_key: str):
+        """Record a failed generation so identical requests fall back fast for a short while."""
+        if NEGATIVE_CACHE_TTL_SECONDS <= 0:
+            return
+        with self._negative_lock:
+            now = time.monotonic()
+            # Drop expired entries so the map stays small
+            for key in [k for k, expires in self._negative_cache.items() if expires <= now]:
+                del self._negative_cache[key]
+            self._negative_cache[cache_key] = now + NEGATIVE_CACHE_TTL_SECONDS
+    
+    def _revalidate(self, options: list, best_option: str, analysis_data: dict, cache_key: str, key_material: str):
+        """Refresh a stale entry in the background (at most one refresh per key)."""
+        if not self.gemini_available or self._is_negative(cache_key):
+            return
+        with self._negative_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+        
+        def refresh():
+            try:
+                self._generate(options, best_option, analysis_data, cache_key, key_material)
+            finally:
+                with self._negative_lock:
+                    self._revalidating.discard(cache_key)
+        
+        self.usage_stats["revalidations"] += 1
+        threading.Thread(target=refresh, name="absolem-revalidate", daemon=True).start()
+    
+    def _save_to_cache(self, cache_key: str, response: Dict[str, Any], key_material: Optional[str] = None):
         """Save response to cache."""
         try:
             CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -194,17 +1009,134 @@ class AbsolemReflector:
             with open(cache_file, 'w') as f:
                 json.dump({
                     "timestamp": datetime.now().isoformat(),
+                    "key_material": key_material,
                     "response": response
                 }, f)
         except Exception as e:
             logger.warning(f"Cache write failed: {e}")
     
+    def _approx_bucket(self, best_option: str, analysis_data: dict) -> Optional[tuple]:
+        """Quantize a decision into its approximate-cache bucket (None if scores are missing)."""
+        growth = analysis_data.get("growth_score")
+        sustainability = analysis_data.get("sustainability_score")
+        if growth is None or sustainability is None:
+            return None
+        width = max(self.approximate_tolerance, 0.01)
+        return (
+            best_option,
+            analysis_data.get("zone"),
+            analysis_data.get("risk_level"),
+            int(growth // width),
+            int(sustainability // width)
+        )
+    
+    def _index_approximate(self, cache_key: str, best_option: str, analysis_data: dict):
+        """Register a cached reflection in the approximate index."""
+        bucket = self._approx_bucket(best_option, analysis_data)
+        if bucket is None:
+            return
+        with self._approx_lock:
+            if self._approx_index is None:
+                return  # Will be picked up when the index is first built
+            self._approx_index.setdefault(bucket, []).append(
+                (analysis_data["growth_score"], analysis_data["sustainability_score"], cache_key)
+            )
+    
+    def _build_approximate_index(self):
+        """Build the approximate index from cache files of the current key version."""
+        index: Dict[tuple, list] = {}
+        try:
+            for cache_file in CACHE_DIR.glob(f"v{CACHE_KEY_VERSION}-*.json"):
+                try:
+                    with open(cache_file, 'r') as f:
+                        material = json.loads(json.load(f).get("key_material") or "{}")
+                except Exception:
+                    continue
+                bucket = self._approx_bucket(material.get("recommended_option"), material)
+                if bucket is not None:
+                    index.setdefault(bucket, []).append(
+                        (material["growth_score"], material["sustainability_score"], cache_file.stem)
+                    )
+        except Exception as e:
+            logger.warning(f"Approximate index build failed: {e}")
+        self._approx_index = index
+    
+    def _load_approximate(self, best_option: str, analysis_data: dict) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest cached reflection for a near-identical decision.
+        Checks the request's bucket and its neighbours, then enforces the tolerance exactly.
+        """
+        bucket = self._approx_bucket(best_option, analysis_data)
+        if bucket is None:
+            return None
+        
+        growth = analysis_data["growth_score"]
+        sustainability = analysis_data["sustainability_score"]
+        tolerance = self.approximate_tolerance
+        
+        with self._approx_lock:
+            if self._approx_index is None:
+                self._build_approximate_index()
+            title, zone, risk, g_bucket, s_bucket = bucket
+            candidates = []
+            for dg in (-1, 0, 1):
+                for ds in (-1, 0, 1):
+                    for g, s, key in self._approx_index.get((title, zone, risk, g_bucket + dg, s_bucket + ds), []):
+                        distance = max(abs(g - growth), abs(s - sustainability))
+                        if distance <= tolerance:
+                            candidates.append((distance, key))
+        
+        for _, key in sorted(candidates):
+            cached = self._load_from_cache(key)
+            if cached:
+                self.usage_stats["approximate_hits"] += 1
+                logger.info(f"📚 Approximate cache hit (within {tolerance} points)")
+                return cached
+        return None
+    
+    def _extract_decision(self, comparison_result: Any) -> tuple[str, dict]:
+        """
+        Pull the recommended option and its structural scores out of a compare result.
+        Accepts both the raw dict and a CompareResponse model.
+        
+        Returns:
+            (best_option, analysis_data) where analysis_data has one entry per PROMPT_FIELDS
+        """
+        best_option = _get_field(comparison_result, "recommended_option", "Unknown") or "Unknown"
+        analysis_data = {field: None for field in PROMPT_FIELDS}
+        
+        evaluations = _get_field(comparison_result, "evaluations", []) or []
+        if evaluations:
+            # Find the evaluation that matches the recommended option
+            match = next(
+                (e for e in evaluations if _get_field(e, "title") == best_option),
+                evaluations[0]  # Fallback: use first evaluation if recommended option not found
+            )
+            for field in PROMPT_FIELDS:
+                analysis_data[field] = _get_field(match, field)
+        
+        return best_option, analysis_data
+    
+    def _describe_structure(self, analysis_data: dict) -> str:
+        """One-line structural summary for the prompt (empty when scores are unknown)."""
+        if analysis_data.get("growth_score") is None:
+            return ""
+        return (
+            f"Structural analysis: growth {analysis_data['growth_score']}/100, "
+            f"sustainability {analysis_data.get('sustainability_score')}/100, "
+            f"zone {analysis_data.get('zone')}, risk {analysis_data.get('risk_level')}"
+        )
+    
     def _create_prompt(self, options: list, best_option: str, analysis_data: dict) -> str:
         """Create Absolem-themed prompt for philosophical advice and action steps."""
+        structure = self._describe_structure(analysis_data)
+        if structure:
+            structure = f"\n{structure}\n"
+        
         return f"""You are Absolem, a wise guardian focused on burnout prevention.
 
 A student is considering: '{best_option}'
-
+{structure}
 Please provide two things:
 
 1) 2-3 philosophically rich sentences about this choice. Address: Does this truly prevent burnout? What is the hidden emotional cost? How does this serve their deepest wellbeing?
@@ -221,6 +1153,103 @@ STEPS:
 3. [step three]
 """
     
+    def _create_batch_prompt(self, batch: list) -> str:
+        """Create one prompt asking for a WISDOM/STEPS block per decision in a batch."""
+        decisions = "\n".join(
+            f"DECISION {i}: '{item.best_option}'"
+            + (f" ({self._describe_structure(item.analysis_data)})" if item.analysis_data.get("growth_score") is not None else "")
+            for i, item in enumerate(batch, start=1)
+        )
+        
+        return f"""You are Absolem, a wise guardian focused on burnout prevention.
+
+{len(batch)} students are each considering a different choice:
+
+{decisions}
+
+For EACH decision separately, provide two things:
+
+1) 2-3 philosophically rich sentences about this choice. Address: Does this truly prevent burnout? What is the hidden emotional cost? How does this serve their deepest wellbeing?
+
+2) Exactly 3-4 numbered action steps to implement this choice sustainably (brief, practical steps)
+
+Format your response as one block per decision, in order:
+=== DECISION 1 ===
+WISDOM:
+[your philosophical advice here]
+
+STEPS:
+1. [step one]
+2. [step two]
+3. [step three]
+
+=== DECISION 2 ===
+...
+"""
+    
+    def _parse_batch_response(self, full_response: str, batch: list) -> list:
+        """Split a batched reply into per-decision results (None where a block is missing)."""
+        parts = re.split(r"=+\s*DECISION\s+(\d+)\s*=+", full_response)
+        blocks = {int(number): text for number, text in zip(parts[1::2], parts[2::2])}
+        results = []
+        for i, item in enumerate(batch, start=1):
+            block = blocks.get(i, "")
+            results.append(self._parse_response(block.strip(), item.best_option) if "WISDOM:" in block else None)
+        return results
+    
+    def _parse_response(self, full_response: str, best_option: str) -> Dict[str, Any]:
+        """Parse a Gemini WISDOM/STEPS reply into a reflection result."""
+        default_steps = [
+            f"1. Reflect on whether '{best_option}' truly sustains you",
+            "2. Build safeguards against burnout",
+            "3. Trust your growth within limits"
+        ]
+        advice_text = ""
+        action_plan_text = []
+        
+        try:
+            # Extract WISDOM: section
+            if "WISDOM:" in full_response:
+                start = full_response.find("WISDOM:") + len("WISDOM:")
+                # Find next section or end of string
+                end = full_response.find("STEPS:")
+                if end == -1:
+                    end = len(full_response)
+                advice_text = full_response[start:end].strip()
+            
+            # Extract STEPS: section
+            if "STEPS:" in full_response:
+                start = full_response.find("STEPS:") + len("STEPS:")
+                action_text = full_response[start:].strip()
+                # Split by newlines and filter numbered items (1. 2. 3. etc)
+                lines = [line.strip() for line in action_text.split('\n') if line.strip()]
+                action_plan_text = [line for line in lines if line and line[0].isdigit()]
+        except Exception as parse_err:
+            logger.warning(f"Response parsing error: {parse_err}. Using fallback.")
+            advice_text = ""
+            action_plan_text = []
+        
+        # Fallback if parsing failed
+        return {
+            "action_plan": action_plan_text or default_steps,
+            "philosophical_advice": advice_text or full_response,
+            "source": "Absolem's Wisdom (via Gemini)"
+        }
+    
+    def _decision_key(self, comparison_result: Any) -> tuple[str, dict, str, str]:
+        """
+        Resolve a compare result into (best_option, analysis_data, key_material, cache_key).
+        The cache key covers exactly what reaches the prompt.
+        """
+        try:
+            best_option, analysis_data = self._extract_decision(comparison_result)
+        except Exception as extract_err:
+            logger.warning(f"Decision extraction error: {extract_err}. Using fallback.")
+            best_option, analysis_data = "Unknown", {field: None for field in PROMPT_FIELDS}
+        
+        key_material = self._get_key_material(best_option, analysis_data)
+        return best_option, analysis_data, key_material, self._get_cache_key(key_material)
+    
     def get_reflection(self, options: list, comparison_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get Absolem's wisdom on the decision with full mitigation strategy.
@@ -233,175 +1262,446 @@ STEPS:
             Dictionary with advice, action plan, and comparison insight
         """
         self.usage_stats["total_calls"] += 1
+        return self._personalize(self._reflect(options, comparison_result), comparison_result)
+    
+    def get_reflection_within(
+        self,
+        options: list,
+        comparison_result: Dict[str, Any],
+        budget_seconds: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Get Absolem's wisdom, giving up after `budget_seconds`.
         
-        # Generate cache key based on options
-        try:
-            # Handle both dict and Pydantic models
-            options_for_cache = []
-            for opt in options:
-                if hasattr(opt, 'title') and hasattr(opt, 'growth_criteria'):
-                    # Pydantic model
-                    options_for_cache.append({
-                        "title": opt.title,
-                        "growth": sum(c.weight for c in opt.growth_criteria),
-                        "sustainability": sum(c.weight for c in opt.sustainability_criteria)
-                    })
-                elif isinstance(opt, dict):
-                    # Dictionary
-                    options_for_cache.append({
-                        "title": opt.get("title", "Unknown"),
-                        "growth": opt.get("growth", 0),
-                        "sustainability": opt.get("sustainability", 0)
-                    })
-            
-            options_summary = json.dumps(options_for_cache, sort_keys=True)
-        except Exception as cache_err:
-            logger.warning(f"Cache key generation error: {cache_err}. Using fallback.")
-            options_summary = json.dumps({"error": "cache_key_gen"})
+        Cache hits (fresh, stale or approximate) and known failures are answered
+        synchronously. Only a real model call goes to the worker pool; when the
+        budget runs out the caller gets the fallback wisdom marked
+        "provisional": True, while the call keeps running in the background and
+        populates the cache - so a retry shortly after is a hit. Concurrent
+        requests for the same decision join the same in-flight call.
+        """
+        if budget_seconds is None or budget_seconds <= 0:
+            return self.get_reflection(options, comparison_result)
+        
+        self.usage_stats["total_calls"] += 1
+        best_option, analysis_data, key_material, cache_key = self._decision_key(comparison_result)
         
-        cache_key = self._get_cache_key(options_summary)
+        served = self._serve_without_model(options, best_option, analysis_data, cache_key, key_material)
+        if served is not None:
+            return self._personalize(served, comparison_result)
         
-        # Check cache first
-        cached_response = self._load_from_cache(cache_key)
+        future = self._submit_generation(options, best_option, analysis_data, cache_key, key_material)
+        try:
+            # Local-first answers instantly; the model call still runs and fills the cache
+            result = future.result(timeout=0 if self.local_first else budget_seconds)
+            return self._personalize(result, comparison_result)
+        except FuturesTimeout:
+            self.usage_stats["provisional_responses"] += 1
+            logger.info(f"⏱️  Reflection budget ({budget_seconds}s) exhausted - provisional wisdom, finishing in background")
+            return {**self._fallback(comparison_result), "provisional": True}
+    
+    def _fallback(self, comparison_result: Any) -> Dict[str, Any]:
+        """Local template wisdom for this decision when enabled, else the static fallback."""
+        if not self.local_wisdom:
+            return ABSOLEM_FALLBACK_WISDOM
+        try:
+            wisdom = generate_local_wisdom(comparison_result)
+        except Exception as e:
+            logger.warning(f"Local wisdom failed: {e}. Using static fallback.")
+            return ABSOLEM_FALLBACK_WISDOM
+        self.usage_stats["local_wisdom_served"] += 1
+        return wisdom
+    
+    def _personalize(self, result: Dict[str, Any], comparison_result: Any) -> Dict[str, Any]:
+        """Swap the static fallback for local wisdom (cached and model results pass through)."""
+        return self._fallback(comparison_result) if result is ABSOLEM_FALLBACK_WISDOM else result
+    
+    def _submit_generation(
+        self,
+        options: list,
+        best_option: str,
+        analysis_data: dict,
+        cache_key: str,
+        key_material: str,
+        token_held: bool = False
+    ):
+        """
+        Start a model call on the worker pool, or join the one already in flight for this key.
+        User requests and background pre-warming share this registry, so a decision is
+        never generated twice at once.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=REFLECT_WORKERS, thread_name_prefix="absolem-reflect"
+                )
+            future = self._executor.submit(
+                self._generate, options, best_option, analysis_data, cache_key, key_material, token_held
+            )
+            self._inflight[cache_key] = future
+        
+        # Registered outside the lock: the callback runs inline if the call already finished
+        future.add_done_callback(lambda done, key=cache_key: self._forget_inflight(key, done))
+        return future
+    
+    def _is_inflight(self, cache_key: str) -> bool:
+        with self._inflight_lock:
+            return cache_key in self._inflight
+    
+    def _forget_inflight(self, cache_key: str, future):
+        with self._inflight_lock:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+    
+    def _serve_without_model(
+        self,
+        options: list,
+        best_option: str,
+        analysis_data: dict,
+        cache_key: str,
+        key_material: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer from the cache, the approximate cache or the negative cache.
+        Returns None when a model call is needed.
+        """
+        # Stale entries are served while one refresh runs in the background
+        cached_response, stale = self._lookup_cache(cache_key, key_material)
         if cached_response:
+            if stale:
+                self.usage_stats["stale_served"] += 1
+                logger.info("📚 Serving stale wisdom while refreshing in the background")
+                self._revalidate(options, best_option, analysis_data, cache_key, key_material)
             return cached_response
         
-        # Determine best option
-        # Handle both dict and Pydantic model for comparison_result
-        if hasattr(comparison_result, 'recommended_option'):
-            # Pydantic model
-            best_option = comparison_result.recommended_option
-            analysis_data = {
-                "growth_score": None,
-                "sustainability_score": None
-            }
-        elif isinstance(comparison_result, dict):
-            # Dictionary - extract from CompareResponse structure
-            best_option = comparison_result.get("recommended_option", "Unknown")
+        # Near-duplicate decisions (opt-in) reuse the closest cached wisdom
+        if self.approximate_cache:
+            approximate_response = self._load_approximate(best_option, analysis_data)
+            if approximate_response:
+                return approximate_response
+        
+        # Decisions that just failed skip straight to the fallback
+        if self._is_negative(cache_key):
+            return ABSOLEM_FALLBACK_WISDOM
+        
+        if not self.gemini_available:
+            logger.info("📖 Using default Absolem wisdom (API unavailable)")
+            return ABSOLEM_FALLBACK_WISDOM
+        return None
+    
+    def _reflect(self, options: list, comparison_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache lookup and Gemini call shared by user requests and background pre-warming."""
+        best_option, analysis_data, key_material, cache_key = self._decision_key(comparison_result)
+        
+        served = self._serve_without_model(options, best_option, analysis_data, cache_key, key_material)
+        if served is not None:
+            return served
+        
+        # Try Gemini API (joining a call already in flight for this decision)
+        return self._submit_generation(options, best_option, analysis_data, cache_key, key_material).result()
+    
+    def _generate(
+        self,
+        options: list,
+        best_option: str,
+        analysis_data: dict,
+        cache_key: str,
+        key_material: str,
+        token_held: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Call Gemini for a decision, cache the result and fall back on any failure.
+        With `token_held` the caller already took a per-minute token, so the call
+        skips the limiter and goes out on its own rather than through a batch.
+        """
+        # Check daily rate limit before making API call
+        limit_ok, limit_msg = self._check_limit()
+        logger.info(limit_msg)
+        
+        if not limit_ok:
+            # Daily limit exceeded - use fallback wisdom
+            logger.warning(f"🛑 {limit_msg}")
+            return ABSOLEM_FALLBACK_WISDOM
+        
+        try:
+            # Micro-batching (opt-in): share one model call with concurrent requests
+            if self.batcher is not None and not token_held:
+                result = self.batcher.submit(
+                    _BatchItem(options, best_option, analysis_data, cache_key, key_material)
+                )
+                if result is None:
+                    logger.warning("Batched reflection failed. Using fallback wisdom.")
+                    self.usage_stats["failed_calls"] += 1
+                    self._remember_failure(cache_key)
+                    return ABSOLEM_FALLBACK_WISDOM
+                return result
             
-            # Try to extract scores from evaluations list
-            growth_score = None
-            sust_score = None
-            evaluations = comparison_result.get("evaluations", [])
+            prompt = self._create_prompt(options, best_option, analysis_data)
             
-            if evaluations:
-                # Find the evaluation that matches the recommended option
-                for eval_item in evaluations:
-                    # Handle both dict and object formats
-                    eval_title = eval_item.get("title") if isinstance(eval_item, dict) else getattr(eval_item, "title", None)
-                    if eval_title == best_option:
-                        growth_score = eval_item.get("growth_score") if isinstance(eval_item, dict) else getattr(eval_item, "growth_score", None)
-                        sust_score = eval_item.get("sustainability_score") if isinstance(eval_item, dict) else getattr(eval_item, "sustainability_score", None)
-                        break
-                
-                # Fallback: use first evaluation if recommended option not found
-                if growth_score is None and evaluations:
-                    first_eval = evaluations[0]
-                    growth_score = first_eval.get("growth_score") if isinstance(first_eval, dict) else getattr(first_eval, "growth_score", None)
-                    sust_score = first_eval.get("sustainability_score") if isinstance(first_eval, dict) else getattr(first_eval, "sustainability_score", None)
-            
-            analysis_data = {
-                "growth_score": growth_score,
-                "sustainability_score": sust_score
-            }
-        else:
-            best_option = "Unknown"
-            analysis_data = {"growth_score": None, "sustainability_score": None}
-        
-        # Try Gemini API
-        if self.gemini_available:
-            # Check daily rate limit before making API call
-            limit_ok, limit_msg = _check_daily_limit()
-            logger.info(limit_msg)
+            # Call Gemini with retry logic for quota errors
+            full_response = _call_gemini_with_retry(
+                self.model, prompt, max_retries=2, breaker=self.breaker,
+                limiter=None if token_held else self.limiter
+            )
             
-            if not limit_ok:
-                # Daily limit exceeded - use fallback wisdom
-                logger.warning(f"🛑 {limit_msg}")
+            if full_response is None:
+                # Quota or API error - use fallback
+                logger.warning("Failed to get Gemini response after retries. Using fallback wisdom.")
+                self.usage_stats["failed_calls"] += 1
+                self._remember_failure(cache_key)
                 return ABSOLEM_FALLBACK_WISDOM
             
-            try:
-                prompt = self._create_prompt(options, best_option, analysis_data)
-                
-                # Call Gemini with retry logic for quota errors
-                full_response = _call_gemini_with_retry(self.model, prompt, max_retries=2)
-                
-                if full_response is None:
-                    # Quota or API error - use fallback
-                    logger.warning("Failed to get Gemini response after retries. Using fallback wisdom.")
-                    self.usage_stats["failed_calls"] += 1
-                    return ABSOLEM_FALLBACK_WISDOM
-                
-                # Increment daily call counter only on successful API call
-                _increment_daily_call_count()
-                
-                # Parse Gemini response into reflection and action plan
-                reflection_text = ""
-                action_plan_text = []
-                
-                try:
-                    advice_text = ""
-                    
-                    # Extract WISDOM: section
-                    if "WISDOM:" in full_response:
-                        start = full_response.find("WISDOM:") + len("WISDOM:")
-                        # Find next section or end of string
-                        end = full_response.find("STEPS:")
-                        if end == -1:
-                            end = len(full_response)
-                        advice_text = full_response[start:end].strip()
-                    
-                    # Extract STEPS: section
-                    if "STEPS:" in full_response:
-                        start = full_response.find("STEPS:") + len("STEPS:")
-                        action_text = full_response[start:].strip()
-                        # Split by newlines and filter numbered items (1. 2. 3. etc)
-                        lines = [line.strip() for line in action_text.split('\n') if line.strip()]
-                        action_plan_text = [line for line in lines if line and line[0].isdigit()]
-                    
-                    # Fallback if parsing failed
-                    if not advice_text:
-                        advice_text = full_response
-                    if not action_plan_text:
-                        action_plan_text = [
-                            f"1. Reflect on whether '{best_option}' truly sustains you",
-                            "2. Build safeguards against burnout",
-                            "3. Trust your growth within limits"
-                        ]
-                except Exception as parse_err:
-                    logger.warning(f"Response parsing error: {parse_err}. Using fallback.")
-                    advice_text = full_response
-                    action_plan_text = [
-                        f"1. Reflect on whether '{best_option}' truly sustains you",
-                        "2. Build safeguards against burnout",
-                        "3. Trust your growth within limits"
-                    ]
-                
-                # Build response with philosophical advice and action plan
-                result = {
-                    "action_plan": action_plan_text,
-                    "philosophical_advice": advice_text,
-                    "source": "Absolem's Wisdom (via Gemini)"
-                }
-                
-                # Cache successful response
-                self._save_to_cache(cache_key, result)
-                logger.info("✨ Decision insight + Absolem wisdom generated and cached")
-                return result
-                
-            except Exception as e:
-                logger.warning(f"❌ Gemini API call failed: {e}. Falling back to default wisdom.")
+            # Increment daily call counter only on successful API call
+            self._record_call()
+            
+            # Parse Gemini response into reflection and action plan
+            result = self._parse_response(full_response, best_option)
+            
+            # Cache successful response
+            self._save_to_cache(cache_key, result, key_material)
+            self._index_approximate(cache_key, best_option, analysis_data)
+            logger.info("✨ Decision insight + Absolem wisdom generated and cached")
+            return result
+        
+        except ModelCallRefused as refused:
+            # Local back-pressure, not a verdict on this decision - nothing to remember
+            logger.info(f"Model call declined ({refused}). Using fallback wisdom.")
+            return ABSOLEM_FALLBACK_WISDOM
+            
+        except Exception as e:
+            logger.warning(f"❌ Gemini API call failed: {e}. Falling back to default wisdom.")
+            self.usage_stats["failed_calls"] += 1
+            self._remember_failure(cache_key)
+            return ABSOLEM_FALLBACK_WISDOM
+    
+    def stream_reflection(self, options: list, comparison_result: Dict[str, Any]) -> Iterator[tuple[str, Dict[str, Any]]]:
+        """
+        Stream Absolem's wisdom as (event, data) pairs.
+        
+        Events:
+            token:  raw text as it arrives from Gemini
+            wisdom: the philosophical advice, once its section is complete
+            step:   each numbered action step, as it completes
+            error:  the model failed after text was already sent (followed by done)
+            done:   the final assembled result (authoritative, same shape as get_reflection)
+        
+        Cache hits and fallbacks replay the stored result as wisdom/step/done events.
+        A failure after the first token sends error then done with the fallback,
+        without replaying fallback sections over the partial text.
+        """
+        self.usage_stats["total_calls"] += 1
+        self.usage_stats["streamed_calls"] += 1
+        best_option, analysis_data, key_material, cache_key = self._decision_key(comparison_result)
+        
+        cached_response, stale = self._lookup_cache(cache_key, key_material)
+        if cached_response and stale:
+            self.usage_stats["stale_served"] += 1
+            self._revalidate(options, best_option, analysis_data, cache_key, key_material)
+        if not cached_response and self.approximate_cache:
+            cached_response = self._load_approximate(best_option, analysis_data)
+        if cached_response:
+            yield from self._replay(cached_response)
+            return
+        
+        if not self.gemini_available or self._is_negative(cache_key):
+            yield from self._replay(self._fallback(comparison_result))
+            return
+        
+        # A pre-warm or budgeted request is already generating this decision
+        with self._inflight_lock:
+            pending = self._inflight.get(cache_key)
+        if pending is not None:
+            yield from self._replay(self._personalize(pending.result(), comparison_result))
+            return
+        
+        limit_ok, limit_msg = self._check_limit()
+        logger.info(limit_msg)
+        if not limit_ok:
+            logger.warning(f"🛑 {limit_msg}")
+            yield from self._replay(self._fallback(comparison_result))
+            return
+        
+        if self.breaker is not None and not self.breaker.allow_request():
+            logger.info("🔌 Reflection circuit open - streaming fallback wisdom")
+            yield from self._replay(self._fallback(comparison_result))
+            return
+        
+        if self.limiter is not None and not self.limiter.acquire():
+            if self.breaker is not None:
+                self.breaker.release()
+            yield from self._replay(self._fallback(comparison_result))
+            return
+        
+        parser = _ReflectionStreamParser()
+        chunks = _stream_gemini(self.model, self._create_prompt(options, best_option, analysis_data))
+        error: Optional[Exception] = None
+        received = completed = False
+        try:
+            for text in chunks:
+                received = True
+                yield "token", {"text": text}
+                yield from parser.feed(text)
+            completed = True
+        except Exception as e:
+            error = e
+        finally:
+            # Also runs when the client disconnects (GeneratorExit), so the call is always accounted for
+            if hasattr(chunks, "close"):
+                chunks.close()
+            if error is not None:
                 self.usage_stats["failed_calls"] += 1
-                return ABSOLEM_FALLBACK_WISDOM
+                self._remember_failure(cache_key)
+                if self.breaker is not None:
+                    self.breaker.record_failure(quota=_is_quota_error(error), retry_after=_parse_retry_after(error))
+            elif received:
+                if not completed:
+                    logger.info("Client left mid-stream - model call still counted")
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                self._record_call()
+            elif self.breaker is not None:
+                self.breaker.release()  # Client left before the model answered
+        
+        if error is not None:
+            logger.warning(f"❌ Gemini streaming failed: {error}. Falling back to default wisdom.")
+            if received:
+                # Text already sent cannot be retracted: flag the error and close with the fallback
+                yield "error", {"message": "Absolem's wisdom was interrupted - showing fallback wisdom"}
+                yield "done", self._fallback(comparison_result)
+            else:
+                yield from self._replay(self._fallback(comparison_result))
+            return
+        
+        result = self._parse_response(parser.buffer.strip(), best_option)
         
-        # Fallback to default wisdom
-        logger.info("📖 Using default Absolem wisdom (API unavailable)")
-        return ABSOLEM_FALLBACK_WISDOM
+        # Flush sections the incremental parser could not close (e.g. last step without newline)
+        if not parser.wisdom_sent:
+            yield "wisdom", {"philosophical_advice": result["philosophical_advice"]}
+        for index, step in enumerate(result["action_plan"][parser.steps_sent:], start=parser.steps_sent):
+            yield "step", {"index": index, "text": step}
+        
+        self._save_to_cache(cache_key, result, key_material)
+        self._index_approximate(cache_key, best_option, analysis_data)
+        logger.info("✨ Streamed Absolem wisdom generated and cached")
+        yield "done", result
+    
+    def _replay(self, result: Dict[str, Any]) -> Iterator[tuple[str, Dict[str, Any]]]:
+        """Emit a complete reflection as stream events."""
+        yield "wisdom", {"philosophical_advice": result.get("philosophical_advice", "")}
+        for index, step in enumerate(result.get("action_plan", [])):
+            yield "step", {"index": index, "text": step}
+        yield "done", result
+    
+    def prewarm(self, options: list, comparison_result: Dict[str, Any], priority: Optional[float] = None) -> bool:
+        """
+        Speculatively compute and cache the reflection for a decision in the background.
+        
+        Lower priority values run first; by default the newest decision runs first since
+        that user is the most likely to ask for wisdom next. When the queue is full the
+        lowest-priority entry is dropped.
+        
+        Returns:
+            True if the decision was queued
+        """
+        if not self.gemini_available:
+            return False
+        
+        _, _, _, cache_key = self._decision_key(comparison_result)
+        if (CACHE_DIR / f"{cache_key}.json").exists():
+            return False  # Already warm
+        
+        if priority is None:
+            priority = -time.monotonic()
+        
+        with self._prewarm_cond:
+            if cache_key in self._prewarm_pending:
+                return False
+            if len(self._prewarm_queue) >= PREWARM_QUEUE_SIZE:
+                worst = max(self._prewarm_queue)
+                if worst[0] <= priority:
+                    self.usage_stats["prewarm_dropped"] += 1
+                    return False
+                self._prewarm_queue.remove(worst)
+                heapq.heapify(self._prewarm_queue)
+                self._prewarm_pending.discard(worst[2])
+                self.usage_stats["prewarm_dropped"] += 1
+            
+            self._prewarm_seq += 1
+            heapq.heappush(self._prewarm_queue, (priority, self._prewarm_seq, cache_key, options, comparison_result))
+            self._prewarm_pending.add(cache_key)
+            self.usage_stats["prewarm_enqueued"] += 1
+            self._ensure_prewarm_worker()
+            self._prewarm_cond.notify()
+        return True
+    
+    def _ensure_prewarm_worker(self):
+        """Start the pre-warm worker thread on first use (caller holds _prewarm_cond)."""
+        if self._prewarm_thread is None or not self._prewarm_thread.is_alive():
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm_worker, name="absolem-prewarm", daemon=True
+            )
+            self._prewarm_thread.start()
+    
+    def _prewarm_worker(self):
+        """
+        Drain the pre-warm queue using spare capacity only: a reserve of daily calls
+        and of per-minute tokens is always left for real requests.
+        """
+        while True:
+            with self._prewarm_cond:
+                while not self._prewarm_queue:
+                    self._prewarm_cond.wait()
+                _, _, cache_key, options, comparison_result = heapq.heappop(self._prewarm_queue)
+            
+            try:
+                best_option, analysis_data, key_material, _ = self._decision_key(comparison_result)
+                metered = getattr(self.model, "metered", True)
+                remaining = MAX_CALLS_PER_DAY - _get_todays_call_count()
+                circuit_open = self.breaker is not None and self.breaker.retry_after() > 0
+                if self._is_inflight(cache_key):
+                    logger.info("Skipping reflection pre-warm - already being generated")
+                    self.usage_stats["prewarm_dropped"] += 1
+                elif self._serve_without_model(options, best_option, analysis_data, cache_key, key_material) is not None:
+                    self.usage_stats["prewarm_completed"] += 1  # Warm (or recently failed) already
+                elif circuit_open:
+                    logger.info("Skipping reflection pre-warm - circuit open")
+                    self.usage_stats["prewarm_dropped"] += 1
+                elif metered and remaining <= PREWARM_RESERVED_CALLS:
+                    logger.info("Skipping reflection pre-warm - daily calls reserved for user requests")
+                    self.usage_stats["prewarm_dropped"] += 1
+                elif self.limiter is not None and not self.limiter.acquire_spare():
+                    logger.info("Skipping reflection pre-warm - no spare per-minute capacity")
+                    self.usage_stats["prewarm_dropped"] += 1
+                else:
+                    # Registered in flight, so a user asking meanwhile joins this call
+                    self._submit_generation(
+                        options, best_option, analysis_data, cache_key, key_material, token_held=True
+                    ).result()
+                    self.usage_stats["prewarm_completed"] += 1
+            except Exception as e:
+                logger.warning(f"Reflection pre-warm failed: {e}")
+            finally:
+                with self._prewarm_cond:
+                    self._prewarm_pending.discard(cache_key)
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Return usage statistics for monitoring."""
         return {
             **self.usage_stats,
             "cache_enabled": True,
+            "approximate_cache_enabled": self.approximate_cache,
+            "local_wisdom_enabled": self.local_wisdom,
+            "local_first": self.local_first,
+            "prewarm_queue_depth": len(self._prewarm_queue),
+            "circuit_breaker": self.breaker.snapshot() if self.breaker is not None else None,
+            "rate_limiter": self.limiter.snapshot() if self.limiter is not None else None,
+            "batching": self.batcher.stats if self.batcher is not None else None,
+            "negative_cache_entries": len(self._negative_cache),
+            "negative_cache_ttl_seconds": NEGATIVE_CACHE_TTL_SECONDS,
+            "stale_while_revalidate": STALE_WHILE_REVALIDATE,
             "fallback_available": True,
             "timestamp": datetime.now().isoformat()
         }
@@ -461,7 +1761,8 @@ def get_reflector() -> AbsolemReflector:
 
 def get_absolem_wisdom(
     options: list,
-    comparison_result: Dict[str, Any]
+    comparison_result: Dict[str, Any],
+    budget_seconds: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to get Absolem's wisdom.
@@ -469,9 +1770,12 @@ def get_absolem_wisdom(
     Args:
         options: List of decision options
         comparison_result: Backend analysis result
+        budget_seconds: Optional latency budget (see AbsolemReflector.get_reflection_within)
     
     Returns:
         Dictionary with advice, action plan, and comparison insight
     """
     reflector = get_reflector()
+    if budget_seconds is not None:
+        return reflector.get_reflection_within(options, comparison_result, budget_seconds)
     return reflector.get_reflection(options, comparison_result)
@@ -0,0 +1,83 @@
+"""
+Attribution Module - which single criterion the scores hinge on
+
+For every criterion: how far the dimension score and the composite score move
+when it is removed (leave-one-out) and when only its weight (±20%) or impact
+(±15%) is perturbed, as in perform_sensitivity_analysis. All of it comes from
+the dimension totals sum(w*i) and sum(w) minus or plus the criterion's own
+contribution, so a dimension costs O(n), not n re-normalizations.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+WEIGHT_PERTURBATION = 0.2
+IMPACT_PERTURBATION = 0.15
+MAX_CRITERION_VALUE = 10
+
+
+def _ratio(total_weighted: float, total_weight: float) -> Optional[float]:
+    return 10 * total_weighted / total_weight if total_weight > 0 else None
+
+
+def _dimension_attribution(criteria, score_at: Callable[[float], float], dimension: str) -> List[Dict]:
+    """Attribution rows for one dimension; score_at maps a new dimension score to a composite."""
+    total_weight = sum(c.weight for c in criteria)
+    total_weighted = sum(c.weight * c.impact for c in criteria)
+    score = _ratio(total_weighted, total_weight) or 0.0
+    composite = score_at(score)
+
+    rows = []
+    for index, c in enumerate(criteria):
+        own = c.weight * c.impact
+
+        # Leave-one-out
+        removed = _ratio(total_weighted - own, total_weight - c.weight)
+
+        # One-at-a-time perturbations of this criterion only
+        weight_high = min(c.weight * (1 + WEIGHT_PERTURBATION), MAX_CRITERION_VALUE)
+        weight_low = c.weight * (1 - WEIGHT_PERTURBATION)
+        impact_high = min(int(c.impact * (1 + IMPACT_PERTURBATION)), MAX_CRITERION_VALUE)
+        impact_low = max(int(c.impact * (1 - IMPACT_PERTURBATION)), 0)
+        perturbed = [
+            _ratio(total_weighted - own + weight_high * c.impact, total_weight - c.weight + weight_high),
+            _ratio(total_weighted - own + weight_low * c.impact, total_weight - c.weight + weight_low),
+            _ratio(total_weighted + c.weight * (impact_high - c.impact), total_weight),
+            _ratio(total_weighted + c.weight * (impact_low - c.impact), total_weight),
+        ]
+        perturbed = [p for p in perturbed if p is not None]
+        composites = [score_at(p) for p in perturbed]
+
+        rows.append({
+            "dimension": dimension,
+            "criterion_index": index,
+            "weight": c.weight,
+            "impact": c.impact,
+            "removal_score_delta": None if removed is None else round(removed - score, 2),
+            "removal_composite_delta": None if removed is None else round(score_at(removed) - composite, 2),
+            "perturbation_score_swing": round(max(perturbed) - min(perturbed), 2) if perturbed else 0.0,
+            "perturbation_composite_swing": round(max(composites) - min(composites), 2) if composites else 0.0,
+        })
+    return rows
+
+
+def attribute_criteria(growth_criteria, sustainability_criteria, composite_fn: Callable) -> List[Dict]:
+    """
+    Per-criterion attribution for an option, most fragile first (largest composite
+    swing under perturbation, then largest composite change on removal).
+    """
+    def exact(criteria):
+        return _ratio(sum(c.weight * c.impact for c in criteria), sum(c.weight for c in criteria)) or 0.0
+
+    growth = exact(growth_criteria)
+    sustainability = exact(sustainability_criteria)
+
+    rows = _dimension_attribution(
+        growth_criteria, lambda g: composite_fn(g, sustainability), "growth"
+    ) + _dimension_attribution(
+        sustainability_criteria, lambda s: composite_fn(growth, s), "sustainability"
+    )
+    return sorted(
+        rows,
+        key=lambda r: (r["perturbation_composite_swing"], abs(r["removal_composite_delta"] or 0)),
+        reverse=True,
+    )
@@ -1,76 +1,32 @@
-def classify_zone(growth, sustainability):
-    if growth >= 70 and sustainability >= 70:
-        return "EXECUTE_FULLY", "High growth and sustainable"
+"""
+Structural classification: zone, tension severity and risk level.
 
-    if growth >= 70 and sustainability < 50:
-        return "TIME_BOX", "High growth but sustainability deficit"
+Thresholds come from the compiled decision rules (app/rules.json via app.config);
+each call is a table lookup against the rules active at the time, or against
+`rules` when the caller pins one ruleset for a whole evaluation.
 
-    if growth < 50 and sustainability >= 70:
-        return "LIGHT_RECOVERY", "Low growth but strong recovery capacity"
+Risk priority hierarchy encoded in the default rules (app/rules.json is the
+source of truth; the first matching rule wins):
+1. Structural rejection (AVOID zone) -> STRUCTURALLY_UNSALVAGEABLE
+2. Burnout imbalance, growth ahead of sustainability -> SEVERE_BURNOUT_RISK:
+   CRITICAL tension, or HIGH tension with growth >= 2x sustainability
+3. Any other CRITICAL tension (sustainability ahead) -> SEVERE_IMBALANCE
+4. Sustainability < 40 -> SUSTAINABILITY_DEFICIT
+5. HIGH tension, sustainability ahead and >= 1.5x growth -> SEVERE_STAGNATION_RISK
+6. Growth < 40 outside STEADY_EXECUTION -> GROWTH_STAGNATION_RISK
+7. Otherwise STRUCTURALLY_STABLE
+"""
 
-    if growth < 40 and sustainability < 40:
-        return "AVOID", "Low structural viability"
+from app.config import get_rules
 
-    return "STEADY_EXECUTION", "Balanced moderate scores"
 
+def classify_zone(growth, sustainability, rules=None):
+    return (rules or get_rules()).classify_zone(growth, sustainability)
 
-def classify_tension(tension):
-    if tension <= 15:
-        return "LOW"
-    elif tension <= 30:
-        return "MODERATE"
-    elif tension <= 60:
-        return "HIGH"
-    return "CRITICAL"
 
-def classify_risk(zone, tension_severity, growth, sustainability):
-    """
-    Enhanced risk classification with burnout ratio detection and growth deficit handling.
-    
-    Priority hierarchy:
-    1. Structural rejection (AVOID zone)
-    2. Severe burnout imbalance (CRITICAL tension OR high ratio from growth > sustainability)
-    3. Sustainability deficit (explicit low sustainability)
-    4. Growth stagnation deficit (implicit growth risk)
-    5. Severe stagnation (low sustainability with high sustainability-dominant tension)
-    6. Default stable classification
-    
-    This hierarchy catches both extreme imbalances (CRITICAL) and sneaky imbalances
-    (HIGH tension with dangerous ratios like 80 growth, 30 sustainability).
-    """
-    # Highest priority: structural rejection
-    if zone == "AVOID":
-        return "STRUCTURALLY_UNSALVAGEABLE"
+def classify_tension(tension, rules=None):
+    return (rules or get_rules()).classify_tension(tension)
 
-    # BURNOUT DETECTION - Two pathways:
-    # Pathway 1: CRITICAL tension with growth dominance
-    if tension_severity == "CRITICAL" and growth > sustainability:
-        return "SEVERE_BURNOUT_RISK"
-    
-    # Pathway 2: HIGH tension with dangerous growth ratio (>2x sustainability)
-    # Catches: Growth 80, Sustainability 30 (ratio 2.67x, tension 50=HIGH)
-    if tension_severity == "HIGH" and growth > sustainability:
-        ratio = growth / max(sustainability, 1)  # Avoid division by zero
-        if ratio >= 2.0:  # Growth is 2x or more than sustainability
-            return "SEVERE_BURNOUT_RISK"
 
-    # General severe imbalance (non-burnout orientation)
-    if tension_severity == "CRITICAL":
-        return "SEVERE_IMBALANCE"
-
-    # Explicit sustainability deficit
-    if sustainability < 40:
-        return "SUSTAINABILITY_DEFICIT"
-    
-    # Severe stagnation: High tension with sustainability dominance
-    if tension_severity == "HIGH" and sustainability > growth:
-        ratio = sustainability / max(growth, 1)
-        if ratio >= 1.5:  # Sustainability is 1.5x+ more than growth
-            return "SEVERE_STAGNATION_RISK"
-    
-    # Growth deficit risk: low growth indicates stagnation
-    # (especially problematic in LIGHT_RECOVERY zone which suggests low growth)
-    if growth < 40 and zone != "STEADY_EXECUTION":
-        return "GROWTH_STAGNATION_RISK"
-
-    return "STRUCTURALLY_STABLE"
\ No newline at end of file
+def classify_risk(zone, tension_severity, growth, sustainability, rules=None):
+    return (rules or get_rules()).classify_risk(zone, tension_severity, growth, sustainability)
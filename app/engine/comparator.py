@@ -1,37 +1,29 @@
-def detect_close_competition(sorted_options, threshold=5):
+from app.config import get_rules
+from app.engine.evaluator import DEFAULT_PENALTIES
+from app.engine.rank_flip import rank_flip_margins
+
+
+def detect_close_competition(sorted_options, decision_options, threshold=None, penalties=DEFAULT_PENALTIES):
     """
-    Determines whether the top two options are too close in composite score
-    to confidently declare a winner. Adjusts threshold based on stability levels.
-    
-    Logic:
-    - Both STABLE: Use normal threshold (5 points) - scores are reliable
-    - Mixed stability: Use higher threshold (8 points) - one is unreliable
-    - Either FRAGILE: Use highest threshold (12 points) - top choice is shaky
+    Determines whether the top option's lead is too fragile to declare a winner.
+
+    Instead of fixed score gaps, computes the exact smallest change to any single
+    weight or impact (of either option) that would let another option tie the
+    leader; the competition is close when that margin is below threshold points
+    (default: close_competition_margin of the active rules - 1.0, i.e. within the
+    resolution of the estimates themselves, since impacts are integers).
+
+    Args:
+        sorted_options: OptionEvaluations, highest composite score first
+        decision_options: the DecisionOptions they were computed from
+        penalties: composite_score coefficients the scores were computed with
     """
 
     if len(sorted_options) < 2:
         return False
 
-    top_option = sorted_options[0]
-    second_option = sorted_options[1]
-    
-    top_score = top_option.composite_score
-    second_score = second_option.composite_score
-    difference = top_score - second_score
-    
-    # Determine stability context
-    top_stable = top_option.stability_level
-    second_stable = second_option.stability_level
-    
-    # Adjust threshold based on stability context
-    if top_stable == "FRAGILE" or second_stable == "FRAGILE":
-        adjusted_threshold = 12  # Very conservative when fragile option involved
-    elif top_stable != second_stable:  # Mixed (one STABLE, one not)
-        adjusted_threshold = 8  # More conservative with mixed stability
-    else:  # Both same stability level
-        if top_stable == "STABLE":
-            adjusted_threshold = 5  # Normal threshold for stable decisions
-        else:  # Both MODERATELY_STABLE or worse
-            adjusted_threshold = 8  # More conservative for moderate areas
-    
-    return difference < adjusted_threshold
\ No newline at end of file
+    if threshold is None:
+        threshold = get_rules().close_competition_margin
+
+    margins = rank_flip_margins(sorted_options, decision_options, penalties)
+    return min(flip.margin for flip in margins) < threshold
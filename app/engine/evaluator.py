@@ -1,3 +1,16 @@
+from typing import NamedTuple
+
+
+class CompositePenalties(NamedTuple):
+    """Imbalance penalty coefficients of composite_score (overridable per policy profile)."""
+    growth_dominant: float = 0.3          # burnout direction
+    sustainability_dominant: float = 0.1  # stagnation direction
+    quadratic: float = 0.05               # times tension^2 / 100
+
+
+DEFAULT_PENALTIES = CompositePenalties()
+
+
 def normalize_score(criteria):
     if not criteria:
         return 0
@@ -11,7 +24,7 @@ def normalize_score(criteria):
     weighted_avg = total_weighted / total_weight
     return round(weighted_avg * 10, 2)
 
-def composite_score(growth, sustainability):
+def composite_score(growth, sustainability, penalties=DEFAULT_PENALTIES):
     """
     Computes composite viability score with asymmetric burnout penalty.
     
@@ -31,6 +44,8 @@ def composite_score(growth, sustainability):
     
     This is INTENTIONAL - the system avoids high-risk, high-reward patterns.
     Use sensitivity_range/stability_level to understand confidence in any decision.
+
+    The coefficients above are the defaults; policy profiles may pass their own.
     """
     base = (growth + sustainability) / 2
     
@@ -38,11 +53,14 @@ def composite_score(growth, sustainability):
     growth_dominant = max(0, growth - sustainability)
     sustainability_dominant = max(0, sustainability - growth)
     
-    asymmetric_penalty = (0.3 * growth_dominant) + (0.1 * sustainability_dominant)
+    asymmetric_penalty = (
+        (penalties.growth_dominant * growth_dominant)
+        + (penalties.sustainability_dominant * sustainability_dominant)
+    )
     
     # Quadratic penalty for extreme imbalances (tension > 50)
     tension = abs(growth - sustainability)
-    quadratic_penalty = 0.05 * (tension ** 2) / 100  # Scales 0-5 points for extreme cases
+    quadratic_penalty = penalties.quadratic * (tension ** 2) / 100  # Scales 0-5 points for extreme cases
     
     adjusted = base - asymmetric_penalty - quadratic_penalty
     
@@ -0,0 +1,145 @@
+"""
+Fixed-point scoring kernels (centi-points).
+
+Integer re-implementation of normalize_score, composite_score and the sensitivity
+perturbations. Weights are quantized to 1/100, impacts are already integers, and
+every intermediate value is an exact integer; the single rounding step per score
+is half-to-even on the exact rational, so results are bit-reproducible on any
+machine or shard. Outputs are converted to floats (centi / 100) only at the edge.
+
+Where the float engine lands exactly on a rounding tie, binary representation
+can tip it either way, so the two engines may differ by 0.01 on such values.
+"""
+
+from app.engine.evaluator import DEFAULT_PENALTIES
+
+SCALE = 100          # scores are carried as integer centi-points
+WEIGHT_SCALE = 100   # weights are quantized to 1/100
+MAX_WEIGHT = 10 * WEIGHT_SCALE
+MAX_IMPACT = 10
+PENALTY_SCALE = 1000  # penalty coefficients are quantized to 1/1000
+
+
+def round_div(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half to even (denominator > 0)."""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+def quantize_criteria(criteria) -> tuple[list, list]:
+    """Split criteria into integer weights (1/100 units) and integer impacts."""
+    weights = [round(c.weight * WEIGHT_SCALE) for c in criteria]
+    impacts = [int(c.impact) for c in criteria]
+    return weights, impacts
+
+
+def to_centi(score: float) -> int:
+    """Centi-point integer of a 2-decimal score."""
+    return round(score * SCALE)
+
+
+def normalize_centi(weights: list, impacts: list) -> int:
+    """Weighted mean impact on a 0-100 scale, in centi-points (0 when there is no weight)."""
+    total_weight = sum(weights)
+    if total_weight == 0:
+        return 0
+    total_weighted = sum(w * i for w, i in zip(weights, impacts))
+    # 10 * weighted mean, times SCALE
+    return round_div(10 * SCALE * total_weighted, total_weight)
+
+
+def quantize_penalties(penalties=DEFAULT_PENALTIES) -> tuple:
+    """Penalty coefficients in 1/1000 units: (growth-dominant, sustainability-dominant, quadratic)."""
+    return tuple(round(p * PENALTY_SCALE) for p in penalties)
+
+
+def composite_centi(growth: int, sustainability: int, penalties_milli: tuple = (300, 100, 50)) -> int:
+    """
+    composite_score in centi-points, over the common denominator 2*10^7:
+    base (G+S)/2, asymmetric penalty (g*GD + s*SD)/1000, quadratic penalty q*T^2/10^7
+    (g, s, q in 1/1000 units - 300, 100, 50 by default).
+    """
+    growth_penalty, sustainability_penalty, quadratic_penalty = penalties_milli
+    growth_dominant = max(0, growth - sustainability)
+    sustainability_dominant = max(0, sustainability - growth)
+    tension = abs(growth - sustainability)
+    numerator = (
+        10_000_000 * (growth + sustainability)
+        - 20_000 * (growth_penalty * growth_dominant + sustainability_penalty * sustainability_dominant)
+        - 2 * quadratic_penalty * tension * tension
+    )
+    return max(round_div(numerator, 20_000_000), 0)
+
+
+def sensitivity_centi(weights: list, impacts: list) -> tuple[int, int]:
+    """
+    (weight variance, impact variance) in centi-points for the ±20% weight and
+    ±15% impact perturbations of perform_sensitivity_analysis.
+
+    Weight perturbations are scaled by 5 (6w and 4w instead of 1.2w and 0.8w):
+    normalization is a ratio, so the common factor cancels and stays integral.
+    """
+    increased_weight = [min(6 * w, 5 * MAX_WEIGHT) for w in weights]
+    decreased_weight = [4 * w for w in weights]
+    weight_variance = abs(
+        normalize_centi(increased_weight, impacts) - normalize_centi(decreased_weight, impacts)
+    )
+
+    increased_impact = [min(i * 115 // 100, MAX_IMPACT) for i in impacts]
+    decreased_impact = [max(i * 85 // 100, 0) for i in impacts]
+    impact_variance = abs(
+        normalize_centi(weights, increased_impact) - normalize_centi(weights, decreased_impact)
+    )
+    return weight_variance, impact_variance
+
+
+# ----------------------------
+# Float-interface wrappers (drop-in for the float engine)
+# ----------------------------
+def normalize_score_fixed(criteria) -> float:
+    if not criteria:
+        return 0
+    return normalize_centi(*quantize_criteria(criteria)) / SCALE
+
+
+def composite_score_fixed(growth: float, sustainability: float, penalties=DEFAULT_PENALTIES) -> float:
+    return composite_centi(to_centi(growth), to_centi(sustainability), quantize_penalties(penalties)) / SCALE
+
+
+def tension_index_fixed(growth: float, sustainability: float) -> float:
+    return abs(to_centi(growth) - to_centi(sustainability)) / SCALE
+
+
+def mean_fixed(first: float, second: float) -> float:
+    """Mean of two 2-decimal values, rounded half to even to 2 decimals."""
+    return round_div(to_centi(first) + to_centi(second), 2) / SCALE
+
+
+def perform_sensitivity_analysis_fixed(criteria) -> dict:
+    """Same result shape as sensitivity.perform_sensitivity_analysis."""
+    if not criteria:
+        return {
+            'weight_sensitivity': 0,
+            'impact_sensitivity': 0,
+            'combined_sensitivity': 0,
+            'breakdown': 'N/A'
+        }
+
+    weight_variance, impact_variance = sensitivity_centi(*quantize_criteria(criteria))
+
+    if weight_variance > impact_variance:
+        breakdown = "Importance estimates are less reliable"
+    elif impact_variance > weight_variance:
+        breakdown = "Effect/impact estimates are less reliable"
+    else:
+        breakdown = "Both dimensions equally fragile"
+
+    return {
+        'weight_sensitivity': weight_variance / SCALE,
+        'impact_sensitivity': impact_variance / SCALE,
+        'combined_sensitivity': max(weight_variance, impact_variance) / SCALE,
+        'breakdown': breakdown
+    }
@@ -0,0 +1,154 @@
+"""
+Local Wisdom Module - Absolem's template-based reflection tier
+Builds personalized advice and an action plan from the structural compare result
+(zone, risk level, tension, stability, triggered messages) without any model call.
+Pure table lookups: deterministic and fast enough to answer every request instantly.
+"""
+
+from typing import Any, Dict, List, Optional
+
+LOCAL_WISDOM_SOURCE = "Absolem's Local Wisdom"
+
+# Opening sentence per zone ({option} is the recommended option's title)
+ZONE_WISDOM = {
+    "EXECUTE_FULLY": "'{option}' lets you grow without borrowing against your rest - a rare path worth walking fully.",
+    "TIME_BOX": "'{option}' promises growth, but it draws on reserves you have not yet built; ambition needs a fence.",
+    "LIGHT_RECOVERY": "'{option}' restores more than it stretches - a season of recovery is not a season wasted.",
+    "STEADY_EXECUTION": "'{option}' is a steady path; its strength is that you can still walk it next month.",
+    "AVOID": "'{option}' offers little to grow on and little to rest on; sometimes the wisest step is the one not taken.",
+}
+
+# Second sentence per risk level: the hidden cost to watch
+RISK_WISDOM = {
+    "SEVERE_BURNOUT_RISK": "Its hidden cost is exhaustion disguised as progress - the hours it takes will not ask permission.",
+    "SEVERE_IMBALANCE": "Its two sides pull far apart, and a life held in that tension tires quickly.",
+    "SUSTAINABILITY_DEFICIT": "What it takes from your energy, sleep and relationships must be repaid deliberately.",
+    "SEVERE_STAGNATION_RISK": "Comfort can quietly become a cage if nothing in it asks you to grow.",
+    "GROWTH_STAGNATION_RISK": "Guard against drifting; rest should prepare you for growth, not replace it.",
+    "STRUCTURALLY_UNSALVAGEABLE": "No amount of willpower will make an unsound structure sustainable.",
+    "STRUCTURALLY_STABLE": "Its structure holds, so your task is to keep it that way as demands shift.",
+}
+
+# Tension sentence, used only when the risk level does not already speak to the imbalance
+TENSION_WISDOM = {
+    "HIGH": "Growth and rest pull noticeably apart here; decide in advance which one yields when they collide.",
+    "CRITICAL": "Growth and rest pull to opposite extremes here, and that gap rarely closes by itself.",
+}
+IMBALANCE_RISKS = {"SEVERE_BURNOUT_RISK", "SEVERE_IMBALANCE", "SEVERE_STAGNATION_RISK"}
+
+# Closing sentence per stability level: how far to trust the scores
+STABILITY_WISDOM = {
+    "STABLE": "Your estimates agree with each other, so you can trust this reading.",
+    "MODERATELY_STABLE": "Your estimates leave some room for doubt; revisit them once you have lived with the choice a little.",
+    "FRAGILE": "Small changes in your estimates would change this picture, so hold the conclusion lightly.",
+}
+
+# Decision-level framing when no single option was recommended
+STATUS_WISDOM = {
+    "CLOSE_COMPETITION": "Your options stand almost level; the choice is less about scores than about which cost you are willing to carry.",
+    "ALL_OPTIONS_POOR_FIT": "None of these paths sustains you as framed - the wiser move is to reshape the problem, not to pick the least harmful option.",
+}
+
+# Action steps keyed by zone, then by risk level, then by triggered message fragments
+ZONE_STEPS = {
+    "EXECUTE_FULLY": "Commit fully, and put weekly recovery time in your calendar before the work fills it",
+    "TIME_BOX": "Time-box '{option}' with a fixed weekly hours ceiling and an end date for the intense phase",
+    "LIGHT_RECOVERY": "Pick one small growth goal so recovery does not turn into drift",
+    "STEADY_EXECUTION": "Set a sustainable weekly rhythm and protect it from scope creep",
+    "AVOID": "Write down what a better-structured alternative would need, and look for it",
+}
+
+RISK_STEPS = {
+    "SEVERE_BURNOUT_RISK": "Decide now what you will drop if energy falls for two weeks in a row",
+    "SEVERE_IMBALANCE": "Add one commitment that strengthens the weaker side of this choice",
+    "SUSTAINABILITY_DEFICIT": "Protect sleep and one rest day per week as non-negotiable",
+    "SEVERE_STAGNATION_RISK": "Schedule a monthly stretch task that pushes your skills",
+    "GROWTH_STAGNATION_RISK": "Agree on a concrete growth milestone for the next month",
+    "STRUCTURALLY_UNSALVAGEABLE": "Do not commit yet - revisit the options before investing more time",
+    "STRUCTURALLY_STABLE": "Check in with yourself every Sunday and adjust before small strains grow",
+}
+
+TRIGGER_STEPS = (
+    ("Burnout trap", "Share your plan with someone who will tell you when you are overextended"),
+    ("Sustainability below", "List the recovery activities this choice must leave room for"),
+    ("imbalance", "Re-check whether you truly accept the trade-off between growth and rest"),
+    ("Stagnation risk", "Name one opportunity you would regret missing and make space for it"),
+    ("Growth threshold", "Widen the scope of impact so the effort pays off in growth"),
+)
+
+STABILITY_STEPS = {
+    "FRAGILE": "Re-estimate your weights and impacts in a week; fragile scores deserve a second look",
+    "MODERATELY_STABLE": "Revisit your least certain estimate after the first month",
+}
+
+# Generic steps used to reach MIN_STEPS when the structure says little
+FILLER_STEPS = (
+    "Assess the true cost - time, energy and emotional toll - not just the rewards",
+    "Set boundaries from day one to protect your peace",
+    "Review how this choice feels after two weeks and adjust",
+)
+
+MIN_STEPS = 3
+MAX_STEPS = 4
+
+
+def _get_field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a field from either a dict or a Pydantic model."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _recommended_evaluation(comparison_result: Any) -> Optional[Any]:
+    """The evaluation of the recommended option (or the top-ranked one when none was chosen)."""
+    evaluations = _get_field(comparison_result, "evaluations", []) or []
+    if not evaluations:
+        return None
+    recommended = _get_field(comparison_result, "recommended_option")
+    return next((e for e in evaluations if _get_field(e, "title") == recommended), evaluations[0])
+
+
+def generate_local_wisdom(comparison_result: Any) -> Dict[str, Any]:
+    """
+    Build Absolem's wisdom from the compare result alone.
+
+    Returns the same shape as the Gemini tier:
+        {"action_plan": [...], "philosophical_advice": str, "source": LOCAL_WISDOM_SOURCE}
+    """
+    evaluation = _recommended_evaluation(comparison_result)
+    status = _get_field(comparison_result, "decision_status")
+    option = _get_field(evaluation, "title", "this choice") if evaluation is not None else "this choice"
+    zone = _get_field(evaluation, "zone") if evaluation is not None else None
+    risk = _get_field(evaluation, "risk_level") if evaluation is not None else None
+    stability = _get_field(evaluation, "stability_level") if evaluation is not None else None
+    tension = _get_field(evaluation, "tension_severity") if evaluation is not None else None
+    triggers = (_get_field(evaluation, "triggered_messages", []) or []) if evaluation is not None else []
+
+    sentences = [
+        STATUS_WISDOM.get(status),
+        ZONE_WISDOM.get(zone, "").format(option=option),
+        RISK_WISDOM.get(risk),
+        None if risk in IMBALANCE_RISKS else TENSION_WISDOM.get(tension),
+        STABILITY_WISDOM.get(stability),
+    ]
+    advice = " ".join(s for s in sentences if s) or (
+        "Choose the path that lets you grow while remaining whole."
+    )
+
+    steps: List[str] = []
+    candidates = [ZONE_STEPS.get(zone, "").format(option=option), RISK_STEPS.get(risk)]
+    candidates += [step for fragment, step in TRIGGER_STEPS if any(fragment in t for t in triggers)]
+    candidates.append(STABILITY_STEPS.get(stability))
+    for step in candidates:
+        if step and step not in steps:
+            steps.append(step)
+    for step in FILLER_STEPS:
+        if len(steps) >= MIN_STEPS:
+            break
+        steps.append(step)
+
+    return {
+        "action_plan": [f"{i}. {step}" for i, step in enumerate(steps[:MAX_STEPS], start=1)],
+        "philosophical_advice": advice,
+        "source": LOCAL_WISDOM_SOURCE,
+    }
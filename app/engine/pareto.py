@@ -0,0 +1,96 @@
+"""
+Pareto Module - growth vs sustainability dominance analysis
+
+Option A dominates B when A is at least as good on both axes and better on one.
+Everything here is O(n log n): a single sweep in descending growth order with
+binary search over the fronts (layering) and a Fenwick tree over sustainability
+ranks (dominance counts), so thousands of options are cheap.
+"""
+
+from bisect import bisect_left
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]  # (growth, sustainability)
+
+
+def _sweep_order(points: Sequence[Point]) -> List[int]:
+    """Indices by growth descending, then sustainability descending."""
+    return sorted(range(len(points)), key=lambda i: (-points[i][0], -points[i][1]))
+
+
+def pareto_fronts(points: Sequence[Point]) -> List[int]:
+    """
+    Non-dominated front index of every point (0 = Pareto frontier).
+
+    In sweep order each front's last point has the highest sustainability in
+    that front, and those last points strictly decrease front by front, so a
+    binary search finds the first front that does not dominate the new point.
+    """
+    fronts = [0] * len(points)
+    # (-sustainability, -growth) of each front's last point, strictly increasing
+    tails: List[Tuple[float, float]] = []
+    for i in _sweep_order(points):
+        growth, sustainability = points[i]
+        key = (-sustainability, -growth)
+        front = bisect_left(tails, key)
+        if front == len(tails):
+            tails.append(key)
+        else:
+            tails[front] = key
+        fronts[i] = front
+    return fronts
+
+
+class _FenwickTree:
+    def __init__(self, size: int):
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int):
+        index += 1
+        while index < len(self.tree):
+            self.tree[index] += 1
+            index += index & -index
+
+    def prefix(self, index: int) -> int:
+        """Count of added indices <= index."""
+        index += 1
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+def _weakly_better_counts(points: Sequence[Point]) -> List[int]:
+    """For each point, how many points (itself included) are >= on both axes."""
+    ranks = {value: rank for rank, value in enumerate(sorted({p[1] for p in points}))}
+    tree = _FenwickTree(len(ranks))
+    counts = [0] * len(points)
+    order = _sweep_order(points)
+    start = 0
+    while start < len(order):
+        # Insert every point with this growth before querying any of them
+        end = start
+        while end < len(order) and points[order[end]][0] == points[order[start]][0]:
+            tree.add(ranks[points[order[end]][1]])
+            end += 1
+        inserted = end
+        for i in order[start:end]:
+            counts[i] = inserted - tree.prefix(ranks[points[i][1]] - 1)
+        start = end
+    return counts
+
+
+def dominance_counts(points: Sequence[Point]) -> Tuple[List[int], List[int]]:
+    """(how many points each point dominates, how many points dominate it)."""
+    multiplicity: dict = {}
+    for p in points:
+        multiplicity[p] = multiplicity.get(p, 0) + 1
+    dominated_by = [
+        count - multiplicity[p] for p, count in zip(points, _weakly_better_counts(points))
+    ]
+    mirrored = [(-g, -s) for g, s in points]
+    dominates = [
+        count - multiplicity[p] for p, count in zip(points, _weakly_better_counts(mirrored))
+    ]
+    return dominates, dominated_by
@@ -0,0 +1,151 @@
+"""
+Rank Flip Module - exact breakpoints where two options swap rank
+
+normalize_score is 10 * sum(w*i) / sum(w): changing one impact moves the score
+linearly, changing one weight moves it along a hyperbola. composite_score is
+strictly increasing and piecewise quadratic in each score. Both invert in
+closed form, so the smallest single-criterion change that lets the challenger
+catch the leader is solved exactly for all criteria at once - O(total criteria),
+no perturbation sweeps.
+
+Margins are in criterion points (weights and impacts share the 0-10 scale).
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from app.engine.evaluator import DEFAULT_PENALTIES, CompositePenalties
+
+MAX_CRITERION_VALUE = 10
+
+
+class RankFlip(NamedTuple):
+    leader: str
+    challenger: str
+    margin: float                     # |delta|, 0 when already tied or ahead
+    option: Optional[str] = None      # option whose criterion changes
+    dimension: Optional[str] = None   # "growth" | "sustainability"
+    criterion_index: Optional[int] = None
+    parameter: Optional[str] = None   # "weight" | "impact"
+    delta: float = 0.0                # signed change that produces the tie
+
+
+def _arrays(criteria):
+    weights = np.array([c.weight for c in criteria], dtype=float)
+    impacts = np.array([c.impact for c in criteria], dtype=float)
+    return weights, impacts
+
+
+def _score(weights: np.ndarray, impacts: np.ndarray) -> float:
+    """Unrounded normalize_score."""
+    total_weight = weights.sum()
+    return 10 * float(weights @ impacts) / total_weight if total_weight else 0.0
+
+
+def _composite(growth: float, sustainability: float, penalties: CompositePenalties) -> float:
+    """Unrounded composite_score."""
+    tension = growth - sustainability
+    penalty = (
+        penalties.growth_dominant * max(tension, 0)
+        + penalties.sustainability_dominant * max(-tension, 0)
+        + penalties.quadratic * tension ** 2 / 100
+    )
+    return max((growth + sustainability) / 2 - penalty, 0.0)
+
+
+def required_score(
+    other: float, target: float, dimension: str, penalties: CompositePenalties = DEFAULT_PENALTIES
+) -> Optional[float]:
+    """
+    Score the moving dimension needs (the other one fixed) for composite == target.
+
+    With d the distance from the other score, the composite is
+    other + rise*d - q*d^2 above it and other - fall*d - q*d^2 below it.
+    """
+    own_penalty, other_penalty = (
+        (penalties.growth_dominant, penalties.sustainability_dominant)
+        if dimension == "growth"
+        else (penalties.sustainability_dominant, penalties.growth_dominant)
+    )
+    rise, fall, q = 0.5 - own_penalty, 0.5 + other_penalty, penalties.quadratic / 100
+    if q == 0:
+        return other + (target - other) / (rise if target >= other else fall)
+    if target >= other:
+        discriminant = rise * rise - 4 * q * (target - other)
+        if discriminant < 0:
+            return None
+        return other + (rise - np.sqrt(discriminant)) / (2 * q)
+    return other - (np.sqrt(fall * fall + 4 * q * (other - target)) - fall) / (2 * q)
+
+
+def criterion_changes(weights: np.ndarray, impacts: np.ndarray, target: float):
+    """
+    Signed weight and impact change per criterion that moves the score to target
+    (NaN where no in-range value of that single parameter gets there).
+    """
+    total_weight = weights.sum()
+    total_weighted = float(weights @ impacts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        impact_delta = (target * total_weight / 10 - total_weighted) / weights
+        weight_delta = (target * total_weight - 10 * total_weighted) / (10 * impacts - target)
+
+    new_impact = impacts + impact_delta
+    impact_delta[~((weights > 0) & (new_impact >= 0) & (new_impact <= MAX_CRITERION_VALUE))] = np.nan
+    new_weight = weights + weight_delta
+    weight_ok = (
+        np.isfinite(weight_delta)
+        & (new_weight >= 0)
+        & (new_weight <= MAX_CRITERION_VALUE)
+        & (total_weight + weight_delta > 0)
+    )
+    weight_delta[~weight_ok] = np.nan
+    return weight_delta, impact_delta
+
+
+def rank_flip(leader, challenger, penalties: CompositePenalties = DEFAULT_PENALTIES) -> RankFlip:
+    """Smallest single weight/impact change after which challenger ties leader (DecisionOptions)."""
+    arrays = {
+        (option.title, dimension): _arrays(getattr(option, f"{dimension}_criteria"))
+        for option in (leader, challenger)
+        for dimension in ("growth", "sustainability")
+    }
+    scores = {key: _score(*value) for key, value in arrays.items()}
+    composites = {
+        option.title: _composite(
+            scores[(option.title, "growth")], scores[(option.title, "sustainability")], penalties
+        )
+        for option in (leader, challenger)
+    }
+    if composites[challenger.title] >= composites[leader.title]:
+        return RankFlip(leader.title, challenger.title, 0.0)
+
+    best = RankFlip(leader.title, challenger.title, float("inf"))
+    # Raise the challenger to the leader's composite, or lower the leader to the challenger's
+    for option, target in ((challenger, composites[leader.title]), (leader, composites[challenger.title])):
+        for dimension, other in (("growth", "sustainability"), ("sustainability", "growth")):
+            needed = required_score(scores[(option.title, other)], target, dimension, penalties)
+            if needed is None:
+                continue
+            weight_delta, impact_delta = criterion_changes(*arrays[(option.title, dimension)], needed)
+            for parameter, deltas in (("weight", weight_delta), ("impact", impact_delta)):
+                if np.isnan(deltas).all():
+                    continue
+                index = int(np.nanargmin(np.abs(deltas)))
+                if abs(deltas[index]) < best.margin:
+                    best = RankFlip(
+                        leader.title, challenger.title, round(abs(float(deltas[index])), 4),
+                        option.title, dimension, index, parameter, round(float(deltas[index]), 4),
+                    )
+    return best
+
+
+def rank_flip_margins(
+    sorted_evaluations: Sequence,
+    decision_options: Sequence,
+    penalties: CompositePenalties = DEFAULT_PENALTIES,
+) -> List[RankFlip]:
+    """Flip margin between the leader and every other option (inf when no single change suffices)."""
+    by_title = {option.title: option for option in decision_options}
+    leader = by_title[sorted_evaluations[0].title]
+    return [rank_flip(leader, by_title[e.title], penalties) for e in sorted_evaluations[1:]]
@@ -0,0 +1,74 @@
+"""
+Selectable scoring engines for /decision/compare.
+
+- "float" (default): the original floating-point pipeline with round(x, 2)
+- "fixed": integer centi-point kernels from fixed_point.py (bit-reproducible)
+
+Select with DECISION_SCORING_ENGINE. Either engine can be bound to policy-profile
+composite penalties.
+"""
+
+import os
+from functools import partial
+from typing import Callable, NamedTuple, Optional
+
+from app.engine.evaluator import normalize_score, composite_score, CompositePenalties, DEFAULT_PENALTIES
+from app.engine.sensitivity import perform_sensitivity_analysis
+from app.engine.fixed_point import (
+    normalize_score_fixed,
+    composite_score_fixed,
+    tension_index_fixed,
+    mean_fixed,
+    perform_sensitivity_analysis_fixed,
+)
+
+SCORING_ENGINE = os.getenv("DECISION_SCORING_ENGINE", "float").lower()
+
+
+class ScoringEngine(NamedTuple):
+    """The numeric steps of the compare pipeline; classification is shared."""
+    name: str
+    normalize: Callable          # criteria -> 0-100 score
+    composite: Callable          # (growth, sustainability) -> composite score
+    tension: Callable            # (growth, sustainability) -> tension index
+    sensitivity: Callable        # criteria -> sensitivity dict
+    sensitivity_range: Callable  # (growth combined, sustainability combined) -> range
+    penalties: CompositePenalties = DEFAULT_PENALTIES  # coefficients bound into composite
+
+
+FLOAT_ENGINE = ScoringEngine(
+    name="float",
+    normalize=normalize_score,
+    composite=composite_score,
+    tension=lambda growth, sustainability: abs(growth - sustainability),
+    sensitivity=lambda criteria: perform_sensitivity_analysis(criteria, normalize_score),
+    sensitivity_range=lambda growth, sustainability: round((growth + sustainability) / 2, 2),
+)
+
+FIXED_ENGINE = ScoringEngine(
+    name="fixed",
+    normalize=normalize_score_fixed,
+    composite=composite_score_fixed,
+    tension=tension_index_fixed,
+    sensitivity=perform_sensitivity_analysis_fixed,
+    sensitivity_range=mean_fixed,
+)
+
+ENGINES = {engine.name: engine for engine in (FLOAT_ENGINE, FIXED_ENGINE)}
+COMPOSITE_KERNELS = {"float": composite_score, "fixed": composite_score_fixed}
+
+
+def get_scoring_engine(
+    name: Optional[str] = None, penalties: CompositePenalties = DEFAULT_PENALTIES
+) -> ScoringEngine:
+    """Look up an engine by name (defaults to SCORING_ENGINE), optionally with other penalties."""
+    name = (name or SCORING_ENGINE).lower()
+    if name not in ENGINES:
+        raise ValueError(f"Unknown scoring engine '{name}'. Choose from: {', '.join(ENGINES)}")
+    engine = ENGINES[name]
+    if penalties == DEFAULT_PENALTIES:
+        return engine
+    return engine._replace(
+        composite=partial(COMPOSITE_KERNELS[name], penalties=penalties),
+        penalties=penalties,
+    )
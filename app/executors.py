@@ -0,0 +1,141 @@
+"""
+Workload Executors - separate thread pools (bulkheads) per workload class.
+
+Sync handlers would otherwise share one thread pool, where a few reflect calls
+sleeping through model retries can hold every thread while microsecond compare
+requests wait behind them. Each workload class gets its own, independently
+sized ThreadPoolExecutor instead:
+
+- compare: /decision/compare (short, CPU-bound)
+- pareto:  /decision/pareto (large option sets)
+- reflect: /decision/reflect and /decision/reflect/stream (waits on the model)
+
+The handlers are async and hand their work to their class's pool, so slowness
+in one class only ever queues behind that class. Queue depth, active workers
+and queue-wait / run-time percentiles per pool are reported in /stats.
+
+Reflect has two pools: these handler threads, and the reflector's own model-call
+pool (ABSOLEM_REFLECT_WORKERS, default 8) that each handler waits on. At most
+that many model calls run at once; handler threads beyond it serve cache hits
+and wait out their latency budget for a queued call. Keep
+DECISION_REFLECT_HANDLER_WORKERS at or above ABSOLEM_REFLECT_WORKERS. The two
+cannot share a pool: a handler blocks on its model call's future, so a pool full
+of waiting handlers would never run the calls they wait for.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+from app.analytics import DDSketch
+from app.engine.ai_reflector import REFLECT_WORKERS as REFLECT_MODEL_WORKERS
+
+COMPARE_WORKERS = int(os.getenv("DECISION_COMPARE_WORKERS", "8"))
+PARETO_WORKERS = int(os.getenv("DECISION_PARETO_WORKERS", "2"))
+REFLECT_HANDLER_WORKERS = int(os.getenv("DECISION_REFLECT_HANDLER_WORKERS", "16"))
+
+_EXHAUSTED = object()
+
+
+class WorkloadExecutor:
+    """A named ThreadPoolExecutor that awaits from the event loop and tracks its queue."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.max_queued = 0
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0}
+        self._queue_wait_ms = DDSketch()
+        self._run_ms = DDSketch()
+
+    def _run(self, submitted_at: float, fn: Callable, args, kwargs):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self._queue_wait_ms.add((started - submitted_at) * 1000)
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.stats["failed" if failed else "completed"] += 1
+                self._run_ms.add((time.perf_counter() - started) * 1000)
+
+    def start(self) -> ThreadPoolExecutor:
+        """The thread pool, created on first use and again after shutdown() (app restarted)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"{self.name}-worker"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on this pool and await its result."""
+        executor = self.start()
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            self.stats["submitted"] += 1
+        call = functools.partial(self._run, time.perf_counter(), fn, args, kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    async def iterate(self, iterator: Iterator) -> AsyncIterator:
+        """
+        Drive a blocking iterator on this pool, one item per task (for streaming responses).
+
+        The iterator is closed on this pool too when the stream ends early (client
+        disconnect, cancellation), so a generator's finally blocks still run.
+        """
+        try:
+            while True:
+                item = await self.run(next, iterator, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self.run(close)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "workers": self.max_workers,
+                "active": self.active,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queued,
+                "queue_wait_ms": {f"p{q}": self._queue_wait_ms.quantile(q / 100) for q in (50, 99)},
+                "run_ms": {f"p{q}": self._run_ms.quantile(q / 100) for q in (50, 99)},
+            }
+
+    def shutdown(self):
+        """Stop the pool; the next start() or run() creates a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+compare_executor = WorkloadExecutor("compare", COMPARE_WORKERS)
+pareto_executor = WorkloadExecutor("pareto", PARETO_WORKERS)
+reflect_executor = WorkloadExecutor("reflect", REFLECT_HANDLER_WORKERS)
+
+
+def get_executor_stats() -> Dict[str, Any]:
+    stats = {e.name: e.snapshot() for e in (compare_executor, pareto_executor, reflect_executor)}
+    stats["reflect"]["model_workers"] = REFLECT_MODEL_WORKERS
+    return stats
@@ -0,0 +1,269 @@
+"""
+Decision History Store - optional write-behind persistence for /decision/compare.
+
+Compare requests only enqueue (request, response); a background writer drains the
+queue in batches and commits each batch in one transaction (group commit), so the
+request thread never touches the database. When the queue is full, records are
+dropped and counted rather than slowing compare down.
+
+SQLite is the bundled backend; other stores implement HistoryStore.
+
+Enable with DECISION_HISTORY_DB=/path/to/history.db
+"""
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DB_PATH = os.getenv("DECISION_HISTORY_DB", "")  # empty disables history
+HISTORY_QUEUE_SIZE = int(os.getenv("DECISION_HISTORY_QUEUE_SIZE", "10000"))
+HISTORY_BATCH_SIZE = 500         # max records per group commit
+HISTORY_FLUSH_INTERVAL = 0.2     # seconds a partial batch may wait
+HISTORY_MAX_PAGE_SIZE = 200
+
+# Evaluation columns stored (and filterable) per option
+EVALUATION_COLUMNS = (
+    "title", "growth_score", "sustainability_score", "composite_score",
+    "zone", "risk_level", "tension_severity", "stability_level",
+)
+
+
+class HistoryStore(ABC):
+    """
+    Write-behind store of compare results.
+
+    Subclasses implement _write_batch() and query(); record() is shared and only
+    enqueues.
+    """
+
+    def __init__(self, queue_size: int = HISTORY_QUEUE_SIZE, batch_size: int = HISTORY_BATCH_SIZE,
+                 flush_interval: float = HISTORY_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0, "batches": 0, "write_errors": 0}
+        self._lifecycle = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self.start()
+
+    def start(self):
+        """Start the writer thread; restarts it after close() (e.g. the app is started again)."""
+        with self._lifecycle:
+            if self._writer is not None and self._writer.is_alive() and not self._stop.is_set():
+                return
+            if self._writer is not None:
+                self._writer.join(timeout=10)
+            self._stop = threading.Event()
+            self._writer = threading.Thread(
+                target=self._drain, args=(self._stop,), name="decision-history-writer", daemon=True
+            )
+            self._writer.start()
+
+    def record(self, request: Any, response: Any):
+        """Queue a compare request/response pair for persistence (never blocks)."""
+        if self._stop.is_set():
+            self.start()
+        try:
+            self._queue.put_nowait((time.time(), request, response))
+            self.stats["enqueued"] += 1
+        except queue.Full:
+            self.stats["dropped"] += 1
+
+    def _drain(self, stop: threading.Event):
+        """Writer thread: collect up to batch_size records (or flush_interval) and commit them together."""
+        while not (stop.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=max(remaining, 0)) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+                self.stats["written"] += len(batch)
+                self.stats["batches"] += 1
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                logger.warning(f"Decision history write failed ({len(batch)} records lost): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0):
+        """Block until everything queued so far is written (used by tests and shutdown)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self):
+        """Write what is queued and stop the writer (start() or the next record() restarts it)."""
+        with self._lifecycle:
+            self._stop.set()
+            self._writer.join(timeout=10)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "queue_depth": self._queue.qsize()}
+
+    @abstractmethod
+    def _write_batch(self, batch: list):
+        """Persist [(timestamp, request, response), ...] in one transaction."""
+
+    @abstractmethod
+    def query(
+        self,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+        zone: Optional[str] = None,
+        risk_level: Optional[str] = None,
+        recommended_option: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Newest-first page of decisions; pass the returned next_cursor to continue."""
+
+
+class SQLiteHistoryStore(HistoryStore):
+    """
+    SQLite backend (WAL mode). Decisions are keyed by an increasing id, so keyset
+    pagination is `id < cursor ORDER BY id DESC` on an index - constant cost per
+    page however deep the client scrolls.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at REAL NOT NULL,
+            recommended_option TEXT NOT NULL,
+            decision_status TEXT NOT NULL,
+            request_json TEXT NOT NULL,
+            response_json TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS evaluations (
+            decision_id INTEGER NOT NULL REFERENCES decisions(id),
+            rank INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            growth_score REAL,
+            sustainability_score REAL,
+            composite_score REAL,
+            zone TEXT,
+            risk_level TEXT,
+            tension_severity TEXT,
+            stability_level TEXT,
+            PRIMARY KEY (decision_id, rank)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_decisions_created ON decisions(created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_decisions_recommended ON decisions(recommended_option, id);
+        CREATE INDEX IF NOT EXISTS idx_evaluations_zone ON evaluations(zone, decision_id);
+        CREATE INDEX IF NOT EXISTS idx_evaluations_risk ON evaluations(risk_level, decision_id);
+    """
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self._local = threading.local()
+        connection = self._connect()
+        connection.executescript(self.SCHEMA)
+        connection.commit()
+        super().__init__(**kwargs)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread (writer thread and each request thread)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+        return connection
+
+    def _write_batch(self, batch: list):
+        connection = self._connect()
+        with connection:  # one transaction per batch
+            for created_at, request, response in batch:
+                cursor = connection.execute(
+                    "INSERT INTO decisions (created_at, recommended_option, decision_status, request_json, response_json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        created_at,
+                        response.recommended_option,
+                        response.decision_status,
+                        request.model_dump_json(),
+                        response.model_dump_json(),
+                    ),
+                )
+                connection.executemany(
+                    f"INSERT INTO evaluations (decision_id, rank, {', '.join(EVALUATION_COLUMNS)}) "
+                    f"VALUES (?, ?, {', '.join('?' for _ in EVALUATION_COLUMNS)})",
+                    [
+                        (cursor.lastrowid, rank, *(getattr(evaluation, column) for column in EVALUATION_COLUMNS))
+                        for rank, evaluation in enumerate(response.evaluations)
+                    ],
+                )
+
+    def query(
+        self,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+        zone: Optional[str] = None,
+        risk_level: Optional[str] = None,
+        recommended_option: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        limit = max(1, min(limit, HISTORY_MAX_PAGE_SIZE))
+        where, params = [], []
+        if cursor is not None:
+            where.append("d.id < ?")
+            params.append(cursor)
+        if recommended_option is not None:
+            where.append("d.recommended_option = ?")
+            params.append(recommended_option)
+        if since is not None:
+            where.append("d.created_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("d.created_at < ?")
+            params.append(until)
+        # Option-level filters: some evaluation of the decision matches (index on (column, decision_id))
+        for column, value in (("zone", zone), ("risk_level", risk_level)):
+            if value is not None:
+                where.append(f"EXISTS (SELECT 1 FROM evaluations e WHERE e.decision_id = d.id AND e.{column} = ?)")
+                params.append(value)
+
+        sql = "SELECT d.id, d.created_at, d.response_json FROM decisions d"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY d.id DESC LIMIT ?"
+        rows = self._connect().execute(sql, (*params, limit + 1)).fetchall()
+
+        items = [
+            {"id": row["id"], "created_at": row["created_at"], **json.loads(row["response_json"])}
+            for row in rows[:limit]
+        ]
+        return {"items": items, "next_cursor": items[-1]["id"] if len(rows) > limit else None}
+
+
+_history_store: Optional[HistoryStore] = None
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """Singleton store, or None when DECISION_HISTORY_DB is not set."""
+    global _history_store
+    if _history_store is None and HISTORY_DB_PATH:
+        _history_store = SQLiteHistoryStore(HISTORY_DB_PATH)
+        logger.info(f"🗄️  Decision history enabled at {HISTORY_DB_PATH}")
+    return _history_store
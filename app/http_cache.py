@@ -0,0 +1,101 @@
+"""
+HTTP Conditional Caching - ETags and result reuse for the pure decision endpoints.
+
+/decision/compare and /decision/pareto are deterministic functions of the request
+body and the policy that scores it (profile, scoring engine, penalties, rules
+content). The strong ETag is a hash of exactly those, so it is known before any
+work is done: a matching If-None-Match is answered with 304 immediately, and a
+repeat of a recent request is served from an in-memory LRU of results.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+RESULT_CACHE_SIZE = int(os.getenv("DECISION_RESULT_CACHE_SIZE", "1024"))  # 0 disables result reuse
+
+# Computed results may be stored, but must be revalidated (cheap: 304 without compute)
+DECISION_CACHE_CONTROL = "private, no-cache"
+# History pages behind a cursor only contain older, immutable decisions
+HISTORY_PAGE_CACHE_CONTROL = "private, max-age=300"
+HISTORY_HEAD_CACHE_CONTROL = "private, no-cache"
+LIVE_ANALYTICS_CACHE_CONTROL = "private, max-age=5"
+# Results that depend on machine load (a time-capped estimate) are not reused
+UNREPRODUCIBLE_CACHE_CONTROL = "no-store"
+
+
+def result_etag(endpoint: str, request: Any, policy: Any) -> str:
+    """Strong ETag over the canonical request body and everything that scores it."""
+    digest = hashlib.sha256()
+    for part in (
+        endpoint,
+        policy.profile,
+        policy.scoring.name,
+        repr(tuple(policy.scoring.penalties)),
+        policy.rules.digest,
+        request.model_dump_json(),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def representation_etag(etag: str, media_type: str) -> str:
+    """Strong ETags are per representation: JSON keeps the result ETag, others get a suffix."""
+    if media_type == "application/json":
+        return etag
+    return f'{etag[:-1]}-{media_type.rsplit("/", 1)[-1]}"'
+
+
+def is_reproducible(response: Any) -> bool:
+    """False when a Sobol estimate hit its time cap, so the body depends on machine load."""
+    return not any(
+        e.global_sensitivity is not None and e.global_sensitivity.truncated
+        for e in getattr(response, "evaluations", [])
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored, * matches anything."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ResultCache:
+    """Thread-safe LRU of computed responses keyed by ETag."""
+
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def get(self, etag: str) -> Optional[Any]:
+        with self._lock:
+            result = self._entries.get(etag)
+            if result is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(etag)
+            self.stats["hits"] += 1
+            return result
+
+    def put(self, etag: str, result: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[etag] = result
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries), "maxsize": self.maxsize}
+
+
+result_cache = ResultCache()
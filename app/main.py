@@ -3,28 +3,63 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException
+from typing import Optional
+
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from app.schemas import (
     CompareRequest, 
     CompareResponse, 
     OptionEvaluation,
+    ParetoRequest,
+    ParetoResponse,
+    ParetoEvaluation,
     ReflectionRequest,
     ReflectionResponse
 )
 
-from app.engine.evaluator import normalize_score, composite_score
+from app.config import RulesError
+from app.policy import get_policy, get_policy_stats, UnknownProfileError
 from app.engine.classifier import (
     classify_zone,
     classify_tension,
     classify_risk,
 )
 from app.engine.triggers import generate_triggers
-from app.engine.sensitivity import (
-    perform_sensitivity_analysis,
-    classify_stability,
-)
+from app.engine.sensitivity import classify_stability
 from app.engine.comparator import detect_close_competition
-from app.engine.ai_reflector import get_absolem_wisdom, get_reflector
+from app.engine.pareto import pareto_fronts, dominance_counts
+from app.engine.attribution import attribute_criteria
+from app.engine.global_sensitivity import sobol_indices
+from app.engine.ai_reflector import (
+    get_absolem_wisdom,
+    get_reflector,
+    PREWARM_ENABLED,
+    REFLECT_BUDGET_SECONDS,
+)
+from app.history import get_history_store
+from app.analytics import get_live_analytics
+from app.http_cache import (
+    result_cache,
+    result_etag,
+    representation_etag,
+    etag_matches,
+    is_reproducible,
+    DECISION_CACHE_CONTROL,
+    HISTORY_PAGE_CACHE_CONTROL,
+    HISTORY_HEAD_CACHE_CONTROL,
+    LIVE_ANALYTICS_CACHE_CONTROL,
+    UNREPRODUCIBLE_CACHE_CONTROL,
+)
+from app.content_negotiation import NegotiatedRoute, negotiate
+from app.admission import AdmissionControl, get_admission_stats
+from app.executors import (
+    compare_executor,
+    pareto_executor,
+    reflect_executor,
+    get_executor_stats,
+)
+import json
 import logging
 
 # Configure logging to display INFO level messages
@@ -36,16 +71,37 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 app = FastAPI(title="Burnout-Proof Decision Engine")
+# JSON or MessagePack bodies and responses (Content-Type / Accept) on every route below
+app.router.route_class = NegotiatedRoute
+# Per-route concurrency limits and bounded queues, ahead of the thread pool
+app.add_middleware(AdmissionControl)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize Absolem AI reflector at app startup."""
+    # Compile the default policy (rules + scoring engine) now; a bad config fails startup
+    get_policy()
     reflector = get_reflector()
     if reflector.gemini_available:
         logger.info("✨ Gemini API is available and ready")
     else:
         logger.warning("⚠️  Gemini API not available - using fallback wisdom")
+    history = get_history_store()
+    if history is not None:
+        history.start()  # the writer is stopped by a previous shutdown in this process
+    for executor in (compare_executor, pareto_executor, reflect_executor):
+        executor.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Write out queued decision history and stop the workload executors before the process exits."""
+    history = get_history_store()
+    if history is not None:
+        history.close()
+    for executor in (compare_executor, pareto_executor, reflect_executor):
+        executor.shutdown()
 
 
 @app.get("/")
@@ -53,95 +109,200 @@ def root():
     return {"status": "Deterministic Structural Decision Engine Active"}
 
 
+def _resolve_policy(profile: Optional[str]):
+    """Compiled policy engine for a request's profile (400 if it does not exist)."""
+    try:
+        return get_policy(profile)
+    except UnknownProfileError:
+        raise HTTPException(status_code=400, detail=f"Unknown policy profile '{profile}'.")
+    except RulesError as e:
+        logger.error(f"Policy profile '{profile}' failed to compile: {e}")
+        raise HTTPException(status_code=500, detail=f"Policy profile '{profile}' is misconfigured.")
+
+
 @app.post("/decision/compare", response_model=CompareResponse)
-def compare(request: CompareRequest):
+async def compare(
+    request: CompareRequest,
+    http_response: Response,
+    x_decision_profile: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    accept: Optional[str] = Header(default=None)
+):
+    """
+    Structurally evaluate and rank options.
+
+    Responses carry a strong ETag derived from the request body and the policy
+    that scores it; send it back as If-None-Match to get 304 Not Modified
+    without recomputation. Recently computed results are reused, except when a
+    global sensitivity run hit its time cap (those responses are no-store).
 
+    Accepts and returns MessagePack as well as JSON (Content-Type / Accept:
+    application/msgpack); the ETag differs per representation.
+    """
+    return await compare_executor.run(_compare, request, http_response, x_decision_profile, if_none_match, accept)
+
+
+def _compare(
+    request: CompareRequest,
+    http_response: Response,
+    x_decision_profile: Optional[str],
+    if_none_match: Optional[str],
+    accept: Optional[str]
+):
+    """Body of /decision/compare; runs on the compare executor."""
+    policy = _resolve_policy(request.profile or x_decision_profile)
+    key = result_etag("compare", request, policy)
+    etag = representation_etag(key, negotiate(accept))
+    cache_headers = {"ETag": etag, "Cache-Control": DECISION_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        result_cache.stats["not_modified"] += 1
+        return Response(status_code=304, headers=cache_headers)
+
+    response = result_cache.get(key)
+    if response is None:
+        response = _compare_options(request, policy)
+        if is_reproducible(response):
+            result_cache.put(key, response)
+        else:
+            # A truncated Sobol run can differ on the next request: no reuse, no strong ETag
+            cache_headers = {"Cache-Control": UNREPRODUCIBLE_CACHE_CONTROL}
+    http_response.headers.update(cache_headers)
+    get_live_analytics().record(response)
+
+    # Persisted off the request thread (write-behind); a no-op unless DECISION_HISTORY_DB is set
+    history = get_history_store()
+    if history is not None:
+        history.record(request, response)
+
+    # Clear winners are the decisions users ask Absolem about - warm the cache early
+    if PREWARM_ENABLED and response.decision_status == "CLEAR_WINNER":
+        get_reflector().prewarm(request.options, response.model_dump())
+
+    return response
+
+
+def _check_unique_titles(options):
     # --------------------------------------------------
     # Defensive Constraint: Duplicate Titles Only
     # (Length constraints handled by schema)
     # --------------------------------------------------
-    titles = [o.title for o in request.options]
+    titles = [o.title for o in options]
     if len(set(titles)) != len(titles):
         raise HTTPException(
             status_code=400,
             detail="Duplicate option titles are not allowed."
         )
 
-    evaluations = []
-
-    # --------------------------------------------------
-    # Evaluation Loop
-    # --------------------------------------------------
-    for option in request.options:
-
-        # 1️⃣ Normalized Scores (Weighted Mean → 0-100)
-        growth = normalize_score(option.growth_criteria)
-        sustainability = normalize_score(option.sustainability_criteria)
 
-        # 2️⃣ Tension & Severity
-        tension = abs(growth - sustainability)
-        tension_severity = classify_tension(tension)
-
-        # 3️⃣ Zone Classification
-        zone, zone_reason = classify_zone(growth, sustainability)
-
-        # 4️⃣ Composite Score (Continuous Imbalance Penalty)
-        comp = composite_score(growth, sustainability)
+def _evaluate_option(
+    option,
+    include_attribution: bool = False,
+    include_global_sensitivity: bool = False,
+    policy=None
+) -> OptionEvaluation:
+    # One ruleset and scoring engine for the whole evaluation, even if a reload lands mid-way
+    policy = policy or get_policy()
+    rules, scoring = policy.rules, policy.scoring
+
+    # 1️⃣ Normalized Scores (Weighted Mean → 0-100)
+    growth = scoring.normalize(option.growth_criteria)
+    sustainability = scoring.normalize(option.sustainability_criteria)
+
+    # 2️⃣ Tension & Severity
+    tension = scoring.tension(growth, sustainability)
+    tension_severity = classify_tension(tension, rules)
+
+    # 3️⃣ Zone Classification
+    zone, zone_reason = classify_zone(growth, sustainability, rules)
+
+    # 4️⃣ Composite Score (Continuous Imbalance Penalty)
+    comp = scoring.composite(growth, sustainability)
+
+    # 5️⃣ Structural Risk
+    risk = classify_risk(zone, tension_severity, growth, sustainability, rules)
+
+    # 6️⃣ Triggered Structural Messages
+    triggers = generate_triggers(
+        growth,
+        sustainability,
+        tension,
+        tension_severity,
+        zone,
+        rules
+    )
 
-        # 5️⃣ Structural Risk
-        risk = classify_risk(zone, tension_severity, growth, sustainability)
+    # 7️⃣ Sensitivity Analysis (±20% weight perturbation)
+    growth_sens = scoring.sensitivity(option.growth_criteria)
+    sust_sens = scoring.sensitivity(option.sustainability_criteria)
 
-        # 6️⃣ Triggered Structural Messages
-        triggers = generate_triggers(
-            growth,
-            sustainability,
-            tension,
-            tension_severity,
-            zone
-        )
+    # Extract combined sensitivities (worst-case for each dimension)
+    growth_combined = growth_sens['combined_sensitivity']
+    sust_combined = sust_sens['combined_sensitivity']
+    sensitivity_range = scoring.sensitivity_range(growth_combined, sust_combined)
+    
+    # Build comprehensive breakdown
+    sensitivity_breakdown = (
+        f"Growth robustness: {growth_sens['breakdown']} | "
+        f"Sustainability robustness: {sust_sens['breakdown']}"
+    )
+    
+    stability = classify_stability(sensitivity_range)
 
-        # 7️⃣ Sensitivity Analysis (±20% weight perturbation)
-        growth_sens = perform_sensitivity_analysis(
+    # 8️⃣ Per-Criterion Attribution (optional)
+    attribution = None
+    if include_attribution:
+        attribution = attribute_criteria(
             option.growth_criteria,
-            normalize_score
+            option.sustainability_criteria,
+            scoring.composite
         )
 
-        sust_sens = perform_sensitivity_analysis(
+    # 9️⃣ Global Sensitivity (optional, sample budget and time cap from config)
+    global_sensitivity = None
+    if include_global_sensitivity:
+        global_sensitivity = sobol_indices(
+            option.growth_criteria,
             option.sustainability_criteria,
-            normalize_score
+            penalties=scoring.penalties
         )
 
-        # Extract combined sensitivities (worst-case for each dimension)
-        growth_combined = growth_sens['combined_sensitivity']
-        sust_combined = sust_sens['combined_sensitivity']
-        sensitivity_range = round((growth_combined + sust_combined) / 2, 2)
-        
-        # Build comprehensive breakdown
-        sensitivity_breakdown = (
-            f"Growth robustness: {growth_sens['breakdown']} | "
-            f"Sustainability robustness: {sust_sens['breakdown']}"
-        )
-        
-        stability = classify_stability(sensitivity_range)
-
-        # 8️⃣ Collect Evaluation Result
-        evaluations.append(
-            OptionEvaluation(
-                title=option.title,
-                growth_score=growth,
-                sustainability_score=sustainability,
-                tension_index=tension,
-                tension_severity=tension_severity,
-                zone=zone,
-                zone_reason=zone_reason,
-                composite_score=comp,
-                risk_level=risk,
-                triggered_messages=triggers,
-                sensitivity_range=sensitivity_range,
-                stability_level=stability,
-                sensitivity_breakdown=sensitivity_breakdown
-            )
+    # 🔟 Collect Evaluation Result
+    return OptionEvaluation(
+        title=option.title,
+        growth_score=growth,
+        sustainability_score=sustainability,
+        tension_index=tension,
+        tension_severity=tension_severity,
+        zone=zone,
+        zone_reason=zone_reason,
+        composite_score=comp,
+        risk_level=risk,
+        triggered_messages=triggers,
+        sensitivity_range=sensitivity_range,
+        stability_level=stability,
+        sensitivity_breakdown=sensitivity_breakdown,
+        criterion_attribution=attribution,
+        global_sensitivity=global_sensitivity
+    )
+
+
+def _compare_options(request: CompareRequest, policy=None) -> CompareResponse:
+    _check_unique_titles(request.options)
+    policy = policy or get_policy()
+    rules = policy.rules
+
+    # --------------------------------------------------
+    # Evaluation Loop
+    # --------------------------------------------------
+    evaluations = [
+        _evaluate_option(
+            option,
+            request.include_attribution,
+            request.include_global_sensitivity,
+            policy
         )
+        for option in request.options
+    ]
 
     # --------------------------------------------------
     # Sort by Composite Score (Descending)
@@ -168,22 +329,24 @@ def compare(request: CompareRequest):
     # --------------------------------------------------
     # Multi-Option Mode
     # --------------------------------------------------
-    # Check if all options are below viability threshold (40) FIRST
+    # Check if all options are below viability threshold (40 by default) FIRST
     # This is more critical than CLOSE_COMPETITION
-    if all(opt.composite_score < 40 for opt in sorted_options):
+    viability = rules.viability_threshold
+    if all(opt.composite_score < viability for opt in sorted_options):
         return CompareResponse(
             evaluations=sorted_options,
             recommended_option="NONE_VIABLE",
             decision_status="ALL_OPTIONS_POOR_FIT",
-            recommendation_reason="All options score below viability threshold (40). No viable option exists—consider redesigning the problem."
+            recommendation_reason=f"All options score below viability threshold ({viability:g}). No viable option exists—consider redesigning the problem."
         )
 
-    if detect_close_competition(sorted_options):
+    margin = rules.close_competition_margin
+    if detect_close_competition(sorted_options, request.options, margin, policy.scoring.penalties):
         return CompareResponse(
             evaluations=sorted_options,
             recommended_option="NO_CLEAR_WINNER",
             decision_status="CLOSE_COMPETITION",
-            recommendation_reason="Top options have very similar composite scores."
+            recommendation_reason=f"Top options have very similar composite scores: changing a single weight or impact by less than {margin:g} point(s) would swap them."
         )
 
     winner = sorted_options[0]
@@ -196,8 +359,136 @@ def compare(request: CompareRequest):
     )
 
 
+@app.post("/decision/pareto", response_model=ParetoResponse)
+async def pareto(
+    request: ParetoRequest,
+    http_response: Response,
+    x_decision_profile: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    accept: Optional[str] = Header(default=None)
+):
+    """
+    Growth vs sustainability dominance analysis for large option sets.
+
+    Each option is evaluated exactly as in /decision/compare, then placed on a
+    non-dominated front (0 = Pareto frontier) with counts of the options it
+    dominates and is dominated by. O(n log n) in the number of options.
+    ETag / If-None-Match work as for /decision/compare.
+    """
+    return await pareto_executor.run(_pareto, request, http_response, x_decision_profile, if_none_match, accept)
+
+
+def _pareto(
+    request: ParetoRequest,
+    http_response: Response,
+    x_decision_profile: Optional[str],
+    if_none_match: Optional[str],
+    accept: Optional[str]
+):
+    """Body of /decision/pareto; runs on the pareto executor."""
+    policy = _resolve_policy(request.profile or x_decision_profile)
+    key = result_etag("pareto", request, policy)
+    etag = representation_etag(key, negotiate(accept))
+    cache_headers = {"ETag": etag, "Cache-Control": DECISION_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        result_cache.stats["not_modified"] += 1
+        return Response(status_code=304, headers=cache_headers)
+    http_response.headers.update(cache_headers)
+
+    cached = result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    _check_unique_titles(request.options)
+    evaluations = [_evaluate_option(option, policy=policy) for option in request.options]
+
+    points = [(e.growth_score, e.sustainability_score) for e in evaluations]
+    fronts = pareto_fronts(points)
+    dominates, dominated_by = dominance_counts(points)
+
+    ranked = sorted(
+        (
+            ParetoEvaluation(
+                **evaluation.model_dump(),
+                front_index=front,
+                dominates_count=wins,
+                dominated_by_count=losses,
+            )
+            for evaluation, front, wins, losses in zip(evaluations, fronts, dominates, dominated_by)
+        ),
+        key=lambda e: (e.front_index, -e.composite_score)
+    )
+
+    titles_by_front = [[] for _ in range(max(fronts) + 1)]
+    for evaluation in ranked:
+        titles_by_front[evaluation.front_index].append(evaluation.title)
+
+    response = ParetoResponse(
+        evaluations=ranked,
+        fronts=titles_by_front,
+        frontier=titles_by_front[0]
+    )
+    result_cache.put(key, response)
+    return response
+
+
+@app.get("/decision/history")
+def decision_history(
+    http_response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[int] = Query(default=None, ge=1),
+    zone: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    recommended_option: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+):
+    """
+    Past /decision/compare results, newest first.
+
+    Keyset pagination: pass the returned `next_cursor` as `cursor` for the next
+    page (null on the last page). `zone` and `risk_level` match decisions where
+    any option has that value; `since`/`until` are Unix timestamps.
+    """
+    history = get_history_store()
+    if history is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Decision history is disabled. Set DECISION_HISTORY_DB to enable it."
+        )
+    # Pages behind a cursor hold only older decisions, which never change
+    http_response.headers["Cache-Control"] = (
+        HISTORY_PAGE_CACHE_CONTROL if cursor is not None else HISTORY_HEAD_CACHE_CONTROL
+    )
+    return history.query(
+        limit=limit,
+        cursor=cursor,
+        zone=zone,
+        risk_level=risk_level,
+        recommended_option=recommended_option,
+        since=since,
+        until=until,
+    )
+
+
+@app.get("/analytics/live")
+def live_analytics(http_response: Response):
+    """
+    Rolling distributions of compare results over the last 1 minute, 1 hour and 24 hours.
+
+    Per window: p50/p90/p99 of composite, growth and sustainability scores,
+    tension index and sensitivity range (1% relative accuracy), plus zone and
+    risk level counts. Kept in memory per worker process; resets on restart.
+    """
+    http_response.headers["Cache-Control"] = LIVE_ANALYTICS_CACHE_CONTROL
+    return get_live_analytics().snapshot()
+
+
 @app.post("/decision/reflect", response_model=ReflectionResponse)
-def reflect(request: ReflectionRequest):
+async def reflect(
+    request: ReflectionRequest,
+    x_reflection_budget_ms: Optional[int] = Header(default=None, ge=0, le=120000)
+):
     """
     Get Absolem's philosophical wisdom on the decision.
     
@@ -210,18 +501,34 @@ def reflect(request: ReflectionRequest):
     - Falls back to default wisdom if API unavailable
     - Caches responses to reduce API calls
     - Monitors usage statistics
+    - Latency budget (`latency_budget_ms` field or `X-Reflection-Budget-Ms` header):
+      past it, provisional fallback wisdom is returned and the model call
+      finishes in the background to fill the cache
+    - MessagePack bodies and responses (application/msgpack) as for /decision/compare
     """
+    return await reflect_executor.run(_reflect, request, x_reflection_budget_ms)
+
+
+def _reflect(request: ReflectionRequest, x_reflection_budget_ms: Optional[int]):
+    """Body of /decision/reflect; runs on the reflect executor."""
     try:
+        budget_ms = request.latency_budget_ms
+        if budget_ms is None:
+            budget_ms = x_reflection_budget_ms
+        budget_seconds = REFLECT_BUDGET_SECONDS if budget_ms is None else budget_ms / 1000
+
         # Get Absolem's wisdom using reflection engine
         wisdom = get_absolem_wisdom(
             options=request.options,
-            comparison_result=request.comparison_result
+            comparison_result=request.comparison_result,
+            budget_seconds=budget_seconds
         )
         
         return ReflectionResponse(
             action_plan=wisdom.get("action_plan", []),
             philosophical_advice=wisdom.get("philosophical_advice", "Choose what sustains your spirit."),
-            source=wisdom.get("source", "Unknown")
+            source=wisdom.get("source", "Unknown"),
+            provisional=wisdom.get("provisional", False)
         )
     
     except Exception as e:
@@ -239,6 +546,38 @@ def reflect(request: ReflectionRequest):
         )
 
 
+@app.post("/decision/reflect/stream")
+def reflect_stream(request: ReflectionRequest):
+    """
+    Stream Absolem's wisdom as server-sent events.
+    
+    Event types:
+    - token: raw model text as it arrives
+    - wisdom: philosophical advice, once the WISDOM section is complete
+    - step: each action step as it completes
+    - error: the model failed mid-stream; a done event with fallback wisdom follows
+    - done: final result (same shape as /decision/reflect), also written to the cache
+    
+    Cache hits and fallbacks are replayed as wisdom/step/done events.
+    """
+    reflector = get_reflector()
+
+    def event_source():
+        try:
+            for event, data in reflector.stream_reflection(request.options, request.comparison_result):
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        except Exception as e:
+            from app.engine.ai_reflector import ABSOLEM_FALLBACK_WISDOM
+            logger.error(f"Streaming reflection error: {e}. Using fallback wisdom.")
+            yield f"event: done\ndata: {json.dumps(ABSOLEM_FALLBACK_WISDOM)}\n\n"
+
+    return StreamingResponse(
+        reflect_executor.iterate(event_source()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @app.get("/stats")
 def get_stats():
     """
@@ -247,9 +586,17 @@ def get_stats():
     """
     from app.engine.ai_reflector import get_reflector
     reflector = get_reflector()
+    history = get_history_store()
+    rules = get_policy().rules
     
     return {
         "ai_reflection_stats": reflector.get_usage_stats(),
+        "decision_history_stats": history.snapshot() if history is not None else None,
+        "decision_rules": {"version": rules.version, "table_cells": rules.cell_count},
+        "policy_profiles": get_policy_stats(),
+        "result_cache": result_cache.snapshot(),
+        "admission_control": get_admission_stats(),
+        "executors": get_executor_stats(),
         "message": "Monitor these stats to ensure you stay within Gemini's free tier (1500 requests/day)"
     }
 
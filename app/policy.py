@@ -0,0 +1,143 @@
+"""
+Policy Profiles - per-organization thresholds and composite penalties.
+
+A profile (app/profiles.json, or DECISION_PROFILES_PATH) overrides top-level
+sections of the decision rules ("zones", "risks", "close_competition_margin", ...)
+and/or the composite_score penalty coefficients:
+
+    {"profiles": {"startup": {"composite_penalties": {"growth_dominant": 0.2},
+                              "rules": {"close_competition_margin": 0.5}}}}
+
+Requests pick a profile by name. Each profile is compiled once into a
+PolicyEngine (decision tables + bound scoring kernels) and kept in an LRU, so
+switching profiles per request is a dictionary hit. Entries are rebuilt when the
+base rules or the profiles file change.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import app.config as config
+from app.config import CompiledRules, RulesError, compile_rules, get_rules
+from app.engine.evaluator import CompositePenalties
+from app.engine.scoring import ScoringEngine, get_scoring_engine
+
+logger = logging.getLogger(__name__)
+
+PROFILES_PATH = Path(os.getenv("DECISION_PROFILES_PATH", str(Path(__file__).parent / "profiles.json")))
+PROFILE_CACHE_SIZE = int(os.getenv("DECISION_PROFILE_CACHE_SIZE", "32"))
+DEFAULT_PROFILE = "default"
+
+
+class UnknownProfileError(KeyError):
+    """The requested policy profile is not defined."""
+
+
+class PolicyEngine(NamedTuple):
+    profile: str
+    rules: CompiledRules
+    scoring: ScoringEngine
+
+
+def _penalties(overrides: Dict[str, float]) -> CompositePenalties:
+    """Profile penalties; each score must still raise the composite everywhere on 0-100."""
+    penalties = CompositePenalties()._replace(**overrides)
+    for own in (penalties.growth_dominant, penalties.sustainability_dominant):
+        if min(penalties) < 0 or own + 2 * penalties.quadratic >= 0.5:
+            raise RulesError(
+                "composite_penalties must be >= 0 with each asymmetric penalty + 2 * quadratic < 0.5"
+            )
+    return penalties
+
+
+class _ProfileCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._engines: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Any] = {}
+        self._profiles_mtime: Optional[float] = None
+        self._next_check = 0.0
+        self.stats = {"hits": 0, "compiles": 0, "evictions": 0}
+
+    def _profiles_document(self) -> Dict[str, Any]:
+        """Profiles file contents, re-read when its mtime changes (checked like the rules file)."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._profiles
+        self._next_check = now + config.RULES_RELOAD_SECONDS
+        try:
+            mtime = PROFILES_PATH.stat().st_mtime
+        except OSError:
+            mtime = None
+        if mtime != self._profiles_mtime:
+            profiles = {}
+            if mtime is not None:
+                try:
+                    with open(PROFILES_PATH, "r", encoding="utf-8") as f:
+                        profiles = json.load(f)["profiles"]
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"❌ Could not read policy profiles, keeping previous ones: {e}")
+                    profiles = self._profiles
+            with self._lock:
+                self._profiles, self._profiles_mtime = profiles, mtime
+                self._engines.clear()
+        return self._profiles
+
+    def _compile(self, name: str, base: CompiledRules, profile: Dict[str, Any]) -> PolicyEngine:
+        rules = base
+        if profile.get("rules"):
+            with open(config.RULES_PATH, "r", encoding="utf-8") as f:
+                document = json.load(f)
+            document.update(profile["rules"])
+            document["version"] = f"{base.version}+{name}"
+            rules = compile_rules(document)
+        scoring = get_scoring_engine(penalties=_penalties(profile.get("composite_penalties", {})))
+        return PolicyEngine(name, rules, scoring)
+
+    def get(self, name: Optional[str]) -> PolicyEngine:
+        base = get_rules()
+        name = name or DEFAULT_PROFILE
+        profiles = self._profiles_document()
+        if name != DEFAULT_PROFILE and name not in profiles:
+            raise UnknownProfileError(name)
+
+        with self._lock:
+            entry = self._engines.get(name)
+            if entry is not None and entry[0] is base:
+                self._engines.move_to_end(name)
+                self.stats["hits"] += 1
+                return entry[1]
+
+        engine = self._compile(name, base, profiles.get(name, {}))
+        with self._lock:
+            self._engines[name] = (base, engine)
+            self._engines.move_to_end(name)
+            self.stats["compiles"] += 1
+            while len(self._engines) > self.maxsize:
+                self._engines.popitem(last=False)
+                self.stats["evictions"] += 1
+        logger.info(f"📐 Policy profile '{name}' compiled (rules '{engine.rules.version}')")
+        return engine
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "cached": list(self._engines), "profiles": sorted(self._profiles)}
+
+
+_cache = _ProfileCache(PROFILE_CACHE_SIZE)
+
+
+def get_policy(profile: Optional[str] = None) -> PolicyEngine:
+    """Compiled engine for a profile (None = default); raises UnknownProfileError or RulesError."""
+    return _cache.get(profile)
+
+
+def get_policy_stats() -> Dict[str, Any]:
+    return _cache.snapshot()
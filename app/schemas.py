@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List
+from typing import List, Optional
 
 
 # ----------------------------
@@ -26,14 +26,39 @@ class Criterion(BaseModel):
         return self
 
 
+def _criteria_dicts(weights, impacts) -> List[dict]:
+    """Positional criteria -> the verbose form, so the core validator checks every bound in one pass."""
+    if len(weights) != len(impacts):
+        raise ValueError("'weights' and 'impacts' must have the same length")
+    return [{"weight": w, "impact": i} for w, i in zip(weights, impacts)]
+
+
 # ----------------------------
 # Decision Option Input Model
 # ----------------------------
 class DecisionOption(BaseModel):
+    """
+    Criteria lists accept three encodings, all producing the same option:
+    [{"weight": w, "impact": i}, ...], [[w, i], ...] or {"weights": [...], "impacts": [...]}.
+    """
     title: str = Field(..., min_length=1, max_length=100)
     growth_criteria: List[Criterion]
     sustainability_criteria: List[Criterion]
 
+    @field_validator("growth_criteria", "sustainability_criteria", mode="before")
+    @classmethod
+    def expand_positional(cls, value):
+        if isinstance(value, dict) and set(value) == {"weights", "impacts"}:
+            weights, impacts = value["weights"], value["impacts"]
+            if not isinstance(weights, list) or not isinstance(impacts, list):
+                raise ValueError("'weights' and 'impacts' must be arrays")
+            return _criteria_dicts(weights, impacts)
+        if isinstance(value, list) and value and isinstance(value[0], (list, tuple)):
+            if not all(isinstance(c, (list, tuple)) and len(c) == 2 for c in value):
+                raise ValueError("Positional criteria must be [weight, impact] pairs")
+            return [{"weight": w, "impact": i} for w, i in value]
+        return value
+
     @field_validator("growth_criteria", "sustainability_criteria")
     @classmethod
     def validate_non_empty(cls, value):
@@ -57,6 +82,49 @@ class DecisionOption(BaseModel):
 # ----------------------------
 class CompareRequest(BaseModel):
     options: List[DecisionOption] = Field(..., min_length=1, max_length=5)
+    include_attribution: bool = False  # per-criterion fragility ranking on each evaluation
+    include_global_sensitivity: bool = False  # Sobol indices per criterion input on each evaluation
+    profile: Optional[str] = Field(default=None, max_length=64)  # policy profile (or X-Decision-Profile header)
+
+
+# ----------------------------
+# Pareto Analysis Request Model
+# ----------------------------
+class ParetoRequest(BaseModel):
+    """Large candidate sets (e.g. every course/project combination) for dominance analysis."""
+    options: List[DecisionOption] = Field(..., min_length=1, max_length=5000)
+    profile: Optional[str] = Field(default=None, max_length=64)  # policy profile (or X-Decision-Profile header)
+
+
+# ----------------------------
+# Per-Criterion Attribution
+# ----------------------------
+class CriterionAttribution(BaseModel):
+    dimension: str                                   # "growth" | "sustainability"
+    criterion_index: int                             # position in that criteria list
+    weight: float
+    impact: int
+    removal_score_delta: Optional[float]             # dimension score change without it (None if it is the only weight)
+    removal_composite_delta: Optional[float]
+    perturbation_score_swing: float                  # spread over ±20% weight / ±15% impact of this criterion
+    perturbation_composite_swing: float
+
+
+# ----------------------------
+# Global (Sobol) Sensitivity
+# ----------------------------
+class InputSensitivity(BaseModel):
+    dimension: str          # "growth" | "sustainability"
+    criterion_index: int
+    parameter: str          # "weight" | "impact"
+    first_order: float      # share of composite variance explained by this input alone
+    total_effect: float     # share including its interactions with other inputs
+
+
+class GlobalSensitivity(BaseModel):
+    indices: List[InputSensitivity]  # largest total effect first
+    samples: int                     # composite evaluations used
+    truncated: bool                  # time cap reached before the sample budget
 
 
 # ----------------------------
@@ -76,6 +144,8 @@ class OptionEvaluation(BaseModel):
     sensitivity_range: float
     stability_level: str
     sensitivity_breakdown: str = "Sensitivity analysis breakdown"
+    criterion_attribution: Optional[List[CriterionAttribution]] = None  # most fragile first; with include_attribution
+    global_sensitivity: Optional[GlobalSensitivity] = None  # with include_global_sensitivity
 
 
 # ----------------------------
@@ -88,6 +158,21 @@ class CompareResponse(BaseModel):
     recommendation_reason: str
 
 
+# ----------------------------
+# Pareto Analysis Response
+# ----------------------------
+class ParetoEvaluation(OptionEvaluation):
+    front_index: int          # 0 = on the growth/sustainability Pareto frontier
+    dominates_count: int      # options this one beats on both axes
+    dominated_by_count: int   # options that beat this one on both axes
+
+
+class ParetoResponse(BaseModel):
+    evaluations: List[ParetoEvaluation]  # by front, then composite score (descending)
+    fronts: List[List[str]]              # option titles per front
+    frontier: List[str]                  # titles on front 0
+
+
 # ----------------------------
 # AI Reflection Request & Response
 # ----------------------------
@@ -95,10 +180,12 @@ class ReflectionRequest(BaseModel):
     """Request for Absolem's reflective wisdom."""
     options: List[DecisionOption]
     comparison_result: dict  # Flexible dict instead of strict CompareResponse
+    latency_budget_ms: Optional[int] = Field(default=None, ge=0, le=120000)  # 0 = wait for the model
 
 
 class ReflectionResponse(BaseModel):
     """Absolem's philosophical wisdom with action plan for burnout prevention."""
     action_plan: List[str]
     philosophical_advice: str
-    source: str
\ No newline at end of file
+    source: str
+    provisional: bool = False  # True when the latency budget ran out; retry shortly for the real answer
\ No newline at end of file
@@ -210,7 +210,8 @@ def call_reflection(options: List[Dict], comparison_result: Dict) -> Dict:
     try:
         payload = {
             "options": options,
-            "comparison_result": comparison_result
+            "comparison_result": comparison_result,
+            "latency_budget_ms": 12000  # Backend answers (provisionally if needed) before our timeout
         }
         
         response = requests.post(
@@ -809,6 +810,8 @@ def render_phase_3():
         
         with col1:
             st.caption(f"*Source: {reflection.get('source', 'Unknown')}*")
+            if reflection.get('provisional'):
+                st.caption("*Absolem is still contemplating - ask again in a few seconds for fuller wisdom.*")
     
     st.divider()
     
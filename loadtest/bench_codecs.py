@@ -0,0 +1,138 @@
+"""
+Codec Benchmark - JSON vs MessagePack for the decision API payloads.
+
+Times the encode/decode work each side of /decision/compare and /decision/pareto
+does per request, following the same code paths as the server:
+    request:  JSON  -> json.loads (FastAPI's JSON body path)
+              msgpack -> msgpack.unpackb, re-encoded to JSON and parsed by that same path
+    response: JSON  -> pydantic dump to JSON bytes (FastAPI's response fast path)
+              msgpack -> pydantic dump to Python + msgpack.packb
+and the client's matching encode/decode (json.dumps/loads vs packb/unpackb).
+Schema validation runs on the decoded objects either way; its cost is reported
+once for scale.
+
+Usage:
+    python -m loadtest.bench_codecs --bulk-options 2000 --repeat 200
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict
+
+import msgpack
+
+from app.main import _compare_options, _evaluate_option
+from app.schemas import CompareRequest, ParetoRequest, ParetoEvaluation, ParetoResponse
+
+
+def build_options(count: int, criteria: int, seed: int = 7):
+    rng = random.Random(seed)
+
+    def criteria_list():
+        return [{"weight": round(rng.uniform(1, 10), 1), "impact": rng.randint(0, 10)} for _ in range(criteria)]
+
+    return [
+        {"title": f"Option {i}", "growth_criteria": criteria_list(), "sustainability_criteria": criteria_list()}
+        for i in range(count)
+    ]
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Best per-call time in microseconds over `repeat` rounds (each round sized to ~1ms)."""
+    start = time.perf_counter()
+    fn()
+    loops = max(1, int(0.001 / max(time.perf_counter() - start, 1e-7)))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best * 1e6
+
+
+def bench_payload(name: str, request_model, payload: Dict, response, repeat: int) -> Dict:
+    response_python = response.model_dump(mode="json")
+    request_json, request_msgpack = json.dumps(payload).encode(), msgpack.packb(payload)
+    response_json, response_msgpack = response.model_dump_json().encode(), msgpack.packb(response_python)
+    return {
+        "name": name,
+        "bytes": {
+            "request": (len(request_json), len(request_msgpack)),
+            "response": (len(response_json), len(response_msgpack)),
+        },
+        "server_us": {
+            "decode request": (
+                best_of(lambda: json.loads(request_json), repeat),
+                best_of(lambda: json.loads(json.dumps(msgpack.unpackb(request_msgpack), separators=(",", ":"))), repeat),
+            ),
+            "encode response": (
+                best_of(lambda: response.model_dump_json(), repeat),
+                best_of(lambda: msgpack.packb(response.model_dump(mode="json")), repeat),
+            ),
+        },
+        "validate_us": best_of(lambda: request_model.model_validate(payload), repeat),
+        "client_us": {
+            "encode request": (
+                best_of(lambda: json.dumps(payload).encode(), repeat),
+                best_of(lambda: msgpack.packb(payload), repeat),
+            ),
+            "decode response": (
+                best_of(lambda: json.loads(response_json), repeat),
+                best_of(lambda: msgpack.unpackb(response_msgpack), repeat),
+            ),
+        },
+    }
+
+
+def pareto_response(request: ParetoRequest) -> ParetoResponse:
+    """A realistic /decision/pareto response shape (front data is not what is being timed)."""
+    evaluations = [
+        ParetoEvaluation(**_evaluate_option(o).model_dump(), front_index=0, dominates_count=0, dominated_by_count=0)
+        for o in request.options
+    ]
+    titles = [e.title for e in evaluations]
+    return ParetoResponse(evaluations=evaluations, fronts=[titles], frontier=titles)
+
+
+def print_report(results):
+    print("=" * 78)
+    print("JSON vs MESSAGEPACK (best of runs, microseconds per call)")
+    print("=" * 78)
+    for result in results:
+        print(f"\n{result['name']}")
+        for label, (as_json, as_msgpack) in result["bytes"].items():
+            print(f"  {label + ' bytes':<28} json {as_json:>10,} | msgpack {as_msgpack:>10,} "
+                  f"({as_msgpack / as_json:.0%})")
+        for side in ("server_us", "client_us"):
+            for label, (as_json, as_msgpack) in result[side].items():
+                print(f"  {side[:6]} {label:<21} json {as_json:>10.1f} | msgpack {as_msgpack:>10.1f} "
+                      f"({as_json / as_msgpack:.2f}x)")
+        print(f"  schema validation (same for both) {result['validate_us']:>10.1f}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs MessagePack for decision payloads")
+    parser.add_argument("--bulk-options", type=int, default=2000, help="Options in the bulk pareto payload")
+    parser.add_argument("--criteria", type=int, default=4, help="Criteria per dimension")
+    parser.add_argument("--repeat", type=int, default=50, help="Timing rounds (best is reported)")
+    args = parser.parse_args()
+
+    typical = {"options": build_options(3, args.criteria)}
+    typical_request = CompareRequest.model_validate(typical)
+    bulk = {"options": build_options(args.bulk_options, args.criteria)}
+    bulk_request = ParetoRequest.model_validate(bulk)
+
+    print_report([
+        bench_payload("Typical /decision/compare (3 options)", CompareRequest, typical,
+                      _compare_options(typical_request), args.repeat),
+        bench_payload(f"Bulk /decision/pareto ({args.bulk_options} options)", ParetoRequest, bulk,
+                      pareto_response(bulk_request), max(3, args.repeat // 10)),
+    ])
+
+
+if __name__ == "__main__":
+    main()
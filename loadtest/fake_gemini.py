@@ -0,0 +1,142 @@
+"""
+Fake Gemini Model Server - Local stand-in for load testing the reflection layer.
+
+Serves WISDOM/STEPS completions with a configurable latency distribution,
+429 injection rate and response templates, so retry/backoff and caching can
+be tuned without spending real Gemini quota.
+
+Usage:
+    python -m loadtest.fake_gemini --port 8001 --latency-median 0.8 --latency-sigma 0.5 --error-rate 0.1
+
+Then run the backend against it:
+    ABSOLEM_MODEL_BACKEND=stub ABSOLEM_STUB_URL=http://localhost:8001 python -m uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+DEFAULT_TEMPLATES = [
+    "WISDOM:\n'{option}' asks much of you; growth that costs your rest is borrowed, not earned. "
+    "Let the choice serve the person you are becoming, not only the résumé.\n\n"
+    "STEPS:\n1. Block recovery time before committing to deadlines\n"
+    "2. Define a weekly hours ceiling for '{option}'\n"
+    "3. Review your energy every Sunday and adjust\n",
+    "WISDOM:\nA path worth walking is one you can still walk next month. "
+    "'{option}' is sound if you guard the quiet hours it threatens.\n\n"
+    "STEPS:\n1. Name the one commitment you will drop to make room\n"
+    "2. Protect sleep as a non-negotiable\n"
+    "3. Share your plan with someone who will check in\n"
+    "4. Re-evaluate after four weeks\n",
+]
+
+
+@dataclass
+class FakeModelConfig:
+    """Behaviour knobs for the fake model server."""
+    latency_median: float = 0.8      # seconds, median of the lognormal latency
+    latency_sigma: float = 0.5       # lognormal shape; 0 gives fixed latency
+    error_rate: float = 0.0          # fraction of requests answered with 429
+    chunk_delay: float = 0.05        # seconds between streamed chunks
+    templates: List[str] = field(default_factory=lambda: list(DEFAULT_TEMPLATES))
+    seed: Optional[int] = None
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency_sigma <= 0:
+            return self.latency_median
+        return rng.lognormvariate(0, self.latency_sigma) * self.latency_median
+
+
+class PromptRequest(BaseModel):
+    prompt: str
+
+
+def _render(template: str, prompt: str) -> str:
+    """Fill the template with the option title quoted in the prompt."""
+    match = re.search(r"considering: '(.+?)'", prompt)
+    return template.format(option=match.group(1) if match else "this choice")
+
+
+def create_app(config: Optional[FakeModelConfig] = None) -> FastAPI:
+    """Build the fake model server."""
+    config = config or FakeModelConfig()
+    rng = random.Random(config.seed)
+    stats = {"requests": 0, "rate_limited": 0}
+    app = FastAPI(title="Fake Gemini Model Server")
+
+    def rate_limited() -> bool:
+        stats["requests"] += 1
+        if rng.random() < config.error_rate:
+            stats["rate_limited"] += 1
+            return True
+        return False
+
+    def quota_error() -> JSONResponse:
+        return JSONResponse(status_code=429, content={"error": "429 Resource has been exhausted (e.g. check quota)."})
+
+    @app.post("/generate")
+    async def generate(request: PromptRequest):
+        await asyncio.sleep(config.sample_latency(rng))
+        if rate_limited():
+            return quota_error()
+        return {"text": _render(rng.choice(config.templates), request.prompt)}
+
+    @app.post("/stream")
+    async def stream(request: PromptRequest):
+        # Latency to first token only; the rest trickles out per chunk
+        await asyncio.sleep(config.sample_latency(rng) / 4)
+        if rate_limited():
+            return quota_error()
+        text = _render(rng.choice(config.templates), request.prompt)
+
+        async def chunks():
+            for start in range(0, len(text), 24):
+                yield text[start:start + 24]
+                await asyncio.sleep(config.chunk_delay)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/stats")
+    def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Gemini model server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-median", type=float, default=0.8, help="Median latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Lognormal sigma (0 = fixed latency)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--chunk-delay", type=float, default=0.05, help="Seconds between streamed chunks")
+    parser.add_argument("--templates", help="JSON file with a list of response templates ({option} placeholder)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = FakeModelConfig(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        chunk_delay=args.chunk_delay,
+        seed=args.seed,
+    )
+    if args.templates:
+        with open(args.templates, "r") as f:
+            config.templates = json.load(f)
+
+    import uvicorn
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
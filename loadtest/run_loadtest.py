@@ -0,0 +1,166 @@
+"""
+Reflection Layer Load Test - asyncio harness for /decision/compare + /decision/reflect.
+
+Each virtual user compares a decision and then asks Absolem about it, the same
+sequence the Streamlit frontend runs. Decisions are drawn from a fixed pool so
+repeat visits exercise the reflection cache.
+
+Usage (against a backend started with ABSOLEM_MODEL_BACKEND=stub; the backend
+keeps production per-minute pacing unless it is started with ABSOLEM_RPM_LIMIT=0):
+    python -m loadtest.run_loadtest --url http://localhost:8000 --users 20 --requests 200 --distinct 25
+
+Reports throughput, latency percentiles per endpoint, cache hit ratio and fallback rate.
+A reflection counts as a fallback when it is not a model answer: fallback or local
+wisdom, provisional (latency budget ran out) or degraded by admission control.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+import httpx
+
+# Answers that did not come from the model, by source
+NON_MODEL_SOURCES = {
+    "Absolem's Fallback Wisdom": "fallback",
+    "Absolem's Local Wisdom": "local",
+}
+
+
+def classify_reflection(response: httpx.Response) -> str:
+    """'model', or why the answer is a stand-in: degraded (admission), provisional (budget), local, fallback."""
+    body = response.json()
+    if response.headers.get("x-admission") == "degraded":
+        return "degraded"
+    if body.get("provisional"):
+        return "provisional"
+    return NON_MODEL_SOURCES.get(body.get("source"), "model")
+
+
+def build_decision_pool(distinct: int, seed: int = 7) -> List[Dict]:
+    """Generate a fixed pool of two-option compare payloads."""
+    rng = random.Random(seed)
+
+    def criteria():
+        return [
+            {"weight": rng.randint(1, 10), "impact": rng.randint(1, 10)}
+            for _ in range(rng.randint(1, 4))
+        ]
+
+    return [
+        {
+            "options": [
+                {"title": f"Plan {i}-A", "growth_criteria": criteria(), "sustainability_criteria": criteria()},
+                {"title": f"Plan {i}-B", "growth_criteria": criteria(), "sustainability_criteria": criteria()},
+            ]
+        }
+        for i in range(distinct)
+    ]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+async def run(url: str, users: int, total_requests: int, distinct: int, timeout: float) -> Dict:
+    """Drive the API with `users` concurrent virtual users until `total_requests` flows finish."""
+    pool = build_decision_pool(distinct)
+    latencies: Dict[str, List[float]] = {"compare": [], "reflect": []}
+    outcomes = {"flows": 0, "errors": 0, "fallbacks": 0}
+    fallback_kinds: Dict[str, int] = {}
+    remaining = iter(range(total_requests))
+
+    async with httpx.AsyncClient(base_url=url, timeout=timeout) as client:
+        stats_before = (await client.get("/stats")).json()["ai_reflection_stats"]
+
+        async def user(user_id: int):
+            rng = random.Random(user_id)
+            for _ in remaining:
+                payload = rng.choice(pool)
+                try:
+                    start = time.perf_counter()
+                    compared = await client.post("/decision/compare", json=payload)
+                    latencies["compare"].append(time.perf_counter() - start)
+                    compared.raise_for_status()
+
+                    start = time.perf_counter()
+                    reflected = await client.post(
+                        "/decision/reflect",
+                        json={"options": payload["options"], "comparison_result": compared.json()}
+                    )
+                    latencies["reflect"].append(time.perf_counter() - start)
+                    reflected.raise_for_status()
+
+                    outcomes["flows"] += 1
+                    kind = classify_reflection(reflected)
+                    if kind != "model":
+                        outcomes["fallbacks"] += 1
+                        fallback_kinds[kind] = fallback_kinds.get(kind, 0) + 1
+                except httpx.HTTPError:
+                    outcomes["errors"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user(i) for i in range(users)))
+        elapsed = time.perf_counter() - started
+
+        stats_after = (await client.get("/stats")).json()["ai_reflection_stats"]
+
+    reflect_calls = stats_after["total_calls"] - stats_before["total_calls"]
+    cache_hits = stats_after["cached_calls"] - stats_before["cached_calls"]
+
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "throughput_flows_per_s": round(outcomes["flows"] / elapsed, 2) if elapsed else 0,
+        "flows": outcomes["flows"],
+        "errors": outcomes["errors"],
+        "latency_ms": {
+            endpoint: {
+                f"p{pct}": round(percentile(samples, pct) * 1000, 1)
+                for pct in (50, 90, 99)
+            }
+            for endpoint, samples in latencies.items()
+        },
+        "cache_hit_ratio": round(cache_hits / reflect_calls, 3) if reflect_calls else 0,
+        "fallback_rate": round(outcomes["fallbacks"] / outcomes["flows"], 3) if outcomes["flows"] else 0,
+        "fallback_kinds": fallback_kinds,
+    }
+
+
+def print_report(report: Dict):
+    print("=" * 70)
+    print("REFLECTION LAYER LOAD TEST")
+    print("=" * 70)
+    print(f"Flows completed:  {report['flows']} ({report['errors']} errors) in {report['elapsed_s']}s")
+    print(f"Throughput:       {report['throughput_flows_per_s']} compare+reflect flows/s")
+    for endpoint, pcts in report["latency_ms"].items():
+        print(f"{endpoint:<8} latency: p50 {pcts['p50']}ms | p90 {pcts['p90']}ms | p99 {pcts['p99']}ms")
+    print(f"Cache hit ratio:  {report['cache_hit_ratio']:.1%}")
+    print(f"Fallback rate:    {report['fallback_rate']:.1%}")
+    if report["fallback_kinds"]:
+        kinds = ", ".join(f"{kind} {count}" for kind, count in sorted(report["fallback_kinds"].items()))
+        print(f"Fallback kinds:   {kinds}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test /decision/compare + /decision/reflect")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--requests", type=int, default=100, help="Total compare+reflect flows")
+    parser.add_argument("--distinct", type=int, default=20, help="Distinct decisions in the pool")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.url, args.users, args.requests, args.distinct, args.timeout))
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import pytest
+
+from app.engine import ai_reflector
+
+
+@pytest.fixture(autouse=True)
+def isolated_reflector_state(tmp_path, monkeypatch):
+    """Keep reflector cache, quota and pacing files out of the real .ai_cache; no pacing by default."""
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "RATE_LIMIT_PATH", tmp_path / "rate_limit.json")
+    monkeypatch.setattr(ai_reflector, "RPM_BUCKET_PATH", tmp_path / "minute_bucket.json")
+    monkeypatch.setattr(ai_reflector, "CIRCUIT_STATE_PATH", tmp_path / "circuit_breaker.json")
+    monkeypatch.setattr(ai_reflector, "RPM_LIMIT", 0)
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    """Every test computes its own compare/pareto results."""
+    from app.http_cache import result_cache
+    result_cache._entries.clear()
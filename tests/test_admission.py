@@ -0,0 +1,99 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app import admission
+from app.admission import AdmissionGate
+from app.engine.local_wisdom import LOCAL_WISDOM_SOURCE
+from app.main import app
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "options": [
+        {
+            "title": "Course",
+            "growth_criteria": [{"weight": 8, "impact": 8}],
+            "sustainability_criteria": [{"weight": 6, "impact": 7}],
+        }
+    ]
+}
+
+
+def test_gate_admits_queues_and_rejects_in_order():
+    async def scenario():
+        gate = AdmissionGate("test", max_concurrency=1, max_queue=1, queue_timeout=1.0)
+        assert await gate.acquire()
+        queued = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert not await gate.acquire()  # queue full: rejected without waiting
+        gate.release()
+        assert await queued  # the slot went to the waiter
+        assert gate.snapshot()["active"] == 1
+        gate.release()
+        return gate.snapshot()
+
+    stats = asyncio.run(scenario())
+    assert (stats["admitted"], stats["queued"], stats["active"], stats["waiting"]) == (2, 1, 0, 0)
+
+
+def test_gate_queue_deadline():
+    async def scenario():
+        gate = AdmissionGate("test", max_concurrency=1, max_queue=4, queue_timeout=0.02)
+        assert await gate.acquire()
+        assert not await gate.acquire()
+        gate.release()
+        return gate.snapshot()
+
+    stats = asyncio.run(scenario())
+    assert stats["timed_out"] == 1
+    assert (stats["active"], stats["waiting"]) == (0, 0)
+
+
+def test_overloaded_compare_is_shed_with_retry_after(monkeypatch):
+    gate = admission.gates["/decision/compare"]
+    monkeypatch.setattr(gate, "max_concurrency", 0)
+    monkeypatch.setattr(gate, "max_queue", 0)
+    shed = gate.stats["shed"]
+
+    response = client.post("/decision/compare", json=PAYLOAD)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(admission.RETRY_AFTER_SECONDS)
+    assert client.get("/stats").json()["admission_control"]["/decision/compare"]["shed"] == shed + 1
+
+
+def test_overloaded_reflect_degrades_to_local_wisdom(monkeypatch):
+    comparison = client.post("/decision/compare", json=PAYLOAD).json()
+    gate = admission.gates["/decision/reflect"]
+    monkeypatch.setattr(gate, "max_concurrency", 0)
+    monkeypatch.setattr(gate, "max_queue", 0)
+
+    response = client.post("/decision/reflect", json={"options": PAYLOAD["options"], "comparison_result": comparison})
+    assert response.status_code == 200
+    assert response.headers["x-admission"] == "degraded"
+    body = response.json()
+    assert body["provisional"] is True
+    assert body["source"] == LOCAL_WISDOM_SOURCE
+    assert any("Course" in step for step in body["action_plan"]) or "Course" in body["philosophical_advice"]
+    assert gate.degraded_active == 0
+
+
+def test_reflect_is_shed_past_the_degrade_cap(monkeypatch):
+    gate = admission.gates["/decision/reflect"]
+    monkeypatch.setattr(gate, "max_concurrency", 0)
+    monkeypatch.setattr(gate, "max_queue", 0)
+    monkeypatch.setattr(gate, "max_degraded", 0)
+    shed = gate.stats["shed"]
+
+    response = client.post("/decision/reflect", json={"options": PAYLOAD["options"], "comparison_result": {}})
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+    assert gate.stats["shed"] == shed + 1
+
+
+def test_admitted_requests_release_their_slot():
+    gate = admission.gates["/decision/compare"]
+    admitted = gate.stats["admitted"]
+    assert client.post("/decision/compare", json=PAYLOAD).status_code == 200
+    assert gate.stats["admitted"] == admitted + 1
+    assert gate.active == 0
@@ -0,0 +1,59 @@
+import random
+
+from fastapi.testclient import TestClient
+
+import app.analytics as analytics_module
+from app.analytics import DDSketch, LiveAnalytics
+from app.main import app
+from app.schemas import CompareResponse, OptionEvaluation
+
+client = TestClient(app)
+
+
+def _response(composite, zone="STEADY_EXECUTION"):
+    evaluation = OptionEvaluation(
+        title="A", growth_score=60, sustainability_score=70, tension_index=10,
+        tension_severity="LOW", zone=zone, zone_reason="", composite_score=composite,
+        risk_level="STRUCTURALLY_STABLE", triggered_messages=[], sensitivity_range=2.5,
+        stability_level="STABLE", sensitivity_breakdown="",
+    )
+    return CompareResponse(evaluations=[evaluation], recommended_option="A",
+                           decision_status="SINGLE_OPTION_CLASSIFIED", recommendation_reason="")
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    values = sorted(round(random.uniform(0.5, 100), 2) for _ in range(5000))
+    sketch = DDSketch()
+    for value in values:
+        sketch.add(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= exact * 0.01 + 0.01
+    assert len(sketch.bins) < 500
+
+
+def test_windows_expire_old_slots():
+    now = [1_000_000.0]
+    analytics = LiveAnalytics(clock=lambda: now[0])
+    analytics.record(_response(40, zone="TIME_BOX"))
+    now[0] += 120
+    analytics.record(_response(80))
+
+    windows = analytics.snapshot()["windows"]
+    assert windows["1m"]["decisions"] == 1
+    assert windows["1m"]["zones"] == {"STEADY_EXECUTION": 1}
+    assert windows["1h"]["decisions"] == 2
+    assert abs(windows["1h"]["percentiles"]["composite_score"]["p50"] - 40) <= 0.4
+    assert windows["1h"]["zones"] == {"TIME_BOX": 1, "STEADY_EXECUTION": 1}
+
+
+def test_compare_feeds_live_endpoint(monkeypatch):
+    monkeypatch.setattr(analytics_module, "_live_analytics", LiveAnalytics())
+    client.post("/decision/compare", json={"options": [{
+        "title": "Solo",
+        "growth_criteria": [{"name": "Learning", "weight": 8, "impact": 7}],
+        "sustainability_criteria": [{"name": "Rest", "weight": 6, "impact": 6}],
+    }]})
+    window = client.get("/analytics/live").json()["windows"]["1m"]
+    assert window["evaluations"] == 1
+    assert window["percentiles"]["growth_score"]["p99"] is not None
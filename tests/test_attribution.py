@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+
+from app.engine.attribution import attribute_criteria
+from app.engine.evaluator import normalize_score, composite_score
+from app.main import app
+from app.schemas import Criterion
+
+client = TestClient(app)
+
+
+def test_removal_matches_renormalization():
+    growth = [Criterion(weight=8, impact=9), Criterion(weight=3, impact=2), Criterion(weight=5, impact=6)]
+    sustainability = [Criterion(weight=6, impact=4), Criterion(weight=2, impact=8)]
+    rows = attribute_criteria(growth, sustainability, composite_score)
+    assert len(rows) == 5
+
+    g, s = normalize_score(growth), normalize_score(sustainability)
+    for row in rows:
+        criteria = growth if row["dimension"] == "growth" else sustainability
+        remaining = [c for i, c in enumerate(criteria) if i != row["criterion_index"]]
+        removed = normalize_score(remaining)
+        assert abs(row["removal_score_delta"] - (removed - (g if row["dimension"] == "growth" else s))) <= 0.02
+
+    swings = [row["perturbation_composite_swing"] for row in rows]
+    assert swings == sorted(swings, reverse=True)
+
+
+def test_sole_criterion_has_no_removal_delta():
+    rows = attribute_criteria([Criterion(weight=5, impact=5)], [Criterion(weight=5, impact=7)], composite_score)
+    assert all(row["removal_score_delta"] is None for row in rows)
+
+
+def test_attribution_is_opt_in():
+    option = {
+        "title": "Solo",
+        "growth_criteria": [{"weight": 8, "impact": 7}, {"weight": 2, "impact": 3}],
+        "sustainability_criteria": [{"weight": 6, "impact": 6}],
+    }
+    plain = client.post("/decision/compare", json={"options": [option]}).json()
+    assert plain["evaluations"][0]["criterion_attribution"] is None
+
+    detailed = client.post("/decision/compare", json={"options": [option], "include_attribution": True}).json()
+    attribution = detailed["evaluations"][0]["criterion_attribution"]
+    assert {(a["dimension"], a["criterion_index"]) for a in attribution} == {
+        ("growth", 0), ("growth", 1), ("sustainability", 0)
+    }
@@ -0,0 +1,95 @@
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, CircuitBreaker, ModelBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class QuotaBackend(ModelBackend):
+    name = "quota"
+    metered = False
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        raise RuntimeError("429 Resource exhausted. Please retry in 20s")
+
+
+def test_opens_after_threshold_and_probes_after_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=4, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 4
+    assert breaker.allow_request()          # single probe
+    assert not breaker.allow_request()      # others still short-circuit
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_doubles_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(cooldown=4, clock=clock)
+
+    breaker.record_failure(quota=True)
+    clock.now += 4
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_after() == 8
+
+
+def test_quota_error_uses_learned_retry_after():
+    clock = FakeClock()
+    breaker = CircuitBreaker(cooldown=4, clock=clock)
+
+    breaker.record_failure(quota=True, retry_after=20)
+
+    assert breaker.retry_after() == 20
+
+
+def test_open_state_is_shared_through_file(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "circuit_breaker.json"
+    first = CircuitBreaker(cooldown=4, state_path=path, clock=clock)
+    second = CircuitBreaker(cooldown=4, state_path=path, clock=clock)
+
+    first.record_failure(quota=True, retry_after=20)
+    assert not second.allow_request()
+    assert second.retry_after() == 20
+
+    clock.now += 20
+    assert second.allow_request()           # second worker probes
+    second.record_success()
+    assert first.allow_request()            # first worker adopts the close
+    assert first.state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_serves_fallback_without_sleeping(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "CIRCUIT_STATE_PATH", tmp_path / "circuit_breaker.json")
+    monkeypatch.setattr(ai_reflector, "NEGATIVE_CACHE_TTL_SECONDS", 0)  # Exercise the breaker alone
+    monkeypatch.setattr(ai_reflector.time, "sleep", lambda seconds: (_ for _ in ()).throw(AssertionError("slept")))
+    backend = QuotaBackend()
+    reflector = AbsolemReflector(backend=backend)
+    comparison = {"recommended_option": "Option A", "evaluations": []}
+
+    for _ in range(5):
+        assert reflector.get_reflection([], comparison) == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+
+    assert backend.calls == 1
+    assert reflector.breaker.state == CircuitBreaker.OPEN
+    assert reflector.breaker.stats["short_circuited"] == 4
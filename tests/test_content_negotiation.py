@@ -0,0 +1,77 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.content_negotiation import negotiate
+from app.main import app
+
+msgpack = pytest.importorskip("msgpack")
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "options": [
+        {
+            "title": "Course",
+            "growth_criteria": [{"weight": 8, "impact": 8}],
+            "sustainability_criteria": [{"weight": 6, "impact": 7}],
+        },
+        {
+            "title": "Internship",
+            "growth_criteria": [{"weight": 8, "impact": 4}],
+            "sustainability_criteria": [{"weight": 6, "impact": 4}],
+        },
+    ]
+}
+MSGPACK_HEADERS = {"Content-Type": "application/msgpack", "Accept": "application/msgpack"}
+
+
+def test_msgpack_round_trip_matches_json():
+    as_json = client.post("/decision/compare", json=PAYLOAD)
+    as_msgpack = client.post("/decision/compare", content=msgpack.packb(PAYLOAD), headers=MSGPACK_HEADERS)
+
+    assert as_msgpack.status_code == 200
+    assert as_msgpack.headers["content-type"] == "application/msgpack"
+    assert "Accept" in as_msgpack.headers["vary"]
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+
+
+def test_msgpack_body_is_validated_like_json():
+    invalid = {"options": [{**PAYLOAD["options"][0], "growth_criteria": [{"weight": 11, "impact": 5}]}]}
+    response = client.post("/decision/compare", content=msgpack.packb(invalid), headers=MSGPACK_HEADERS)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["body", "options"]
+
+    garbage = client.post("/decision/compare", content=b"\xc1", headers=MSGPACK_HEADERS)
+    assert garbage.status_code == 422
+
+
+def test_representations_have_distinct_etags():
+    json_etag = client.post("/decision/compare", json=PAYLOAD).headers["etag"]
+    msgpack_etag = client.post(
+        "/decision/compare", content=msgpack.packb(PAYLOAD), headers=MSGPACK_HEADERS
+    ).headers["etag"]
+    assert json_etag != msgpack_etag
+
+    repeat = client.post(
+        "/decision/compare",
+        content=msgpack.packb(PAYLOAD),
+        headers={**MSGPACK_HEADERS, "If-None-Match": msgpack_etag},
+    )
+    assert repeat.status_code == 304
+
+
+def test_reflect_accepts_msgpack():
+    comparison = client.post("/decision/compare", json=PAYLOAD).json()
+    body = {"options": PAYLOAD["options"], "comparison_result": comparison, "latency_budget_ms": 0}
+    response = client.post("/decision/reflect", content=msgpack.packb(body), headers=MSGPACK_HEADERS)
+    assert response.status_code == 200
+    assert "philosophical_advice" in msgpack.unpackb(response.content)
+
+
+def test_negotiate():
+    assert negotiate(None) == "application/json"
+    assert negotiate("application/json") == "application/json"
+    assert negotiate("application/msgpack") == "application/msgpack"
+    assert negotiate("application/json, application/msgpack;q=0.5") == "application/json"
+    assert negotiate("application/json;q=0.5, application/x-msgpack") == "application/msgpack"
+    assert negotiate("*/*") == "application/json"
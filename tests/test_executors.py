@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.executors import WorkloadExecutor
+from app.main import app
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "options": [
+        {
+            "title": "Course",
+            "growth_criteria": [{"weight": 8, "impact": 8}],
+            "sustainability_criteria": [{"weight": 6, "impact": 7}],
+        }
+    ]
+}
+
+
+def test_executor_runs_work_and_counts_outcomes():
+    executor = WorkloadExecutor("test", 2)
+
+    async def scenario():
+        assert await executor.run(sum, [1, 2, 3]) == 6
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        return [item async for item in executor.iterate(iter("abc"))]
+
+    assert asyncio.run(scenario()) == ["a", "b", "c"]
+    stats = executor.snapshot()
+    assert (stats["completed"], stats["failed"], stats["queue_depth"], stats["active"]) == (5, 1, 0, 0)
+    executor.shutdown()
+
+
+def test_iterate_closes_an_abandoned_generator():
+    executor = WorkloadExecutor("test", 1)
+    closed_on = []
+
+    def events():
+        try:
+            yield from range(10)
+        finally:
+            closed_on.append(threading.current_thread().name)
+
+    async def scenario():
+        stream = executor.iterate(events())
+        assert await stream.__anext__() == 0
+        await stream.aclose()  # what StreamingResponse does when the client disconnects
+
+    asyncio.run(scenario())
+    assert len(closed_on) == 1 and closed_on[0].startswith("test-worker")
+    executor.shutdown()
+
+
+def test_slow_reflections_do_not_block_compare(monkeypatch):
+    release = threading.Event()
+
+    def stuck_wisdom(**kwargs):
+        release.wait(5)
+        return {"action_plan": [], "philosophical_advice": "Later.", "source": "test"}
+
+    reflect_executor = WorkloadExecutor("reflect", 1)
+    monkeypatch.setattr(main, "reflect_executor", reflect_executor)
+    monkeypatch.setattr(main, "get_absolem_wisdom", stuck_wisdom)
+
+    body = {"options": PAYLOAD["options"], "comparison_result": {}}
+    reflections = [threading.Thread(target=client.post, args=("/decision/reflect",), kwargs={"json": body})
+                   for _ in range(3)]
+    for thread in reflections:
+        thread.start()
+    try:
+        deadline = time.monotonic() + 2
+        while reflect_executor.snapshot()["queue_depth"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert reflect_executor.snapshot()["active"] == 1
+        assert reflect_executor.snapshot()["queue_depth"] == 2
+
+        started = time.perf_counter()
+        assert client.post("/decision/compare", json=PAYLOAD).status_code == 200
+        assert time.perf_counter() - started < 1
+    finally:
+        release.set()
+        for thread in reflections:
+            thread.join()
+
+    assert reflect_executor.snapshot()["completed"] == 3
+    assert set(client.get("/stats").json()["executors"]) == {"compare", "pareto", "reflect"}
+    reflect_executor.shutdown()
+
+
+def test_app_serves_requests_after_a_second_lifespan():
+    reflection = {"options": PAYLOAD["options"], "comparison_result": {}}
+    pareto = {"options": PAYLOAD["options"]}
+    for _ in range(2):
+        with TestClient(app) as lifespan_client:
+            assert lifespan_client.post("/decision/compare", json=PAYLOAD).status_code == 200
+            assert lifespan_client.post("/decision/pareto", json=pareto).status_code == 200
+            assert lifespan_client.post("/decision/reflect", json=reflection).status_code == 200
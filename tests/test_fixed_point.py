@@ -0,0 +1,121 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.engine.fixed_point import round_div, tension_index_fixed
+from app.engine.scoring import FIXED_ENGINE, FLOAT_ENGINE, get_scoring_engine
+from app.policy import get_policy
+from app.schemas import Criterion
+
+client = TestClient(main.app)
+
+NUMERIC_FIELDS = ("growth_score", "sustainability_score", "tension_index", "composite_score", "sensitivity_range")
+
+# Classifier thresholds per numeric field: a one-centi-point difference across one of
+# these can legitimately change a label (the float side sat on a rounding tie or noise)
+THRESHOLDS = {
+    "growth_score": (35, 40, 50, 70, 75),
+    "sustainability_score": (35, 40, 50, 70),
+    "tension_index": (15, 30, 60),
+    "sensitivity_range": (8, 20),
+}
+
+
+def random_criteria(rng, fractional):
+    return [
+        Criterion(
+            weight=round(rng.uniform(0.1, 10), 2) if fractional else rng.randint(1, 10),
+            impact=rng.randint(0, 10)
+        )
+        for _ in range(rng.randint(1, 6))
+    ]
+
+
+def use_engine(monkeypatch, engine):
+    """Serve compare with the default policy's rules and the given scoring engine."""
+    policy = get_policy()._replace(scoring=engine)
+    monkeypatch.setattr(main, "get_policy", lambda profile=None: policy)
+
+
+def straddles_threshold(float_eval, fixed_eval):
+    for field, thresholds in THRESHOLDS.items():
+        a, b = float_eval[field], fixed_eval[field]
+        if a != b and any(min(a, b) <= t <= max(a, b) for t in thresholds):
+            return True
+    return False
+
+
+def test_round_div_is_half_to_even():
+    assert round_div(5, 2) == 2
+    assert round_div(7, 2) == 4
+    assert round_div(-5, 2) == -2
+    assert round_div(10, 3) == 3
+    assert round_div(11, 3) == 4
+
+
+def test_fixed_tension_is_exact():
+    # 70.1 - 40.1 is 29.999999999999993 in floats
+    assert tension_index_fixed(70.1, 40.1) == 30.0
+
+
+@pytest.mark.parametrize("fractional", [False, True])
+def test_kernels_conform_to_float_engine(fractional):
+    rng = random.Random(37)
+    for _ in range(3000):
+        criteria = random_criteria(rng, fractional)
+        growth = FLOAT_ENGINE.normalize(criteria)
+        fixed_growth = FIXED_ENGINE.normalize(criteria)
+        sustainability = FLOAT_ENGINE.normalize(random_criteria(rng, fractional))
+        float_sens = FLOAT_ENGINE.sensitivity(criteria)
+        fixed_sens = FIXED_ENGINE.sensitivity(criteria)
+
+        # Float weight perturbations (w * 1.2) can land a rounding tie either way
+        for key in ("weight_sensitivity", "impact_sensitivity", "combined_sensitivity"):
+            assert abs(float_sens[key] - fixed_sens[key]) <= 0.01 + 1e-9
+        if fractional:
+            assert abs(growth - fixed_growth) <= 0.01 + 1e-9
+        else:
+            assert growth == fixed_growth
+        assert FLOAT_ENGINE.composite(growth, sustainability) == FIXED_ENGINE.composite(growth, sustainability)
+
+
+@pytest.mark.parametrize("fractional", [False, True])
+def test_compare_conforms_to_float_engine(fractional, monkeypatch):
+    rng = random.Random(2024)
+    for _ in range(150):
+        payload = {"options": [
+            {
+                "title": f"Option {i}",
+                "growth_criteria": [c.model_dump() for c in random_criteria(rng, fractional)],
+                "sustainability_criteria": [c.model_dump() for c in random_criteria(rng, fractional)],
+            }
+            for i in range(rng.randint(1, 5))
+        ]}
+        use_engine(monkeypatch, FLOAT_ENGINE)
+        float_result = client.post("/decision/compare", json=payload).json()
+        use_engine(monkeypatch, FIXED_ENGINE)
+        fixed_result = client.post("/decision/compare", json=payload).json()
+
+        fixed_by_title = {e["title"]: e for e in fixed_result["evaluations"]}
+        labels_differ = False
+        for float_eval in float_result["evaluations"]:
+            fixed_eval = fixed_by_title[float_eval["title"]]
+            for field in NUMERIC_FIELDS:
+                assert abs(float_eval[field] - fixed_eval[field]) <= 0.01 + 1e-9
+            labels = {k: v for k, v in float_eval.items() if k not in NUMERIC_FIELDS}
+            if labels != {k: v for k, v in fixed_eval.items() if k not in NUMERIC_FIELDS}:
+                assert straddles_threshold(float_eval, fixed_eval), (float_eval, fixed_eval)
+                labels_differ = True
+
+        if not labels_differ and all(
+            e["composite_score"] == fixed_by_title[e["title"]]["composite_score"] for e in float_result["evaluations"]
+        ):
+            assert fixed_result["recommended_option"] == float_result["recommended_option"]
+            assert fixed_result["decision_status"] == float_result["decision_status"]
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        get_scoring_engine("quantum")
@@ -0,0 +1,43 @@
+from fastapi.testclient import TestClient
+
+from app.engine.global_sensitivity import sobol_indices
+from app.main import app
+from app.schemas import Criterion
+
+client = TestClient(app)
+
+
+def test_single_criteria_impacts_drive_everything():
+    result = sobol_indices([Criterion(weight=5, impact=5)], [Criterion(weight=5, impact=5)], sample_budget=20000)
+    by_input = {(i["dimension"], i["parameter"]): i for i in result["indices"]}
+    # A lone weight cancels out of the weighted mean
+    assert by_input[("growth", "weight")]["total_effect"] == 0
+    assert by_input[("sustainability", "weight")]["total_effect"] == 0
+    assert by_input[("growth", "impact")]["total_effect"] > 0.2
+    assert by_input[("sustainability", "impact")]["total_effect"] > 0.5
+    assert abs(sum(i["first_order"] for i in result["indices"]) - 1) < 0.1
+
+
+def test_budget_and_time_cap():
+    growth = [Criterion(weight=w, impact=w) for w in range(1, 9)]
+    sustainability = [Criterion(weight=5, impact=6), Criterion(weight=3, impact=9)]
+    result = sobol_indices(growth, sustainability, sample_budget=2000)
+    assert result["samples"] <= 2000 and not result["truncated"]
+
+    capped = sobol_indices(growth, sustainability, sample_budget=10_000_000, time_cap_seconds=0)
+    assert capped["truncated"] and capped["samples"] > 0
+
+
+def test_global_sensitivity_is_opt_in():
+    option = {
+        "title": "Solo",
+        "growth_criteria": [{"weight": 8, "impact": 7}, {"weight": 2, "impact": 3}],
+        "sustainability_criteria": [{"weight": 6, "impact": 6}],
+    }
+    plain = client.post("/decision/compare", json={"options": [option]}).json()
+    assert plain["evaluations"][0]["global_sensitivity"] is None
+
+    body = client.post("/decision/compare", json={"options": [option], "include_global_sensitivity": True}).json()
+    indices = body["evaluations"][0]["global_sensitivity"]["indices"]
+    assert len(indices) == 6
+    assert indices[0]["total_effect"] >= indices[-1]["total_effect"]
@@ -0,0 +1,89 @@
+from fastapi.testclient import TestClient
+
+import app.history as history_module
+import app.main as main
+from app.history import SQLiteHistoryStore
+from app.schemas import CompareRequest
+
+client = TestClient(main.app)
+
+
+def _request(first_title="Startup", second_title="Agency"):
+    return {
+        "options": [
+            {
+                "title": first_title,
+                "growth_criteria": [{"name": "Learning", "weight": 9, "impact": 9}],
+                "sustainability_criteria": [{"name": "Rest", "weight": 8, "impact": 8}],
+            },
+            {
+                "title": second_title,
+                "growth_criteria": [{"name": "Learning", "weight": 5, "impact": 3}],
+                "sustainability_criteria": [{"name": "Rest", "weight": 5, "impact": 2}],
+            },
+        ]
+    }
+
+
+def _store(tmp_path, monkeypatch):
+    store = SQLiteHistoryStore(str(tmp_path / "history.db"), flush_interval=0.01)
+    monkeypatch.setattr(history_module, "_history_store", store)
+    return store
+
+
+def test_compare_is_recorded_in_one_batch(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    for i in range(5):
+        assert client.post("/decision/compare", json=_request(f"Startup {i}")).status_code == 200
+    store.flush()
+
+    page = client.get("/decision/history").json()
+    assert [item["recommended_option"] for item in page["items"]] == [f"Startup {i}" for i in reversed(range(5))]
+    assert page["next_cursor"] is None
+    assert store.snapshot()["written"] == 5
+
+
+def test_keyset_pagination_and_filters(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    for i in range(7):
+        request = CompareRequest(**_request(f"Startup {i}"))
+        store.record(request, main._compare_options(request))
+    store.flush()
+
+    seen, cursor = [], None
+    while True:
+        page = store.query(limit=3, cursor=cursor)
+        seen += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == sorted(seen, reverse=True) and len(seen) == 7
+
+    assert len(store.query(recommended_option="Startup 3")["items"]) == 1
+    assert len(store.query(zone="AVOID")["items"]) == 7
+    assert store.query(zone="TIME_BOX")["items"] == []
+
+
+def test_history_disabled_returns_503(monkeypatch):
+    monkeypatch.setattr(history_module, "_history_store", None)
+    monkeypatch.setattr(history_module, "HISTORY_DB_PATH", "")
+    assert client.get("/decision/history").status_code == 503
+
+
+def test_store_keeps_writing_after_close_and_restart(tmp_path, monkeypatch):
+    store = _store(tmp_path, monkeypatch)
+    request = CompareRequest(**_request())
+    response = main._compare_options(request)
+
+    store.record(request, response)
+    store.close()  # app shutdown
+    store.start()  # next startup in the same process
+    store.record(request, response)
+    store.flush()
+    assert store.stats["written"] == 2
+
+    store.close()
+    store.record(request, response)  # restarts the writer on demand
+    store.flush()
+    assert store.stats["written"] == 3
+    store.close()
@@ -0,0 +1,81 @@
+from fastapi.testclient import TestClient
+
+from app.http_cache import etag_matches, result_cache
+from app.main import app
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "options": [
+        {
+            "title": "Course",
+            "growth_criteria": [{"weight": 8, "impact": 8}],
+            "sustainability_criteria": [{"weight": 6, "impact": 7}],
+        },
+        {
+            "title": "Internship",
+            "growth_criteria": [{"weight": 8, "impact": 4}],
+            "sustainability_criteria": [{"weight": 6, "impact": 4}],
+        },
+    ]
+}
+
+
+def test_etag_round_trip_returns_304():
+    first = client.post("/decision/compare", json=PAYLOAD)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    repeat = client.post("/decision/compare", json=PAYLOAD, headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+
+def test_etag_is_canonical_and_policy_aware():
+    reordered = {"options": [
+        {
+            "sustainability_criteria": [{"impact": 7, "weight": 6.0}],
+            "growth_criteria": [{"impact": 8, "weight": 8.0}],
+            "title": "Course",
+        },
+        PAYLOAD["options"][1],
+    ]}
+    etag = client.post("/decision/compare", json=PAYLOAD).headers["etag"]
+    assert client.post("/decision/compare", json=reordered).headers["etag"] == etag
+
+    profiled = client.post("/decision/compare", json={**PAYLOAD, "profile": "wellbeing_first"})
+    assert profiled.headers["etag"] != etag
+
+
+def test_repeat_request_is_served_from_result_cache():
+    client.post("/decision/compare", json=PAYLOAD)
+    hits = result_cache.stats["hits"]
+    second = client.post("/decision/compare", json=PAYLOAD)
+    assert second.status_code == 200
+    assert result_cache.stats["hits"] == hits + 1
+
+
+def test_if_none_match_parsing():
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_truncated_sensitivity_is_not_reused(monkeypatch):
+    from functools import partial
+
+    import app.main as main
+
+    monkeypatch.setattr(main, "sobol_indices", partial(main.sobol_indices, time_cap_seconds=0))
+    payload = {**PAYLOAD, "include_global_sensitivity": True}
+
+    first = client.post("/decision/compare", json=payload)
+    assert first.json()["evaluations"][0]["global_sensitivity"]["truncated"] is True
+    assert "etag" not in first.headers
+    assert first.headers["cache-control"] == "no-store"
+
+    hits = result_cache.stats["hits"]
+    client.post("/decision/compare", json=payload)
+    assert result_cache.stats["hits"] == hits
@@ -0,0 +1,81 @@
+import time
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend
+from app.engine.local_wisdom import LOCAL_WISDOM_SOURCE, generate_local_wisdom
+
+
+def comparison(zone="TIME_BOX", risk="SEVERE_BURNOUT_RISK", stability="FRAGILE", triggers=None):
+    return {
+        "recommended_option": "Startup Internship",
+        "decision_status": "CLEAR_WINNER",
+        "evaluations": [
+            {
+                "title": "Startup Internship",
+                "growth_score": 85.0,
+                "sustainability_score": 30.0,
+                "tension_severity": "HIGH",
+                "zone": zone,
+                "risk_level": risk,
+                "stability_level": stability,
+                "triggered_messages": triggers or [
+                    "⚠️ CRITICAL: Burnout trap detected - high growth demands exceed sustainability capacity."
+                ],
+            }
+        ],
+    }
+
+
+def test_wisdom_reflects_structure_and_is_deterministic():
+    wisdom = generate_local_wisdom(comparison())
+
+    assert wisdom == generate_local_wisdom(comparison())
+    assert wisdom["source"] == LOCAL_WISDOM_SOURCE
+    assert "'Startup Internship'" in wisdom["philosophical_advice"]
+    assert "exhaustion" in wisdom["philosophical_advice"]
+    assert 3 <= len(wisdom["action_plan"]) <= 4
+    assert wisdom["action_plan"][0].startswith("1. Time-box 'Startup Internship'")
+    assert any("overextended" in step for step in wisdom["action_plan"])
+
+
+def test_different_structures_get_different_wisdom():
+    calm = generate_local_wisdom(comparison("EXECUTE_FULLY", "STRUCTURALLY_STABLE", "STABLE", triggers=[]))
+
+    assert calm != generate_local_wisdom(comparison())
+    assert len(calm["action_plan"]) >= 3
+
+
+def test_empty_result_still_produces_a_plan():
+    wisdom = generate_local_wisdom({"recommended_option": "NONE_VIABLE", "evaluations": []})
+
+    assert wisdom["philosophical_advice"]
+    assert len(wisdom["action_plan"]) == 3
+
+
+def test_reflector_serves_local_wisdom_instead_of_static_fallback():
+    reflector = AbsolemReflector(api_key="", local_wisdom=True)
+
+    result = reflector.get_reflection([], comparison())
+
+    assert result["source"] == LOCAL_WISDOM_SOURCE
+    assert reflector.usage_stats["local_wisdom_served"] == 1
+
+
+class SlowBackend(ModelBackend):
+    name = "slow"
+    metered = False
+
+    def generate(self, prompt):
+        time.sleep(0.2)
+        return "WISDOM:\nUpgraded.\n\nSTEPS:\n1. Go"
+
+
+def test_local_first_answers_instantly_and_upgrades_later():
+    reflector = AbsolemReflector(backend=SlowBackend(), local_first=True)
+
+    first = reflector.get_reflection_within([], comparison(), budget_seconds=5)
+    assert first["source"] == LOCAL_WISDOM_SOURCE
+    assert first["provisional"] is True
+
+    time.sleep(0.4)
+    assert reflector.get_reflection_within([], comparison(), budget_seconds=5)["philosophical_advice"] == "Upgraded."
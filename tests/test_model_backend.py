@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend
+from loadtest.fake_gemini import FakeModelConfig, create_app
+
+
+class CannedBackend(ModelBackend):
+    name = "canned"
+    metered = False
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt):
+        self.prompts.append(prompt)
+        return "WISDOM:\nRest is part of the work.\n\nSTEPS:\n1. Sleep\n2. Plan\n3. Review"
+
+
+def test_injected_backend_is_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "RATE_LIMIT_PATH", tmp_path / "rate_limit.json")
+    backend = CannedBackend()
+    reflector = AbsolemReflector(backend=backend)
+
+    result = reflector.get_reflection([], {"recommended_option": "Option A", "evaluations": []})
+
+    assert reflector.gemini_available
+    assert result["philosophical_advice"] == "Rest is part of the work."
+    assert "Option A" in backend.prompts[0]
+    # Unmetered backends never touch the daily counter
+    assert not (tmp_path / "rate_limit.json").exists()
+
+
+def test_fake_server_renders_template():
+    client = TestClient(create_app(FakeModelConfig(latency_median=0, latency_sigma=0, seed=1)))
+
+    response = client.post("/generate", json={"prompt": "A student is considering: 'Thesis'"})
+
+    assert response.status_code == 200
+    assert "WISDOM:" in response.json()["text"]
+    assert "'Thesis'" in response.json()["text"]
+
+
+def test_fake_server_injects_429():
+    client = TestClient(create_app(FakeModelConfig(latency_median=0, latency_sigma=0, error_rate=1.0)))
+
+    assert client.post("/generate", json={"prompt": "x"}).status_code == 429
+    assert client.get("/stats").json() == {"requests": 1, "rate_limited": 1}
+
+
+def test_backend_must_implement_generate():
+    class Incomplete(ModelBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
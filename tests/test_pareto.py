@@ -0,0 +1,62 @@
+import random
+
+from fastapi.testclient import TestClient
+
+from app.engine.pareto import pareto_fronts, dominance_counts
+from app.main import app
+
+client = TestClient(app)
+
+
+def _dominates(a, b):
+    return a[0] >= b[0] and a[1] >= b[1] and a != b
+
+
+def _brute_force_fronts(points):
+    fronts, remaining, layer = [None] * len(points), set(range(len(points))), 0
+    while remaining:
+        current = {i for i in remaining if not any(_dominates(points[j], points[i]) for j in remaining)}
+        for i in current:
+            fronts[i] = layer
+        remaining -= current
+        layer += 1
+    return fronts
+
+
+def test_sweep_matches_brute_force_with_ties():
+    rng = random.Random(7)
+    for _ in range(50):
+        points = [(rng.randint(0, 10) * 10.0, rng.randint(0, 10) * 10.0) for _ in range(rng.randint(1, 60))]
+        assert pareto_fronts(points) == _brute_force_fronts(points)
+        dominates, dominated_by = dominance_counts(points)
+        assert dominates == [sum(_dominates(p, q) for q in points) for p in points]
+        assert dominated_by == [sum(_dominates(q, p) for q in points) for p in points]
+
+
+def _option(title, growth_impact, sustainability_impact):
+    return {
+        "title": title,
+        "growth_criteria": [{"name": "Learning", "weight": 5, "impact": growth_impact}],
+        "sustainability_criteria": [{"name": "Rest", "weight": 5, "impact": sustainability_impact}],
+    }
+
+
+def test_pareto_endpoint_returns_front_per_option():
+    options = [_option("Balanced", 7, 7), _option("Grind", 9, 3), _option("Drift", 3, 9), _option("Worse", 6, 6)]
+    response = client.post("/decision/pareto", json={"options": options})
+    assert response.status_code == 200
+    body = response.json()
+
+    assert set(body["frontier"]) == {"Balanced", "Grind", "Drift"}
+    assert body["fronts"][1] == ["Worse"]
+    worse = next(e for e in body["evaluations"] if e["title"] == "Worse")
+    assert worse["front_index"] == 1
+    assert worse["dominated_by_count"] == 1
+    assert body["evaluations"][0]["title"] == "Balanced"  # front 0, highest composite
+
+
+def test_pareto_accepts_large_option_sets():
+    options = [_option(f"Plan {i}", i % 11, (i * 7) % 11) for i in range(1000)]
+    response = client.post("/decision/pareto", json={"options": options})
+    assert response.status_code == 200
+    assert len(response.json()["evaluations"]) == 1000
@@ -0,0 +1,83 @@
+import json
+
+from fastapi.testclient import TestClient
+
+import app.policy as policy_module
+from app.engine.evaluator import composite_score, CompositePenalties
+from app.engine.fixed_point import composite_score_fixed
+from app.main import app
+from app.policy import _ProfileCache
+
+client = TestClient(app)
+
+def _criteria(impacts):
+    return [{"weight": 5, "impact": impact} for impact in impacts]
+
+
+# Grind: growth 100 / sustainability 40; Balance: 53 / 53. Ten criteria per dimension
+# keep every single-criterion rank flip above the close-competition margin.
+GRIND_VS_BALANCE = {
+    "options": [
+        {
+            "title": "Grind",
+            "growth_criteria": _criteria([10] * 10),
+            "sustainability_criteria": _criteria([4] * 10),
+        },
+        {
+            "title": "Balance",
+            "growth_criteria": _criteria([5] * 7 + [6] * 3),
+            "sustainability_criteria": _criteria([5] * 7 + [6] * 3),
+        },
+    ]
+}
+
+
+def test_fixed_point_composite_honours_penalties():
+    penalties = CompositePenalties(0.2, 0.15, 0.04)
+    for growth, sustainability in ((90, 30), (30, 90), (55.55, 55.55), (72.25, 40.5)):
+        expected = composite_score(growth, sustainability, penalties)
+        assert abs(composite_score_fixed(growth, sustainability, penalties) - expected) <= 0.01
+
+
+def test_profile_changes_recommendation():
+    default = client.post("/decision/compare", json=GRIND_VS_BALANCE).json()
+    growth = client.post("/decision/compare", json={**GRIND_VS_BALANCE, "profile": "growth_focused"}).json()
+    assert default["recommended_option"] == "Balance"
+    assert growth["recommended_option"] == "Grind"
+
+    by_header = client.post(
+        "/decision/compare", json=GRIND_VS_BALANCE, headers={"X-Decision-Profile": "growth_focused"}
+    ).json()
+    assert by_header["recommended_option"] == "Grind"
+
+
+def test_unknown_profile_is_rejected():
+    response = client.post("/decision/compare", json={**GRIND_VS_BALANCE, "profile": "nope"})
+    assert response.status_code == 400
+
+
+def test_engines_are_compiled_once_and_evicted_lru(tmp_path, monkeypatch):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps({"profiles": {
+        name: {"rules": {"close_competition_margin": margin}}
+        for name, margin in (("a", 0.5), ("b", 2.0), ("c", 3.0))
+    }}), encoding="utf-8")
+    monkeypatch.setattr(policy_module, "PROFILES_PATH", path)
+    cache = _ProfileCache(maxsize=2)
+
+    first = cache.get("a")
+    assert first.rules.close_competition_margin == 0.5
+    assert cache.get("a") is first
+    cache.get("b")
+    cache.get("c")  # evicts "a"
+    assert cache.stats == {"hits": 1, "compiles": 3, "evictions": 1}
+    assert cache.snapshot()["cached"] == ["b", "c"]
+
+
+def test_invalid_penalties_are_refused(tmp_path, monkeypatch):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps({"profiles": {"reckless": {"composite_penalties": {"growth_dominant": 0.6}}}}))
+    monkeypatch.setattr(policy_module, "PROFILES_PATH", path)
+    monkeypatch.setattr(policy_module, "_cache", _ProfileCache(maxsize=4))
+    response = client.post("/decision/compare", json={**GRIND_VS_BALANCE, "profile": "reckless"})
+    assert response.status_code == 500
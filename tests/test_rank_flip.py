@@ -0,0 +1,73 @@
+from app.engine.evaluator import normalize_score, composite_score
+from app.engine.rank_flip import rank_flip
+from app.engine.comparator import detect_close_competition
+from app.schemas import Criterion, DecisionOption, OptionEvaluation
+
+
+def _option(title, growth, sustainability):
+    return DecisionOption(
+        title=title,
+        growth_criteria=[Criterion(weight=w, impact=i) for w, i in growth],
+        sustainability_criteria=[Criterion(weight=w, impact=i) for w, i in sustainability],
+    )
+
+
+def _composite(option):
+    def exact(criteria):
+        total_weight = sum(c.weight for c in criteria)
+        return 10 * sum(c.weight * c.impact for c in criteria) / total_weight if total_weight else 0
+    return composite_score(exact(option.growth_criteria), exact(option.sustainability_criteria))
+
+
+def test_flip_delta_produces_a_tie():
+    leader = _option("Leader", [(8, 8), (4, 6)], [(6, 7), (3, 5)])
+    challenger = _option("Challenger", [(7, 7), (5, 5)], [(6, 6), (2, 8)])
+    flip = rank_flip(leader, challenger)
+    assert 0 < flip.margin < 10
+
+    changed = leader if flip.option == "Leader" else challenger
+    criteria = getattr(changed, f"{flip.dimension}_criteria")
+    criterion = criteria[flip.criterion_index]
+    setattr(criterion, flip.parameter, getattr(criterion, flip.parameter) + flip.delta)
+    assert abs(_composite(leader) - _composite(challenger)) < 0.01
+
+
+def test_flip_margin_is_no_larger_than_brute_force_sweep():
+    leader = _option("Leader", [(9, 8), (2, 3)], [(5, 7)])
+    challenger = _option("Challenger", [(6, 7), (4, 6)], [(5, 6), (5, 7)])
+    flip = rank_flip(leader, challenger)
+
+    best = float("inf")
+    for option, sign in ((challenger, 1), (leader, -1)):
+        for criteria in (option.growth_criteria, option.sustainability_criteria):
+            for criterion in criteria:
+                for parameter in ("weight", "impact"):
+                    original = getattr(criterion, parameter)
+                    for step in range(1, 1001):
+                        for direction in (1, -1):
+                            value = original + direction * step / 100
+                            if not 0 <= value <= 10:
+                                continue
+                            setattr(criterion, parameter, value)
+                            if _composite(challenger) >= _composite(leader):
+                                best = min(best, step / 100)
+                            setattr(criterion, parameter, original)
+    assert flip.margin <= best + 1e-9
+    assert best - flip.margin < 0.011
+
+
+def test_close_competition_uses_flip_margin():
+    options = [_option("A", [(8, 8)], [(8, 8)]), _option("B", [(8, 8)], [(8, 8)])]
+    evaluations = [
+        OptionEvaluation(
+            title=o.title, growth_score=80, sustainability_score=80, tension_index=0,
+            tension_severity="LOW", zone="EXECUTE_FULLY", zone_reason="", composite_score=80,
+            risk_level="STRUCTURALLY_STABLE", triggered_messages=[], sensitivity_range=0,
+            stability_level="STABLE",
+        )
+        for o in options
+    ]
+    assert detect_close_competition(evaluations, options)
+
+    options[1] = _option("B", [(8, 4)], [(8, 4)])
+    assert not detect_close_competition(evaluations, options)
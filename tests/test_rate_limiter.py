@@ -0,0 +1,79 @@
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def limiter(tmp_path, clock, **kwargs):
+    return TokenBucketLimiter(state_path=tmp_path / "bucket.json", clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_paces_calls_at_rate(tmp_path):
+    clock = FakeClock()
+    bucket = limiter(tmp_path, clock, rate_per_minute=15, burst=1, max_wait=5)
+
+    assert bucket.acquire()
+    assert clock.now == 1000.0          # first call uses the burst token
+    assert bucket.acquire()
+    assert clock.now == 1004.0          # next slot is 4s later at 15 RPM
+    assert bucket.snapshot()["queued"] == 1
+
+
+def test_rejects_when_predicted_wait_exceeds_deadline(tmp_path):
+    clock = FakeClock()
+    bucket = limiter(tmp_path, clock, rate_per_minute=15, burst=1, max_wait=2)
+
+    assert bucket.acquire()
+    assert not bucket.acquire()         # would need 4s
+    assert clock.now == 1000.0
+    assert bucket.snapshot()["rejected"] == 1
+
+
+def test_bucket_state_is_shared_through_file(tmp_path):
+    clock = FakeClock()
+    first = limiter(tmp_path, clock, rate_per_minute=15, burst=1, max_wait=0)
+    second = limiter(tmp_path, clock, rate_per_minute=15, burst=1, max_wait=0)
+
+    assert first.acquire()
+    assert not second.acquire()
+    clock.now += 4
+    assert second.acquire()
+
+
+class UnmeteredBackend(ModelBackend):
+    name = "unmetered"
+    metered = False
+
+    def generate(self, prompt):
+        return "WISDOM:\nSlow down.\n\nSTEPS:\n1. Breathe"
+
+
+def test_unmetered_backend_is_still_paced(monkeypatch):
+    monkeypatch.setattr(ai_reflector, "RPM_LIMIT", 15)
+    assert AbsolemReflector(backend=UnmeteredBackend()).limiter is not None
+
+    monkeypatch.setattr(ai_reflector, "RPM_LIMIT", 0)
+    assert AbsolemReflector(backend=UnmeteredBackend()).limiter is None
+
+
+def test_spare_token_leaves_reserve_for_users(tmp_path):
+    clock = FakeClock()
+    strict = limiter(tmp_path, clock, rate_per_minute=15, burst=1, max_wait=5)
+    assert not strict.acquire_spare(keep=1)     # the only token stays with users
+    assert strict.acquire()
+    assert clock.now == 1000.0
+
+    roomy = limiter(tmp_path / "roomy", clock, rate_per_minute=15, burst=2, max_wait=0)
+    assert roomy.acquire_spare(keep=1)
+    assert not roomy.acquire_spare(keep=1)
+    assert roomy.acquire()                      # reserved token still there
+    assert roomy.snapshot()["spare_declined"] == 1
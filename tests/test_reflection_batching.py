@@ -0,0 +1,65 @@
+import re
+import threading
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend, ReflectionBatcher
+
+
+class BatchEchoBackend(ModelBackend):
+    """Answers every DECISION in the prompt with its own block."""
+    name = "batch-echo"
+    metered = False
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt):
+        self.prompts.append(prompt)
+        titles = re.findall(r"DECISION \d+: '(.+?)'", prompt)
+        return "\n".join(
+            f"=== DECISION {i} ===\nWISDOM:\nAbout {title}.\n\nSTEPS:\n1. Rest\n2. Plan\n3. Review\n"
+            for i, title in enumerate(titles, start=1)
+        )
+
+
+def comparison(title):
+    return {"recommended_option": title, "evaluations": []}
+
+
+def test_concurrent_requests_share_one_model_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    backend = BatchEchoBackend()
+    reflector = AbsolemReflector(backend=backend)
+    reflector.batcher = ReflectionBatcher(reflector, window_ms=200, max_items=4)
+    titles = ["Thesis", "Internship", "Research"]
+    results = {}
+
+    def ask(title):
+        results[title] = reflector.get_reflection([], comparison(title))
+
+    threads = [threading.Thread(target=ask, args=(title,)) for title in titles]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(backend.prompts) == 1
+    for title in titles:
+        assert results[title]["philosophical_advice"] == f"About {title}."
+    # Each decision is cached separately
+    assert reflector.get_reflection([], comparison("Research"))["philosophical_advice"] == "About Research."
+    assert reflector.batcher.stats["max_batch_size"] == 3
+
+
+def test_missing_block_falls_back_for_that_request_only():
+    reflector = AbsolemReflector(api_key="")
+    items = [
+        ai_reflector._BatchItem([], title, {}, title, title)
+        for title in ("A", "B")
+    ]
+    reply = "=== DECISION 1 ===\nWISDOM:\nOnly A.\nSTEPS:\n1. Rest\n"
+
+    results = reflector._parse_batch_response(reply, items)
+
+    assert results[0]["philosophical_advice"] == "Only A."
+    assert results[1] is None
@@ -0,0 +1,78 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend
+from app.main import app
+
+client = TestClient(app)
+
+
+class SlowBackend(ModelBackend):
+    name = "slow"
+    metered = False
+
+    def generate(self, prompt):
+        time.sleep(0.3)
+        return "WISDOM:\nPatience is rest too.\n\nSTEPS:\n1. Wait\n2. Breathe\n3. Continue"
+
+
+def test_budget_returns_provisional_and_finishes_in_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(backend=SlowBackend())
+    comparison = {"recommended_option": "Option A", "evaluations": []}
+
+    first = reflector.get_reflection_within([], comparison, budget_seconds=0.05)
+    assert first["provisional"] is True
+    assert reflector.usage_stats["provisional_responses"] == 1
+
+    time.sleep(0.5)
+    second = reflector.get_reflection_within([], comparison, budget_seconds=0.05)
+    assert second["philosophical_advice"] == "Patience is rest too."
+    assert reflector.usage_stats["cached_calls"] == 1
+
+
+def test_cache_hit_is_served_without_worker_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(backend=SlowBackend())
+    comparison = {"recommended_option": "Option A", "evaluations": []}
+    _, _, material, key = reflector._decision_key(comparison)
+    cached = {"action_plan": ["1. Rest"], "philosophical_advice": "Already known.", "source": "test"}
+    reflector._save_to_cache(key, cached, material)
+
+    assert reflector.get_reflection_within([], comparison, budget_seconds=0.05) == cached
+    assert reflector._executor is None
+
+
+def test_reflect_endpoint_budget_from_field_and_header(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "_reflector_instance", AbsolemReflector(backend=SlowBackend()))
+    payload = {
+        "options": [],
+        "comparison_result": {"recommended_option": "Option A", "evaluations": []},
+    }
+
+    response = client.post("/decision/reflect", json=payload, headers={"X-Reflection-Budget-Ms": "20"})
+    assert response.status_code == 200
+    assert response.json()["provisional"] is True
+
+    # The body field wins over the header; 0 waits for the model
+    time.sleep(0.5)
+    payload["comparison_result"]["recommended_option"] = "Option B"
+    response = client.post(
+        "/decision/reflect", json={**payload, "latency_budget_ms": 0}, headers={"X-Reflection-Budget-Ms": "20"}
+    )
+    assert response.status_code == 200
+    assert response.json()["provisional"] is False
+    assert response.json()["philosophical_advice"] == "Patience is rest too."
+
+
+def test_reflect_rejects_negative_budget():
+    payload = {
+        "options": [],
+        "comparison_result": {"recommended_option": "Option A", "evaluations": []},
+        "latency_budget_ms": -1,
+    }
+
+    assert client.post("/decision/reflect", json=payload).status_code == 422
@@ -0,0 +1,233 @@
+import json
+import threading
+import time
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector
+
+
+def comparison(recommended="Option A", growth=71.2, sustainability=64.0, reason="Highest composite score"):
+    return {
+        "recommended_option": recommended,
+        "decision_status": "CLEAR_WINNER",
+        "recommendation_reason": reason,
+        "evaluations": [
+            {
+                "title": "Option A",
+                "growth_score": growth,
+                "sustainability_score": sustainability,
+                "zone": "STEADY_EXECUTION",
+                "risk_level": "STRUCTURALLY_STABLE",
+            },
+            {
+                "title": "Option B",
+                "growth_score": 40.0,
+                "sustainability_score": 80.0,
+                "zone": "LIGHT_RECOVERY",
+                "risk_level": "STRUCTURALLY_STABLE",
+            },
+        ],
+    }
+
+
+def key_for(reflector, result):
+    best_option, analysis_data = reflector._extract_decision(result)
+    material = reflector._get_key_material(best_option, analysis_data)
+    return reflector._get_cache_key(material), material
+
+
+def test_key_changes_with_recommended_option_and_scores():
+    reflector = AbsolemReflector(api_key="")
+    base, _ = key_for(reflector, comparison())
+
+    assert key_for(reflector, comparison(recommended="Option B"))[0] != base
+    assert key_for(reflector, comparison(growth=71.4))[0] != base
+
+
+def test_key_ignores_fields_outside_prompt():
+    reflector = AbsolemReflector(api_key="")
+    base, _ = key_for(reflector, comparison())
+
+    assert key_for(reflector, comparison(reason="Something else"))[0] == base
+
+
+def test_key_is_versioned():
+    reflector = AbsolemReflector(api_key="")
+    key, _ = key_for(reflector, comparison())
+    assert key.startswith(f"v{ai_reflector.CACHE_KEY_VERSION}-")
+
+
+def test_cache_rejects_mismatched_key_material(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(api_key="")
+    key, material = key_for(reflector, comparison())
+    response = {"action_plan": ["1. Rest"], "philosophical_advice": "Stay whole.", "source": "test"}
+
+    reflector._save_to_cache(key, response, material)
+
+    assert reflector._load_from_cache(key, material) == response
+    assert reflector._load_from_cache(key, material + " ") is None
+
+
+def save_reflection(reflector, result, response):
+    best_option, analysis_data = reflector._extract_decision(result)
+    key, material = key_for(reflector, result)
+    reflector._save_to_cache(key, response, material)
+    reflector._index_approximate(key, best_option, analysis_data)
+
+
+def test_approximate_cache_serves_near_match(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(api_key="", approximate_cache=True, approximate_tolerance=0.5)
+    response = {"action_plan": ["1. Rest"], "philosophical_advice": "Stay whole.", "source": "test"}
+    save_reflection(reflector, comparison(growth=71.2), response)
+
+    assert reflector.get_reflection([], comparison(growth=71.4)) == response
+    assert reflector.usage_stats["approximate_hits"] == 1
+
+
+def test_approximate_cache_respects_tolerance_and_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    response = {"action_plan": ["1. Rest"], "philosophical_advice": "Stay whole.", "source": "test"}
+    save_reflection(AbsolemReflector(api_key=""), comparison(growth=71.2), response)
+
+    strict = AbsolemReflector(api_key="", approximate_cache=True, approximate_tolerance=0.1)
+    assert strict.get_reflection([], comparison(growth=71.4)) == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+
+    disabled = AbsolemReflector(api_key="", approximate_cache=False)
+    assert disabled.get_reflection([], comparison(growth=71.4)) == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+    assert disabled.usage_stats["approximate_hits"] == 0
+
+
+GEMINI_REPLY = "WISDOM:\nGrow without losing yourself.\n\nSTEPS:\n1. Rest\n2. Reflect\n3. Repeat"
+
+
+def gemini_reflector(tmp_path, monkeypatch, **kwargs):
+    """Reflector wired to a fake Gemini call, with cache and rate limit files under tmp_path."""
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "RATE_LIMIT_PATH", tmp_path / "rate_limit.json")
+    monkeypatch.setattr(ai_reflector, "_call_gemini_with_retry", lambda model, prompt, **kwargs: GEMINI_REPLY)
+    reflector = AbsolemReflector(api_key="", **kwargs)
+    reflector.gemini_available = True
+    reflector.model = None
+    return reflector
+
+
+def test_prewarm_populates_cache(tmp_path, monkeypatch):
+    reflector = gemini_reflector(tmp_path, monkeypatch)
+
+    assert reflector.prewarm([], comparison())
+    for _ in range(100):
+        if reflector.usage_stats["prewarm_completed"]:
+            break
+        time.sleep(0.01)
+
+    result = reflector.get_reflection([], comparison())
+    assert result["philosophical_advice"] == "Grow without losing yourself."
+    assert reflector.usage_stats["cached_calls"] == 1
+    assert not reflector.prewarm([], comparison())  # Already warm
+
+
+class FailingBackend(ai_reflector.ModelBackend):
+    name = "failing"
+    metered = False
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        raise RuntimeError("500 internal error")
+
+
+def test_negative_cache_skips_recently_failed_decision(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    backend = FailingBackend()
+    reflector = AbsolemReflector(backend=backend)
+
+    for _ in range(3):
+        assert reflector.get_reflection([], comparison()) == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+
+    assert backend.calls == 1
+    assert reflector.usage_stats["negative_hits"] == 2
+
+
+def test_stale_entry_is_served_and_refreshed(tmp_path, monkeypatch):
+    reflector = gemini_reflector(tmp_path, monkeypatch)
+    key, material = key_for(reflector, comparison())
+    old = {"action_plan": ["1. Old"], "philosophical_advice": "Old wisdom.", "source": "test"}
+    reflector._save_to_cache(key, old, material)
+    entry = json.loads((tmp_path / f"{key}.json").read_text())
+    entry["timestamp"] = "2000-01-01T00:00:00"
+    (tmp_path / f"{key}.json").write_text(json.dumps(entry))
+    monkeypatch.setattr(ai_reflector, "STALE_MAX_HOURS", 24 * 365 * 100)
+
+    assert reflector.get_reflection([], comparison()) == old
+    assert reflector.usage_stats["stale_served"] == 1
+    for _ in range(100):
+        if reflector._load_from_cache(key, material):
+            break
+        time.sleep(0.01)
+
+    assert reflector.get_reflection([], comparison())["philosophical_advice"] == "Grow without losing yourself."
+
+
+def test_refused_call_is_not_remembered_as_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    backend = FailingBackend()
+    reflector = AbsolemReflector(backend=backend)
+    reflector.breaker.record_failure(quota=True)  # Circuit open: the call is declined locally
+
+    assert reflector.get_reflection([], comparison()) == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+
+    assert backend.calls == 0
+    assert reflector._negative_cache == {}
+    assert reflector.usage_stats["failed_calls"] == 0
+
+
+def test_stale_entry_of_failed_decision_is_not_refreshed(tmp_path, monkeypatch):
+    reflector = gemini_reflector(tmp_path, monkeypatch)
+    key, material = key_for(reflector, comparison())
+    old = {"action_plan": ["1. Old"], "philosophical_advice": "Old wisdom.", "source": "test"}
+    reflector._save_to_cache(key, old, material)
+    entry = json.loads((tmp_path / f"{key}.json").read_text())
+    entry["timestamp"] = "2000-01-01T00:00:00"
+    (tmp_path / f"{key}.json").write_text(json.dumps(entry))
+    monkeypatch.setattr(ai_reflector, "STALE_MAX_HOURS", 24 * 365 * 100)
+    reflector._remember_failure(key)
+
+    assert reflector.get_reflection([], comparison()) == old
+    assert reflector.usage_stats["revalidations"] == 0
+
+
+class GatedBackend(ai_reflector.ModelBackend):
+    name = "gated"
+    metered = False
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def generate(self, prompt):
+        self.calls += 1
+        self.release.wait(5)
+        return GEMINI_REPLY
+
+
+def test_user_request_joins_inflight_prewarm(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    backend = GatedBackend()
+    reflector = AbsolemReflector(backend=backend)
+    _, _, _, key = reflector._decision_key(comparison())
+
+    assert reflector.prewarm([], comparison())
+    for _ in range(100):
+        if reflector._is_inflight(key):
+            break
+        time.sleep(0.01)
+
+    threading.Timer(0.1, backend.release.set).start()
+    result = reflector.get_reflection([], comparison())
+
+    assert result["philosophical_advice"] == "Grow without losing yourself."
+    assert backend.calls == 1
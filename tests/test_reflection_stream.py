@@ -0,0 +1,102 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.engine import ai_reflector
+from app.engine.ai_reflector import AbsolemReflector, ModelBackend, _ReflectionStreamParser
+from app.main import app
+
+client = TestClient(app)
+
+REPLY_CHUNKS = ["WISDOM:\nGrow without ", "losing yourself.\n\nSTE", "PS:\n1. Rest\n2. Ref", "lect\n3. Repeat"]
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_parser_emits_sections_as_they_complete():
+    parser = _ReflectionStreamParser()
+
+    assert parser.feed(REPLY_CHUNKS[0]) == []
+    assert parser.feed(REPLY_CHUNKS[1]) == []
+    assert parser.feed(REPLY_CHUNKS[2]) == [
+        ("wisdom", {"philosophical_advice": "Grow without losing yourself."}),
+        ("step", {"index": 0, "text": "1. Rest"}),
+    ]
+    assert parser.feed(REPLY_CHUNKS[3]) == [("step", {"index": 1, "text": "2. Reflect"})]
+
+
+def test_stream_reflection_caches_final_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(ai_reflector, "RATE_LIMIT_PATH", tmp_path / "rate_limit.json")
+    monkeypatch.setattr(ai_reflector, "_stream_gemini", lambda model, prompt: iter(REPLY_CHUNKS))
+    reflector = AbsolemReflector(api_key="")
+    reflector.gemini_available = True
+    reflector.model = None
+    comparison = {"recommended_option": "Option A", "evaluations": []}
+
+    events = list(reflector.stream_reflection([], comparison))
+
+    assert [e for e, _ in events].count("token") == len(REPLY_CHUNKS)
+    assert [d["text"] for e, d in events if e == "step"] == ["1. Rest", "2. Reflect", "3. Repeat"]
+    assert events[-1] == ("done", reflector.get_reflection([], comparison))
+    assert reflector.usage_stats["cached_calls"] == 1
+
+
+def test_stream_endpoint_replays_fallback():
+    payload = {
+        "options": [],
+        "comparison_result": {"recommended_option": "Option A", "evaluations": []}
+    }
+
+    response = client.post("/decision/reflect/stream", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_sse(response.text)
+    assert events[0][0] == "wisdom"
+    assert events[-1][0] == "done"
+    assert "action_plan" in events[-1][1]
+
+
+class BrokenStreamBackend(ModelBackend):
+    name = "broken-stream"
+    metered = False
+
+    def generate(self, prompt):
+        return "".join(REPLY_CHUNKS)
+
+    def stream(self, prompt):
+        yield REPLY_CHUNKS[0]
+        raise RuntimeError("500 stream reset")
+
+
+def test_failure_after_first_token_sends_error_then_done(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(backend=BrokenStreamBackend())
+
+    events = list(reflector.stream_reflection([], {"recommended_option": "Option A", "evaluations": []}))
+
+    assert [e for e, _ in events] == ["token", "error", "done"]
+    assert events[-1][1] == ai_reflector.ABSOLEM_FALLBACK_WISDOM
+    assert reflector.usage_stats["failed_calls"] == 1
+
+
+def test_client_disconnect_still_records_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_reflector, "CACHE_DIR", tmp_path)
+    reflector = AbsolemReflector(backend=BrokenStreamBackend())
+    recorded = []
+    monkeypatch.setattr(reflector, "_record_call", lambda: recorded.append(True))
+    reflector.breaker.state = ai_reflector.CircuitBreaker.HALF_OPEN
+
+    stream = reflector.stream_reflection([], {"recommended_option": "Option A", "evaluations": []})
+    assert next(stream)[0] == "token"
+    stream.close()  # What StreamingResponse does when the client goes away
+
+    assert recorded == [True]
+    assert reflector.breaker.state == ai_reflector.CircuitBreaker.CLOSED
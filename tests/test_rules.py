@@ -0,0 +1,123 @@
+import json
+import os
+import random
+import time
+
+import pytest
+
+import app.config as config
+from app.config import RulesError, compile_rules, load_rules
+
+
+# The hard-coded classification this rules file replaced
+def reference_zone(growth, sustainability):
+    if growth >= 70 and sustainability >= 70:
+        return "EXECUTE_FULLY"
+    if growth >= 70 and sustainability < 50:
+        return "TIME_BOX"
+    if growth < 50 and sustainability >= 70:
+        return "LIGHT_RECOVERY"
+    if growth < 40 and sustainability < 40:
+        return "AVOID"
+    return "STEADY_EXECUTION"
+
+
+def reference_tension(tension):
+    if tension <= 15:
+        return "LOW"
+    elif tension <= 30:
+        return "MODERATE"
+    elif tension <= 60:
+        return "HIGH"
+    return "CRITICAL"
+
+
+def reference_risk(zone, severity, growth, sustainability):
+    if zone == "AVOID":
+        return "STRUCTURALLY_UNSALVAGEABLE"
+    if severity == "CRITICAL" and growth > sustainability:
+        return "SEVERE_BURNOUT_RISK"
+    if severity == "HIGH" and growth > sustainability and growth / max(sustainability, 1) >= 2.0:
+        return "SEVERE_BURNOUT_RISK"
+    if severity == "CRITICAL":
+        return "SEVERE_IMBALANCE"
+    if sustainability < 40:
+        return "SUSTAINABILITY_DEFICIT"
+    if severity == "HIGH" and sustainability > growth and sustainability / max(growth, 1) >= 1.5:
+        return "SEVERE_STAGNATION_RISK"
+    if growth < 40 and zone != "STEADY_EXECUTION":
+        return "GROWTH_STAGNATION_RISK"
+    return "STRUCTURALLY_STABLE"
+
+
+def reference_trigger_count(growth, sustainability, severity, zone):
+    count, sustainability_flagged, growth_flagged = 0, False, False
+    if (growth >= 75 and sustainability < 35) or (growth >= 70 and sustainability < 50):
+        count, sustainability_flagged, growth_flagged = 1, True, True
+    if not sustainability_flagged and sustainability < 40:
+        count, sustainability_flagged = count + 1, True
+    if not sustainability_flagged and not growth_flagged and severity in ["HIGH", "CRITICAL"]:
+        count += 1
+    if zone == "AVOID":
+        count += 1
+    if not growth_flagged and growth < 40:
+        count += 1
+    return count
+
+
+def test_compiled_default_rules_match_reference():
+    rules = load_rules()
+    rng = random.Random(3)
+    grid = [0, 1, 10, 15, 20, 30, 35, 40, 45, 50, 60, 70, 75, 80, 100]
+    pairs = [(g, s) for g in grid for s in grid]
+    pairs += [(round(rng.uniform(0, 100), 2), round(rng.uniform(0, 100), 2)) for _ in range(5000)]
+    for growth, sustainability in pairs:
+        tension = abs(growth - sustainability)
+        zone, _ = rules.classify_zone(growth, sustainability)
+        severity = rules.classify_tension(tension)
+        assert zone == reference_zone(growth, sustainability)
+        assert severity == reference_tension(tension)
+        assert rules.classify_risk(zone, severity, growth, sustainability) == reference_risk(
+            zone, severity, growth, sustainability
+        )
+        triggers = rules.generate_triggers(growth, sustainability, tension, severity, zone)
+        assert len(triggers) == reference_trigger_count(growth, sustainability, severity, zone)
+
+
+def _rules_document():
+    with open(config.RULES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_rules_without_default_are_rejected():
+    document = _rules_document()
+    document["zones"] = document["zones"][:-1]
+    with pytest.raises(RulesError):
+        compile_rules(document)
+
+
+def test_changed_file_is_hot_reloaded(tmp_path, monkeypatch):
+    path = tmp_path / "rules.json"
+    document = _rules_document()
+    path.write_text(json.dumps(document), encoding="utf-8")
+    monkeypatch.setattr(config, "RULES_PATH", path)
+    monkeypatch.setattr(config, "RULES_RELOAD_SECONDS", 0.01)
+    monkeypatch.setattr(config, "_active_rules", None)
+    monkeypatch.setattr(config, "_rules_mtime", None)
+    monkeypatch.setattr(config, "_next_check", 0.0)
+
+    assert config.get_rules().classify_zone(65, 65)[0] == "STEADY_EXECUTION"
+
+    document["version"] = "lenient"
+    document["zones"][0]["when"] = {"growth": [">=", 60], "sustainability": [">=", 60]}
+    path.write_text(json.dumps(document), encoding="utf-8")
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    time.sleep(0.02)
+    assert config.get_rules().version == "lenient"
+    assert config.get_rules().classify_zone(65, 65)[0] == "EXECUTE_FULLY"
+
+    # A broken file keeps the last good rules
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, (time.time() + 10, time.time() + 10))
+    time.sleep(0.02)
+    assert config.get_rules().version == "lenient"
@@ -35,4 +35,39 @@ def test_missing_growth():
     }
 
     response = client.post("/decision/compare", json=payload)
-    assert response.status_code == 422
\ No newline at end of file
+    assert response.status_code == 422
+
+VERBOSE_OPTION = {
+    "title": "Course",
+    "growth_criteria": [{"weight": 8, "impact": 8}, {"weight": 2.5, "impact": 3}],
+    "sustainability_criteria": [{"weight": 6, "impact": 7}],
+}
+
+
+def test_positional_criteria_match_verbose():
+    pairs = {**VERBOSE_OPTION, "growth_criteria": [[8, 8], [2.5, 3]], "sustainability_criteria": [[6, 7]]}
+    columns = {
+        **VERBOSE_OPTION,
+        "growth_criteria": {"weights": [8, 2.5], "impacts": [8, 3]},
+        "sustainability_criteria": {"weights": [6], "impacts": [7]},
+    }
+    responses = [client.post("/decision/compare", json={"options": [o]}) for o in (VERBOSE_OPTION, pairs, columns)]
+
+    assert all(r.status_code == 200 for r in responses)
+    assert responses[0].json() == responses[1].json() == responses[2].json()
+    # Same canonical request, so the same ETag whichever encoding was sent
+    assert len({r.headers["etag"] for r in responses}) == 1
+
+
+def test_positional_criteria_are_validated():
+    invalid = [
+        [[15, 5]],                                 # weight out of range
+        [[5, 11]],                                 # impact out of range
+        [[5, 5, 5]],                               # not a pair
+        {"weights": [5, 5], "impacts": [5]},       # ragged columns
+        {"weights": [0], "impacts": [5]},          # all-zero weights
+    ]
+    for criteria in invalid:
+        payload = {"options": [{**VERBOSE_OPTION, "growth_criteria": criteria}]}
+        response = client.post("/decision/compare", json=payload)
+        assert response.status_code == 422, criteria